@@ -0,0 +1 @@
+"""Benchmarks of building, exporting, and serializing Interchange objects, run with asv."""
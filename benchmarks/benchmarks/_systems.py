@@ -0,0 +1,194 @@
+"""
+Synthetic systems used by the benchmarks.
+
+Everything here is generated offline from SMILES and a regular lattice, so the benchmarks do not
+depend on packmol, network access, or data files. The coordinates are not equilibrated and are
+only meant to be physically reasonable enough for every exporter to accept them.
+"""
+
+import functools
+import math
+
+import numpy
+from openff.toolkit import ForceField, Molecule, Quantity, Topology
+
+from openff.interchange import Interchange
+
+SMALL_MOLECULE_FORCE_FIELD = "openff-2.0.0.offxml"
+FOUR_SITE_WATER_FORCE_FIELD = "tip4p_fb.offxml"
+
+# ibuprofen
+LIGAND_SMILES = "CC(C)Cc1ccc(cc1)[C@@H](C)C(=O)O"
+
+# a short polyethylene chain
+POLYMER_SMILES = "C" * 30
+N_POLYMER_CHAINS = 200
+
+# roughly the spacing of water molecules at 1 g/mL
+WATER_SPACING = 3.1
+
+# (force field, topology builder) of each system, by name
+SYSTEMS = {
+    "ligand": ("small_molecule", lambda: _solvated_ligand(n_waters=0)),
+    "ligand_1k_water": ("small_molecule", lambda: _solvated_ligand(n_waters=1_000)),
+    "ligand_10k_water": ("small_molecule", lambda: _solvated_ligand(n_waters=10_000)),
+    "ligand_100k_water": ("small_molecule", lambda: _solvated_ligand(n_waters=100_000)),
+    "tip4p_10k_water": ("four_site_water", lambda: _water_box(n_waters=10_000)),
+    "polymer_melt": ("small_molecule", lambda: _polymer_melt(n_chains=N_POLYMER_CHAINS)),
+}
+
+
+@functools.cache
+def _force_field(name: str) -> ForceField:
+    return {
+        "small_molecule": lambda: ForceField(SMALL_MOLECULE_FORCE_FIELD),
+        "four_site_water": lambda: ForceField(FOUR_SITE_WATER_FORCE_FIELD),
+    }[name]()
+
+
+@functools.cache
+def _water() -> Molecule:
+    water = Molecule.from_mapped_smiles("[H:2][O:1][H:3]")
+
+    angle = numpy.deg2rad(104.52)
+
+    water.add_conformer(
+        Quantity(
+            [
+                [0.0, 0.0, 0.0],
+                [0.9572, 0.0, 0.0],
+                [0.9572 * math.cos(angle), 0.9572 * math.sin(angle), 0.0],
+            ],
+            "angstrom",
+        ),
+    )
+
+    return water
+
+
+@functools.cache
+def _charged_molecule(smiles: str) -> Molecule:
+    """Return a molecule with one conformer and cheap (Gasteiger) partial charges."""
+    molecule = Molecule.from_smiles(smiles)
+    molecule.generate_conformers(n_conformers=1)
+    molecule.assign_partial_charges("gasteiger")
+
+    return molecule
+
+
+def _centered_coordinates(molecule: Molecule) -> numpy.ndarray:
+    coordinates = molecule.conformers[0].m_as("angstrom")
+
+    return coordinates - coordinates.mean(axis=0)
+
+
+def _lattice(n_per_side: int, spacing: float) -> numpy.ndarray:
+    """Return the centers of a cubic lattice, in Angstrom."""
+    indices = numpy.indices((n_per_side,) * 3).reshape(3, -1).T
+
+    return (indices + 0.5) * spacing
+
+
+def _to_topology(
+    molecules: list[Molecule],
+    centers: numpy.ndarray,
+    box_length: float,
+) -> Topology:
+    topology = Topology.from_molecules(molecules)
+
+    topology.set_positions(
+        Quantity(
+            numpy.concatenate(
+                [_centered_coordinates(molecule) + center for molecule, center in zip(molecules, centers)],
+            ),
+            "angstrom",
+        ),
+    )
+
+    topology.box_vectors = Quantity(numpy.eye(3) * box_length, "angstrom")
+
+    return topology
+
+
+def _solvated_ligand(n_waters: int) -> Topology:
+    """Return a ligand at the center of a cubic box of `n_waters` waters."""
+    ligand = _charged_molecule(LIGAND_SMILES)
+    water = _water()
+
+    ligand_radius = numpy.linalg.norm(_centered_coordinates(ligand), axis=1).max()
+
+    # pad the lattice to make up for the sites removed around the ligand
+    n_excluded = math.ceil((2 * (ligand_radius + WATER_SPACING) / WATER_SPACING) ** 3)
+    n_per_side = max(
+        math.ceil((n_waters + n_excluded) ** (1 / 3)),
+        math.ceil(2 * (ligand_radius + WATER_SPACING) / WATER_SPACING),
+    )
+
+    box_length = n_per_side * WATER_SPACING
+    box_center = numpy.full(3, box_length / 2)
+
+    sites = _lattice(n_per_side, WATER_SPACING)
+    sites = sites[numpy.linalg.norm(sites - box_center, axis=1) > ligand_radius + WATER_SPACING][:n_waters]
+
+    assert len(sites) == n_waters
+
+    return _to_topology(
+        [ligand, *[water] * n_waters],
+        numpy.vstack([box_center, sites]),
+        box_length,
+    )
+
+
+def _water_box(n_waters: int) -> Topology:
+    """Return a cubic box of `n_waters` waters."""
+    n_per_side = math.ceil(n_waters ** (1 / 3))
+
+    return _to_topology(
+        [_water()] * n_waters,
+        _lattice(n_per_side, WATER_SPACING)[:n_waters],
+        n_per_side * WATER_SPACING,
+    )
+
+
+def _polymer_melt(n_chains: int) -> Topology:
+    """Return `n_chains` copies of a polymer chain, each in its own lattice cell."""
+    polymer = _charged_molecule(POLYMER_SMILES)
+
+    coordinates = _centered_coordinates(polymer)
+    spacing = float(numpy.ptp(coordinates, axis=0).max()) + 2.0
+
+    n_per_side = math.ceil(n_chains ** (1 / 3))
+
+    return _to_topology(
+        [polymer] * n_chains,
+        _lattice(n_per_side, spacing)[:n_chains],
+        n_per_side * spacing,
+    )
+
+
+@functools.cache
+def get_topology(name: str) -> Topology:
+    """Return the (cached) topology of the named system."""
+    return SYSTEMS[name][1]()
+
+
+def get_force_field(name: str) -> ForceField:
+    """Return the (cached) force field used to parametrize the named system."""
+    return _force_field(SYSTEMS[name][0])
+
+
+def get_charged_molecules(name: str) -> list[Molecule]:
+    """Return the molecules whose partial charges should be used as-is in the named system."""
+    if SYSTEMS[name][0] != "small_molecule":
+        return []
+
+    return [_charged_molecule(smiles) for smiles in (LIGAND_SMILES, POLYMER_SMILES)]
+
+
+def build(name: str) -> Interchange:
+    """Parametrize the named system."""
+    return Interchange.from_smirnoff(
+        get_force_field(name),
+        get_topology(name),
+        charge_from_molecules=get_charged_molecules(name),
+    )
@@ -0,0 +1,22 @@
+"""Benchmarks of parametrizing systems with SMIRNOFF force fields."""
+
+from typing import ClassVar
+
+from ._systems import SYSTEMS, build, get_charged_molecules, get_force_field, get_topology
+
+
+class FromSMIRNOFF:
+    params: ClassVar[list[str]] = list(SYSTEMS)
+    param_names: ClassVar[list[str]] = ["system"]
+
+    def setup(self, name):
+        # generate (and cache) the inputs so that only parametrization is measured
+        get_topology(name)
+        get_force_field(name)
+        get_charged_molecules(name)
+
+    def time_from_smirnoff(self, name):
+        build(name)
+
+    def peakmem_from_smirnoff(self, name):
+        build(name)
@@ -0,0 +1,93 @@
+"""Benchmarks of exporting Interchange objects to engines and of other whole-system operations."""
+
+import pathlib
+import tempfile
+from typing import ClassVar
+
+from openff.interchange.interop._virtual_sites import get_positions_with_virtual_sites
+
+from ._systems import SYSTEMS, build
+
+# systems that include virtual sites, which some exporters do not support
+VIRTUAL_SITE_SYSTEMS = [name for name, (force_field, _) in SYSTEMS.items() if force_field == "four_site_water"]
+
+
+class _Export:
+    params: ClassVar[list[str]] = list(SYSTEMS)
+    param_names: ClassVar[list[str]] = ["system"]
+
+    supports_virtual_sites = True
+
+    def setup(self, name):
+        if name in VIRTUAL_SITE_SYSTEMS and not self.supports_virtual_sites:
+            # asv reports benchmarks whose setup raises NotImplementedError as skipped
+            raise NotImplementedError
+
+        self.interchange = build(name)
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.prefix = str(pathlib.Path(self.directory.name) / "out")
+
+    def teardown(self, name):
+        self.directory.cleanup()
+
+
+class OpenMM(_Export):
+    def time_to_openmm_system(self, name):
+        self.interchange.to_openmm_system()
+
+    def peakmem_to_openmm_system(self, name):
+        self.interchange.to_openmm_system()
+
+
+class GROMACS(_Export):
+    def time_to_gromacs(self, name):
+        self.interchange.to_gromacs(self.prefix)
+
+    def peakmem_to_gromacs(self, name):
+        self.interchange.to_gromacs(self.prefix)
+
+
+class Amber(_Export):
+    supports_virtual_sites = False
+
+    def time_to_prmtop(self, name):
+        self.interchange.to_prmtop(f"{self.prefix}.prmtop")
+
+    def peakmem_to_prmtop(self, name):
+        self.interchange.to_prmtop(f"{self.prefix}.prmtop")
+
+
+class LAMMPS(_Export):
+    supports_virtual_sites = False
+
+    def time_to_lammps(self, name):
+        self.interchange.to_lammps(self.prefix)
+
+    def peakmem_to_lammps(self, name):
+        self.interchange.to_lammps(self.prefix)
+
+
+class Combine(_Export):
+    supports_virtual_sites = False
+
+    def setup(self, name):
+        super().setup(name)
+
+        self.other = build("ligand")
+
+    def time_combine(self, name):
+        self.interchange.combine(self.other)
+
+    def peakmem_combine(self, name):
+        self.interchange.combine(self.other)
+
+
+class VirtualSitePositions(_Export):
+    params: ClassVar[list[str]] = VIRTUAL_SITE_SYSTEMS
+
+    def time_get_positions_with_virtual_sites(self, name):
+        get_positions_with_virtual_sites(self.interchange)
+
+    def peakmem_get_positions_with_virtual_sites(self, name):
+        get_positions_with_virtual_sites(self.interchange)
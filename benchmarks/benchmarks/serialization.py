@@ -0,0 +1,28 @@
+"""Benchmarks of serializing Interchange objects to and from JSON."""
+
+from typing import ClassVar
+
+from openff.interchange import Interchange
+
+from ._systems import SYSTEMS, build
+
+
+class JSON:
+    params: ClassVar[list[str]] = list(SYSTEMS)
+    param_names: ClassVar[list[str]] = ["system"]
+
+    def setup(self, name):
+        self.interchange = build(name)
+        self.json = self.interchange.model_dump_json()
+
+    def time_model_dump_json(self, name):
+        self.interchange.model_dump_json()
+
+    def peakmem_model_dump_json(self, name):
+        self.interchange.model_dump_json()
+
+    def time_model_validate_json(self, name):
+        Interchange.model_validate_json(self.json)
+
+    def peakmem_model_validate_json(self, name):
+        Interchange.model_validate_json(self.json)
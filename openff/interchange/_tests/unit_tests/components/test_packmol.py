@@ -15,10 +15,12 @@ from openff.interchange.components._packmol import (
     RHOMBIC_DODECAHEDRON,
     RHOMBIC_DODECAHEDRON_XYHEX,
     UNIT_CUBE,
+    PackmolCache,
     _compute_brick_from_box_vectors,
     _find_packmol,
     _scale_box,
     pack_box,
+    pack_boxes,
     solvate_topology,
     solvate_topology_nonwater,
 )
@@ -207,6 +209,59 @@ class TestPackmolWrapper:
         assert topology.n_bonds == 20
         assert topology.n_molecules == 10
 
+    def test_packmol_seed(self, molecules):
+        def pack(seed):
+            return pack_box(
+                molecules,
+                [10],
+                target_density=1.0 * unit.grams / unit.milliliter,
+                seed=seed,
+            ).get_positions()
+
+        assert numpy.allclose(pack(1), pack(1))
+        assert not numpy.allclose(pack(1), pack(2))
+
+    def test_packmol_cache(self, molecules, tmp_path, monkeypatch):
+        def pack():
+            return pack_box(
+                molecules,
+                [10],
+                target_density=1.0 * unit.grams / unit.milliliter,
+                seed=1,
+            ).get_positions()
+
+        with PackmolCache(tmp_path):
+            first = pack()
+
+            assert len([*tmp_path.glob("molecules/*.pdb")]) == 1
+            assert len([*tmp_path.glob("packings/*.npy")]) == 1
+
+            def fail(*args, **kwargs):
+                raise AssertionError("packmol should not run on a cache hit")
+
+            monkeypatch.setattr("openff.interchange.components._packmol._run_packmol", fail)
+
+            assert numpy.allclose(first, pack())
+
+        with pytest.raises(AssertionError, match="cache hit"):
+            pack()
+
+    @pytest.mark.parametrize("n_workers", [None, 2])
+    def test_pack_boxes(self, molecules, n_workers):
+        jobs = [
+            {"molecules": molecules, "number_of_copies": [n], "target_density": 1.0 * unit.grams / unit.milliliter}
+            for n in (5, 10, 15)
+        ]
+        jobs.append(
+            {"molecules": molecules, "number_of_copies": [10], "box_vectors": 0.1 * numpy.identity(3) * unit.angstrom},
+        )
+
+        results = dict(pack_boxes(jobs, n_workers=n_workers, max_retries=1))
+
+        assert sorted(results) == [0, 1, 2, 3]
+        assert [results[index].n_molecules for index in range(3)] == [5, 10, 15]
+        assert isinstance(results[3], PACKMOLRuntimeError)
+
     def test_packmol_ions(self):
         molecules = [
             Molecule.from_smiles("[Na+]"),
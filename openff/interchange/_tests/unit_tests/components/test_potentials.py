@@ -4,6 +4,8 @@ from openff.toolkit.typing.engines.smirnoff.parameters import BondHandler
 
 from openff.interchange.components.potentials import (
     Collection,
+    ColumnarKeyMap,
+    ColumnarPotentials,
     Potential,
     WrappedPotential,
 )
@@ -87,3 +89,169 @@ class TestPotentialSerialization:
         potential = Potential.model_validate_json(dummy_potential.model_dump_json())
 
         assert potential.parameters == dummy_potential.parameters
+
+
+class TestColumnarStorage:
+    def test_compact_keeps_contents(self, sage, ethanol):
+        interchange = sage.create_interchange(ethanol.to_topology())
+
+        for name in ["Bonds", "Angles", "ProperTorsions", "ImproperTorsions", "vdW"]:
+            collection = interchange[name]
+
+            key_map = dict(collection.key_map)
+            potentials = dict(collection.potentials)
+
+            collection.compact()
+
+            assert isinstance(collection.key_map, ColumnarKeyMap)
+            assert isinstance(collection.potentials, ColumnarPotentials)
+
+            assert collection.key_map == key_map
+            assert collection.potentials == potentials
+
+            for key, potential_key in key_map.items():
+                assert collection.key_map[key] == potential_key
+                assert collection[key] == potentials[potential_key]
+
+    def test_arrays(self, sage, ethanol):
+        bonds = sage.create_interchange(ethanol.to_topology())["Bonds"]
+
+        expected = {
+            key.atom_indices: bonds.potentials[potential_key].parameters["k"]
+            for key, potential_key in bonds.key_map.items()
+        }
+
+        compacted = bonds.model_copy(deep=True)
+        compacted.compact()
+
+        for collection in [bonds, compacted]:
+            atom_indices, potential_indices, potential_keys = collection._get_arrays()
+            parameters = collection._get_parameter_arrays(potential_keys)
+
+            assert atom_indices.shape == (len(expected), 2)
+
+            for row, indices in enumerate(atom_indices.tolist()):
+                assert parameters["k"][potential_indices[row]] == expected[tuple(indices)]
+
+        assert compacted._get_arrays()[0] is compacted.key_map.atom_indices
+
+    def test_edit_compacted_potential_in_place(self, sage, ethanol):
+        bonds = sage.create_interchange(ethanol.to_topology())["Bonds"]
+        bonds.compact()
+
+        potential_key = next(iter(bonds.potentials))
+
+        bonds.potentials[potential_key].parameters["k"] = Quantity(1.0, "kcal/mol/angstrom**2")
+
+        assert bonds.potentials[potential_key].parameters["k"] == Quantity(1.0, "kcal/mol/angstrom**2")
+
+        with pytest.raises(ValueError, match="Cannot add"):
+            bonds.potentials[potential_key].parameters["foo"] = Quantity(1.0, "angstrom")
+
+        with pytest.raises(ValueError, match="Cannot remove"):
+            del bonds.potentials[potential_key].parameters["k"]
+
+    def test_modify_compacted(self, sage, ethanol):
+        bonds = sage.create_interchange(ethanol.to_topology())["Bonds"]
+        bonds.compact()
+
+        key = next(iter(bonds.key_map))
+        potential_key = bonds.key_map[key]
+
+        bonds.potentials[potential_key] = Potential(
+            parameters={"k": Quantity(1.0, "kcal/mol/angstrom**2"), "length": Quantity(1.0, "angstrom")},
+        )
+
+        assert bonds[key].parameters["k"] == Quantity(1.0, "kcal/mol/angstrom**2")
+
+        del bonds.key_map[key]
+
+        assert key not in bonds.key_map
+
+        bonds.key_map[key] = potential_key
+
+        assert bonds.key_map[key] == potential_key
+
+    def test_json_roundtrip(self, sage, ethanol):
+        interchange = sage.create_interchange(ethanol.to_topology())
+
+        reference = interchange["Angles"].model_copy(deep=True)
+
+        interchange["Angles"].compact()
+
+        roundtripped = type(reference).model_validate_json(interchange["Angles"].model_dump_json())
+
+        assert roundtripped.key_map == reference.key_map
+        assert roundtripped.potentials == reference.potentials
+
+
+class TestRevision:
+    @pytest.mark.parametrize("compact", [False, True])
+    def test_changes_counted(self, sage, ethanol, compact):
+        bonds = sage.create_interchange(ethanol.to_topology())["Bonds"]
+
+        if compact:
+            bonds.compact()
+
+        key = next(iter(bonds.key_map))
+        potential_key = bonds.key_map[key]
+
+        revisions = [bonds._revision.value]
+
+        bonds.potentials[potential_key].parameters["k"] = Quantity(1.0, "kcal/mol/angstrom**2")
+        revisions.append(bonds._revision.value)
+
+        bonds.potentials[potential_key] = Potential(
+            parameters={"k": Quantity(2.0, "kcal/mol/angstrom**2"), "length": Quantity(1.0, "angstrom")},
+        )
+        revisions.append(bonds._revision.value)
+
+        del bonds.key_map[key]
+        revisions.append(bonds._revision.value)
+
+        bonds.key_map[key] = potential_key
+        revisions.append(bonds._revision.value)
+
+        bonds.expression = "k * (r - length) ** 2"
+        revisions.append(bonds._revision.value)
+
+        assert revisions == sorted(set(revisions))
+
+        # reading does not count as a change
+        assert bonds[key].parameters["k"] == Quantity(2.0, "kcal/mol/angstrom**2")
+        assert bonds._revision.value == revisions[-1]
+
+    def test_parameters_of_inserted_potential_counted(self, sage, ethanol):
+        bonds = sage.create_interchange(ethanol.to_topology())["Bonds"]
+
+        potential = Potential(
+            parameters={"k": Quantity(1.0, "kcal/mol/angstrom**2"), "length": Quantity(1.0, "angstrom")},
+        )
+
+        bonds.potentials[next(iter(bonds.potentials))] = potential
+
+        revision = bonds._revision.value
+
+        potential.parameters["k"] *= 2
+
+        assert bonds._revision.value > revision
+
+        revision = bonds._revision.value
+
+        potential.parameters = {"k": Quantity(1.0, "kcal/mol/angstrom**2"), "length": Quantity(2.0, "angstrom")}
+        potential.parameters["length"] *= 2
+
+        assert bonds._revision.value > revision + 1
+
+    def test_copies_counted_separately(self, sage, ethanol):
+        bonds = sage.create_interchange(ethanol.to_topology())["Bonds"]
+        copied = bonds.model_copy(deep=True)
+
+        assert copied == bonds
+
+        revision = bonds._revision.value
+
+        next(iter(copied.potentials.values())).parameters["k"] *= 2
+
+        assert copied._revision.value > revision
+        assert bonds._revision.value == revision
@@ -8,6 +8,7 @@ from openff.interchange.components.toolkit import (
     _check_electrostatics_handlers,
     _combine_topologies,
     _get_14_pairs,
+    _get_bonded_pairs,
     _get_num_h_bonds,
     _lookup_virtual_site_parameter,
     _simple_topology_from_openmm,
@@ -55,6 +56,38 @@ class TestToolkitUtils:
         assert len([*_get_14_pairs(mol)]) == num_pairs
         assert len([*_get_14_pairs(mol.to_topology())]) == num_pairs
 
+    @pytest.mark.parametrize(
+        "smiles",
+        ["C#C", "CCO", "C1=CC=CC=C1", "C=1=C=C1", "C=1=C=C=C1", "C=1(Cl)-C(Cl)=C1", "C=1=C(Cl)C(=C=1)Cl"],
+    )
+    def test_get_bonded_pairs(self, smiles):
+        mol = Molecule.from_smiles(smiles)
+
+        pairs = _get_bonded_pairs(mol)
+
+        assert {*map(tuple, pairs.pairs_14.tolist())} == {
+            tuple(sorted(mol.atom_index(atom) for atom in pair)) for pair in _get_14_pairs(mol)
+        }
+        assert {*map(tuple, pairs.pairs_12.tolist())} == {
+            tuple(sorted((bond.atom1_index, bond.atom2_index))) for bond in mol.bonds
+        }
+
+        for pair in pairs.pairs_13.tolist():
+            assert not mol.get_atom_by_index(pair[0]).is_bonded_to(mol.get_atom_by_index(pair[1]))
+
+    def test_get_bonded_pairs_replicated(self):
+        ethanol = Molecule.from_smiles("CCO")
+        reordered = ethanol.remap({index: ethanol.n_atoms - 1 - index for index in range(ethanol.n_atoms)})
+
+        topology = Topology.from_molecules([ethanol, reordered, ethanol])
+
+        pairs = _get_bonded_pairs(topology)
+
+        assert len(pairs.pairs_14) == 3 * len(_get_bonded_pairs(ethanol).pairs_14)
+        assert {*map(tuple, pairs.pairs_14.tolist())} == {
+            tuple(sorted(topology.atom_index(atom) for atom in pair)) for pair in _get_14_pairs(topology)
+        }
+
     def test_check_electrostatics_handlers(self, tip3p):
         tip3p.deregister_parameter_handler("Electrostatics")
 
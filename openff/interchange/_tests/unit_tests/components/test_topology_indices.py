@@ -0,0 +1,44 @@
+from openff.toolkit import Topology
+
+from openff.interchange.interop.common import _build_particle_map
+
+
+class TestTopologyIndices:
+    def test_water_dimer(self, tip4p, water):
+        interchange = tip4p.create_interchange(Topology.from_molecules([water, water]))
+
+        indices = interchange._get_topology_indices()
+        virtual_site_keys = [*interchange["VirtualSites"].key_map]
+
+        assert indices.atom_molecule_indices.tolist() == [0, 0, 0, 1, 1, 1]
+        assert indices.molecule_atom_offsets.tolist() == [0, 3, 6]
+        assert indices.virtual_site_molecule_indices.tolist() == [0, 1]
+
+        assert indices.uncollated_particle_indices.tolist() == [0, 1, 2, 3, 4, 5, 6, 7]
+        assert indices.collated_particle_indices.tolist() == [0, 1, 2, 4, 5, 6, 3, 7]
+
+        assert indices.molecule_virtual_site_map == {0: [virtual_site_keys[0]], 1: [virtual_site_keys[1]]}
+
+        assert _build_particle_map(interchange, collate=True) == {
+            0: 0,
+            1: 1,
+            2: 2,
+            virtual_site_keys[0]: 3,
+            3: 4,
+            4: 5,
+            5: 6,
+            virtual_site_keys[1]: 7,
+        }
+
+    def test_cached_until_topology_changes(self, sage, water):
+        interchange = sage.create_interchange(water.to_topology())
+
+        indices = interchange._get_topology_indices()
+
+        assert interchange._get_topology_indices() is indices
+        assert indices.virtual_site_keys == tuple()
+
+        interchange.topology.add_molecule(water)
+
+        assert interchange._get_topology_indices() is not indices
+        assert interchange._get_topology_indices().atom_molecule_indices.tolist() == [0, 0, 0, 1, 1, 1]
@@ -175,6 +175,46 @@ class TestPRMTOP:
 
         assert openmm_atom_names == pdb_atom_names
 
+    def test_fixed_width_sections(self):
+        import io
+
+        from openff.interchange.interop.amber.export._export import _write_floats, _write_integers
+
+        file = io.StringIO()
+
+        _write_integers(file, np.arange(12))
+        _write_floats(file, [1.0, -0.5])
+        _write_integers(file, [])
+
+        assert file.getvalue() == (
+            "".join(str(value).rjust(8) for value in range(10))
+            + "\n"
+            + "      10      11\n"
+            + f"{1.0:16.8E}{-0.5:16.8E}\n"
+            + "\n"
+        )
+
+    def test_lennard_jones_tables(self):
+        from openff.interchange.interop.amber.export._export import _get_lennard_jones_tables
+
+        sigmas = np.array([3.0, 3.5, 2.0])
+        epsilons = np.array([0.1, 0.2, 0.0])
+
+        acoefs, bcoefs, nonbonded_parm_indices = _get_lennard_jones_tables(sigmas, epsilons)
+
+        assert len(acoefs) == len(bcoefs) == 6
+
+        for i in range(3):
+            for j in range(3):
+                coeff_index = nonbonded_parm_indices[3 * i + j] - 1
+
+                sigma = (sigmas[i] + sigmas[j]) / 2
+                epsilon = (epsilons[i] * epsilons[j]) ** 0.5
+
+                assert acoefs[coeff_index] == pytest.approx(4 * epsilon * sigma**12)
+                assert bcoefs[coeff_index] == pytest.approx(4 * epsilon * sigma**6)
+                assert coeff_index == min(i, j) + max(i, j) * (max(i, j) + 1) // 2
+
 
 class TestAmberResidues:
     @pytest.mark.parametrize("patch_residue_name", [True, False])
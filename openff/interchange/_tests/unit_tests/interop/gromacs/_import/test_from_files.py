@@ -1,5 +1,10 @@
+import os
+
+import pytest
+
 from openff.interchange._tests import get_test_file_path
-from openff.interchange.interop.gromacs._import._import import from_files
+from openff.interchange.interop.gromacs._import._import import _process_bonds, _split_file, from_files
+from openff.interchange.interop.gromacs._import.combine import _read_lines, make_monolithic
 from openff.interchange.interop.gromacs.models.models import RyckaertBellemansDihedral
 
 
@@ -15,3 +20,87 @@ def test_load_rb_torsions(monkeypatch):
 
     for torsion in system.molecule_types["Compound"].dihedrals:
         assert isinstance(torsion, RyckaertBellemansDihedral)
+
+
+def _touch(path):
+    """Advance the modification time of a file, which may otherwise not change within the file system's resolution."""
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1))
+
+
+def test_include_cached_by_path_and_mtime(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    (tmp_path / "forcefield.itp").write_text('#include "atomtypes.itp"\n')
+    (tmp_path / "atomtypes.itp").write_text("[ atomtypes ]\nC 6 12.011 0.0 A 0.3 0.4\n")
+    (tmp_path / "topol.top").write_text('#include "forcefield.itp"\n[ system ]\nfoo\n')
+
+    _read_lines.cache_clear()
+
+    first = make_monolithic("topol.top")
+    second = make_monolithic("topol.top")
+
+    assert first == second == ["[ atomtypes ]\n", "C 6 12.011 0.0 A 0.3 0.4\n", "[ system ]\n", "foo\n"]
+    assert _read_lines.cache_info().misses == 3
+    assert _read_lines.cache_info().hits == 3
+
+    assert not (tmp_path / "MONOLITHIC_topol.top").exists()
+
+    # a change to a nested include is picked up, even though the files including it did not change
+    (tmp_path / "atomtypes.itp").write_text("[ atomtypes ]\nO 8 15.999 0.0 A 0.3 0.4\n")
+    _touch(tmp_path / "atomtypes.itp")
+
+    assert make_monolithic("topol.top")[1] == "O 8 15.999 0.0 A 0.3 0.4\n"
+    assert _read_lines.cache_info().misses == 4
+
+
+def test_included_files_parsed_once(tmp_path, monkeypatch):
+    monkeypatch.setenv("INTERCHANGE_EXPERIMENTAL", "1")
+    monkeypatch.chdir(tmp_path)
+
+    (tmp_path / "forcefield.itp").write_text(
+        "[ defaults ]\n1 2 yes 0.5 0.8333\n[ atomtypes ]\nAr 18 39.948 0.0 A 0.34 0.99\n",
+    )
+    (tmp_path / "argon.itp").write_text(
+        "[ moleculetype ]\nAR 3\n[ atoms ]\n1 Ar 1 AR AR 1 0.0 39.948\n",
+    )
+    (tmp_path / "topol.top").write_text(
+        '#include "forcefield.itp"\n#include "argon.itp"\n[ system ]\nargon\n[ molecules ]\nAR 1\n',
+    )
+    (tmp_path / "conf.gro").write_text("argon\n1\n    1AR      AR    1   0.100   0.200   0.300\n   2.0   2.0   2.0\n")
+
+    _split_file.cache_clear()
+
+    first = from_files("topol.top", "conf.gro")
+
+    assert _split_file.cache_info().misses == 3
+
+    # mutating one system does not affect systems parsed later from the same cached sections
+    first.molecule_types["AR"].atoms[0].name = "XX"
+    first.molecule_types["AR"].atoms.clear()
+
+    second = from_files("topol.top", "conf.gro")
+
+    assert _split_file.cache_info().misses == 3
+    assert _split_file.cache_info().hits == 3
+
+    assert second.molecules == [("AR", 1)]
+    assert [atom.name for atom in second.molecule_types["AR"].atoms] == ["AR"]
+    assert second.atom_types["Ar"] is not first.atom_types["Ar"]
+
+    (tmp_path / "argon.itp").write_text(
+        "[ moleculetype ]\nAR 3\n[ atoms ]\n1 Ar 1 AR AR 1 0.5 39.948\n",
+    )
+    _touch(tmp_path / "argon.itp")
+
+    assert from_files("topol.top", "conf.gro").molecule_types["AR"].atoms[0].charge.m == 0.5
+    assert _split_file.cache_info().misses == 4
+
+
+def test_unsupported_bond_function():
+    bonds = _process_bonds([["1", "2", "1", "0.1", "1000.0"], ["2", "3", "1", "0.15", "2000.0"]])
+
+    assert [(bond.atom1, bond.atom2) for bond in bonds] == [(1, 2), (2, 3)]
+    assert bonds[1].length.m_as("nanometer") == 0.15
+
+    with pytest.raises(ValueError, match="parsed 2"):
+        _process_bonds([["1", "2", "1", "0.1", "1000.0"], ["2", "3", "2", "0.15", "2000.0"]])
@@ -51,6 +51,36 @@ def parse_residue_ids(file) -> list[str]:
     return ids
 
 
+class TestGroRoundtrip:
+    @pytest.mark.parametrize("decimal", [3, 8])
+    def test_roundtrip_in_blocks(self, sage, water, monkeypatch, decimal):
+        from openff.interchange.interop.gromacs.export import _export
+
+        # force several blocks, including one with fewer copies than the others
+        monkeypatch.setattr(_export, "_GRO_LINES_PER_BLOCK", 7)
+
+        topology = Topology.from_molecules(5 * [water])
+        topology.box_vectors = Quantity([4, 4, 4], "nanometer")
+
+        interchange = sage.create_interchange(topology)
+        interchange.positions = Quantity(numpy.random.default_rng(0).uniform(0, 4, (15, 3)), "nanometer")
+
+        interchange.to_gro("blocks.gro", decimal=decimal)
+
+        lines = open("blocks.gro").readlines()
+
+        assert len(lines) == 18
+        assert [int(line[15:20]) for line in lines[2:-1]] == list(range(1, 16))
+        assert {len(line) for line in lines[2:-1]} == {21 + 3 * (decimal + 5)}
+
+        assert numpy.allclose(
+            _read_coordinates("blocks.gro").m_as(unit.nanometer),
+            interchange.positions.m_as(unit.nanometer),
+            atol=10**-decimal,
+        )
+        assert numpy.allclose(_read_box("blocks.gro"), interchange.box)
+
+
 class TestToGro(_NeedsGROMACS):
     @pytest.mark.xfail(reason="Broken")
     def test_residue_names(self, sage):
@@ -778,6 +808,56 @@ class TestMergeAtomTypes(_NeedsGROMACS):
         for attr in ["sigma", "epsilon", "charge"]:
             assert [getattr(atom, attr) for atom in not_merged.atoms] == [getattr(atom, attr) for atom in merged.atoms]
 
+    def test_merged_atom_types_tolerance(self):
+        from openff.interchange.interop.gromacs.export._export import _MergedAtomTypes
+        from openff.interchange.interop.gromacs.models.models import LennardJonesAtomType
+
+        def atom_type(name, atomic_number=6, sigma=0.3):
+            return LennardJonesAtomType(
+                name=name,
+                atomic_number=atomic_number,
+                mass=Quantity(12.011, "amu"),
+                charge=Quantity(0.0, "elementary_charge"),
+                particle_type="A",
+                sigma=Quantity(sigma, "nanometer"),
+                epsilon=Quantity(0.4, "kilojoule_per_mole"),
+            )
+
+        table = _MergedAtomTypes()
+
+        assert table.find_or_add(atom_type("a")) == "AT_0"
+        # within tolerance, possibly in a neighboring bucket
+        assert table.find_or_add(atom_type("b", sigma=0.3 + 9e-6)) == "AT_0"
+        assert table.find_or_add(atom_type("c", sigma=0.3 - 9e-6)) == "AT_0"
+        # different element or outside of tolerance
+        assert table.find_or_add(atom_type("d", atomic_number=7)) == "AT_1"
+        assert table.find_or_add(atom_type("e", sigma=0.3 + 2e-5)) == "AT_2"
+
+        assert len(table) == 3
+
+    def test_reuse_merged_atom_types(self, sage):
+        from openff.interchange.interop.gromacs.export._export import _MergedAtomTypes
+
+        table = _MergedAtomTypes()
+
+        ethanol = sage.create_interchange(Molecule.from_smiles("CCO").to_topology())
+        ethanol.to_top("ethanol.top", _merge_atom_types=True, _merged_atom_types=table)
+
+        n_atom_types = len(table)
+
+        # writing the same system again adds no atom types
+        ethanol.to_top("ethanol_again.top", _merge_atom_types=True, _merged_atom_types=table)
+
+        assert len(table) == n_atom_types
+
+        ethanol_water = sage.create_interchange(
+            Topology.from_molecules([Molecule.from_smiles("CCO"), Molecule.from_smiles("O")]),
+        )
+        ethanol_water.to_top("ethanol_water.top", _merge_atom_types=True, _merged_atom_types=table)
+
+        # the atom types of water are new
+        assert len(table) > n_atom_types
+
 
 class TestGROMACSVirtualSites(_NeedsGROMACS):
     @pytest.fixture
@@ -263,3 +263,31 @@ class TestLammps:
             runner.file("out_pointenergy.in")
         except Exception as error:
             raise LAMMPSRunError from error
+
+
+def test_sections_written_in_bulk(sage_unconstrained, tmp_path):
+    molecule = MoleculeWithConformer.from_smiles("CCO")
+    topology = Topology.from_molecules(3 * [molecule])
+    topology.box_vectors = Quantity([4, 4, 4], "nanometer")
+
+    interchange = sage_unconstrained.create_interchange(topology)
+    interchange.positions = Quantity(rng.random((topology.n_atoms, 3)), "nanometer")
+
+    interchange.to_lammps_datafile(tmp_path / "out.lmp")
+
+    sections = [section.strip() for section in (tmp_path / "out.lmp").read_text().split("\n\n")]
+
+    atoms = numpy.loadtxt(sections[sections.index("Atoms") + 1].splitlines())
+    bonds = numpy.loadtxt(sections[sections.index("Bonds") + 1].splitlines(), dtype=int)
+
+    assert atoms.shape == (27, 7)
+    numpy.testing.assert_equal(atoms[:, 0], numpy.arange(1, 28))
+    numpy.testing.assert_equal(atoms[:, 1], numpy.repeat([1, 2, 3], 9))
+    numpy.testing.assert_allclose(atoms[:, 4:], interchange.positions.m_as("angstrom"), rtol=1e-7)
+
+    bond_types = {key: index + 1 for index, key in enumerate(interchange["Bonds"].potentials)}
+
+    assert bonds.tolist() == [
+        [index + 1, bond_types[potential_key], *(atom_index + 1 for atom_index in top_key.atom_indices)]
+        for index, (top_key, potential_key) in enumerate(interchange["Bonds"].key_map.items())
+    ]
@@ -1,11 +1,12 @@
 import pytest
-from openff.toolkit import Molecule, unit
+from openff.toolkit import Molecule, Topology, unit
 from openff.utilities.testing import skip_if_missing
 
 from openff.interchange.exceptions import (
     UnsupportedCutoffMethodError,
     UnsupportedExportError,
 )
+from openff.interchange.models import TopologyKey
 
 
 @skip_if_missing("openmm")
@@ -137,3 +138,50 @@ class TestEwaldSettings:
                 break
         else:
             pytest.fail("Found no `NonbondedForce`")
+
+
+@skip_if_missing("openmm")
+class TestParticleParameters:
+    @pytest.mark.parametrize("combine", [True, False])
+    def test_particle_parameters_match_collections(self, sage, combine):
+        import openmm
+
+        topology = Topology.from_molecules(
+            [Molecule.from_smiles("CCO"), Molecule.from_smiles("O"), Molecule.from_smiles("O")],
+        )
+
+        interchange = sage.create_interchange(topology)
+
+        system = interchange.to_openmm(combine_nonbonded_forces=combine)
+
+        charges = interchange["Electrostatics"].charges
+        vdw = interchange["vdW"]
+
+        for force in system.getForces():
+            if isinstance(force, openmm.NonbondedForce):
+                electrostatics_force = force
+            elif isinstance(force, openmm.CustomNonbondedForce):
+                vdw_force = force
+
+        for index in range(topology.n_atoms):
+            key = TopologyKey(atom_indices=(index,))
+            parameters = vdw.potentials[vdw.key_map[key]].parameters
+
+            charge, sigma, epsilon = electrostatics_force.getParticleParameters(index)
+
+            assert charge.value_in_unit(openmm.unit.elementary_charge) == pytest.approx(charges[key].m_as(unit.e))
+
+            if combine:
+                assert sigma.value_in_unit(openmm.unit.nanometer) == pytest.approx(
+                    parameters["sigma"].m_as(unit.nanometer),
+                )
+                assert epsilon.value_in_unit(openmm.unit.kilojoule_per_mole) == pytest.approx(
+                    parameters["epsilon"].m_as(unit.kilojoule_per_mole),
+                )
+            else:
+                assert vdw_force.getParticleParameters(index) == pytest.approx(
+                    (
+                        parameters["sigma"].m_as(unit.nanometer),
+                        parameters["epsilon"].m_as(unit.kilojoule_per_mole),
+                    ),
+                )
@@ -1,4 +1,5 @@
 import pandas
+import pytest
 from openff.toolkit import ForceField, Molecule, unit
 from openff.utilities.testing import skip_if_missing
 
@@ -61,3 +62,226 @@ class TestToOpenMM:
         # epsilon of 1-4 interaction matches either atom's sigma
         scale = sage_unconstrained["vdW"].scale14
         assert epsilon == vdw_force.getParticleParameters(0)[1] * scale
+
+    def test_copies_with_modified_parameters(self, sage_unconstrained):
+        """Potentials shared between copies of a molecule are converted once, but edits to one copy are kept."""
+        import openmm
+
+        from openff.interchange.components.potentials import Potential
+        from openff.interchange.models import BondKey, PotentialKey
+
+        molecule = Molecule.from_smiles("CCO")
+
+        interchange = sage_unconstrained.create_interchange([molecule] * 3)
+
+        bonds = interchange["Bonds"]
+
+        modified_key = PotentialKey(id="modified", associated_handler="Bonds")
+        bonds.potentials[modified_key] = Potential(
+            parameters={
+                "k": 123.0 * unit.kilocalorie_per_mole / unit.angstrom**2,
+                "length": 1.23 * unit.angstrom,
+            },
+        )
+
+        n_atoms = molecule.n_atoms
+        bonds.key_map[BondKey(atom_indices=(n_atoms, n_atoms + 1))] = modified_key
+
+        bond_force = next(
+            force
+            for force in interchange.to_openmm_system().getForces()
+            if isinstance(force, openmm.HarmonicBondForce)
+        )
+
+        lengths = dict()
+
+        for index in range(bond_force.getNumBonds()):
+            atom1, atom2, length, _ = bond_force.getBondParameters(index)
+            lengths[tuple(sorted((atom1, atom2)))] = length.value_in_unit(openmm.unit.angstrom)
+
+        assert lengths[(0, 1)] == lengths[(2 * n_atoms, 2 * n_atoms + 1)]
+        assert lengths[(n_atoms, n_atoms + 1)] == pytest.approx(1.23)
+
+    def test_terms_stamped_from_templates(self, sage_unconstrained):
+        """Terms stamped out from each unique molecule are the terms in the key maps, including edited copies."""
+        from collections import Counter
+
+        from openff.interchange.interop.common import _build_particle_map
+        from openff.interchange.interop.openmm._valence import _iter_terms
+
+        ethanol = Molecule.from_smiles("CCO")
+
+        interchange = sage_unconstrained.create_interchange([ethanol] * 3 + [Molecule.from_smiles("O")] * 2)
+
+        # the second copy of ethanol no longer matches the first
+        propers = interchange["ProperTorsions"]
+        del propers.key_map[next(key for key in propers.key_map if min(key.atom_indices) >= ethanol.n_atoms)]
+
+        particle_map = _build_particle_map(interchange)
+
+        for name, symmetric in [
+            ("Bonds", True),
+            ("Angles", True),
+            ("ProperTorsions", True),
+            ("ImproperTorsions", False),
+        ]:
+            collection = interchange[name]
+
+            def canonical(indices: tuple[int, ...]) -> tuple[int, ...]:
+                return min(indices, indices[::-1]) if symmetric else indices
+
+            expected = Counter(
+                (canonical(tuple(particle_map[index] for index in top_key.atom_indices)), pot_key)
+                for top_key, pot_key in collection.key_map.items()
+            )
+
+            found = Counter(
+                (canonical(indices), pot_key)
+                for indices, pot_key, _ in _iter_terms(
+                    interchange,
+                    collection,
+                    particle_map,
+                    lambda parameters: None,
+                    symmetric=symmetric,
+                )
+            )
+
+            assert found == expected
+
+
+@skip_if_missing("openmm")
+class TestOpenMMSystemCache:
+    def test_cache_hit_returns_copy(self, sage, basic_top):
+        import openmm
+
+        from openff.interchange.interop.openmm import OpenMMSystemCache
+
+        interchange = sage.create_interchange(basic_top)
+
+        with OpenMMSystemCache() as cache:
+            first = interchange.to_openmm_system()
+            second = interchange.to_openmm_system()
+
+            assert len(cache) == 1
+
+            interchange.to_openmm_system(combine_nonbonded_forces=False)
+
+            assert len(cache) == 2
+
+        assert first is not second
+        assert openmm.XmlSerializer.serialize(first) == openmm.XmlSerializer.serialize(second)
+
+        # no cache is used outside of the context
+        interchange.to_openmm_system()
+
+        assert len(cache) == 2
+
+    def test_mutated_collection_not_found(self, sage_unconstrained, basic_top):
+        import openmm
+
+        from openff.interchange.interop.openmm import OpenMMSystemCache
+
+        interchange = sage_unconstrained.create_interchange(basic_top)
+
+        with OpenMMSystemCache() as cache:
+            interchange.to_openmm_system()
+
+            potential = next(iter(interchange["Bonds"].potentials.values()))
+            potential.parameters["length"] = 2.0 * unit.angstrom
+
+            system = interchange.to_openmm_system()
+
+        assert len(cache) == 2
+
+        bond_force = next(force for force in system.getForces() if isinstance(force, openmm.HarmonicBondForce))
+
+        assert 0.2 in [
+            round(bond_force.getBondParameters(index)[2].value_in_unit(openmm.unit.nanometer), 6)
+            for index in range(bond_force.getNumBonds())
+        ]
+
+    def test_fingerprint_stored_until_changed(self, sage, basic_top):
+        from openff.interchange.components._fingerprint import _get_fingerprint
+
+        interchange = sage.create_interchange(basic_top)
+        reference = interchange["Bonds"].model_copy(deep=True)
+
+        fingerprint = _get_fingerprint(interchange)
+        stored = interchange["Bonds"]._fingerprint.state
+
+        assert _get_fingerprint(interchange) == fingerprint
+        assert interchange["Bonds"]._fingerprint.state is stored
+
+        # the stored fingerprint does not take part in comparisons
+        assert interchange["Bonds"] == reference
+
+        potential = next(iter(interchange["Bonds"].potentials.values()))
+        potential.parameters["k"] *= 2
+
+        assert _get_fingerprint(interchange) != fingerprint
+        assert interchange["Bonds"]._fingerprint.state != stored
+
+        potential.parameters["k"] /= 2
+
+        assert _get_fingerprint(interchange) == fingerprint
+
+        interchange.topology.add_molecule(interchange.topology.molecule(0))
+
+        assert _get_fingerprint(interchange) != fingerprint
+
+    def test_least_recently_used_evicted(self, sage, basic_top):
+        from openff.interchange.interop.openmm import OpenMMSystemCache
+
+        interchange = sage.create_interchange(basic_top)
+
+        with OpenMMSystemCache(max_size=2) as cache:
+            for ewald_tolerance in [1e-4, 1e-5, 1e-6]:
+                interchange.to_openmm_system(ewald_tolerance=ewald_tolerance)
+
+        assert len(cache) == 2
+        assert cache.get(cache.make_key("unknown")) is None
+
+
+class TestOpenMMContextUpdater:
+    def test_push_modified_parameters(self, sage_unconstrained, basic_top):
+        import openmm
+
+        from openff.interchange.interop.openmm import OpenMMContextUpdater
+
+        interchange = sage_unconstrained.create_interchange(basic_top)
+
+        updater = OpenMMContextUpdater(interchange)
+        context = openmm.Context(updater.system, openmm.VerletIntegrator(1.0))
+
+        assert updater.update_context(context) == 0
+
+        bond_potential = next(iter(interchange["Bonds"].potentials.values()))
+        bond_potential.parameters["k"] *= 2.0
+
+        vdw_potential = next(iter(interchange["vdW"].potentials.values()))
+        vdw_potential.parameters["epsilon"] *= 2.0
+
+        assert updater.update_context(context) > 0
+        assert updater.update_context(context) == 0
+
+        expected = interchange.to_openmm_system()
+        found = context.getSystem()
+
+        for force_type, get_parameters, get_count in [
+            (openmm.HarmonicBondForce, "getBondParameters", "getNumBonds"),
+            (openmm.NonbondedForce, "getParticleParameters", "getNumParticles"),
+            (openmm.NonbondedForce, "getExceptionParameters", "getNumExceptions"),
+        ]:
+            expected_force = next(force for force in expected.getForces() if isinstance(force, force_type))
+            found_force = next(force for force in found.getForces() if isinstance(force, force_type))
+
+            for index in range(getattr(expected_force, get_count)()):
+                for expected_value, found_value in zip(
+                    getattr(expected_force, get_parameters)(index),
+                    getattr(found_force, get_parameters)(index),
+                ):
+                    if isinstance(expected_value, openmm.unit.Quantity):
+                        expected_value = expected_value._value
+                        found_value = found_value._value
+
+                    assert found_value == pytest.approx(expected_value)
@@ -1,5 +1,6 @@
 """Unit tests for common virtual site functions."""
 
+import copy
 from random import random
 
 import numpy
@@ -8,7 +9,10 @@ from openff.toolkit import ForceField, Quantity, unit
 
 from openff.interchange._tests import MoleculeWithConformer
 from openff.interchange.exceptions import MissingVirtualSitesError
-from openff.interchange.interop._virtual_sites import get_positions_with_virtual_sites
+from openff.interchange.interop._virtual_sites import (
+    get_positions_with_virtual_sites,
+    iter_positions_with_virtual_sites,
+)
 
 
 @pytest.fixture
@@ -268,3 +272,73 @@ class TestVirtualSitePositions:
         # the xy plane, so the virtual site is at [0, 0, 0.88 ... + distance_]
         assert positions[-1].m_as(unit.angstrom)[0] == pytest.approx(0.0)
         # assert positions[-1].m_as(unit.angstrom)[1] == pytest.approx(0.0)
+
+
+def test_local_frames_cached_and_invalidated(tip4p, water_dimer):
+    out = tip4p.create_interchange(water_dimer)
+    collection = out["VirtualSites"]
+
+    groups = collection._get_local_frame_groups()
+
+    assert collection._get_local_frame_groups() is groups
+    assert [group.orientation_indices.shape for group in groups] == [(2, 3)]
+
+    origins = out.positions[[key.orientation_atom_indices[0] for key in collection.key_map]].m_as(unit.nanometer)
+    before = get_positions_with_virtual_sites(out)[-2:].m_as(unit.nanometer)
+
+    potential = next(iter(collection.potentials.values()))
+    potential.parameters["distance"] *= 2
+
+    assert collection._get_local_frame_groups() is not groups
+
+    after = get_positions_with_virtual_sites(out)[-2:].m_as(unit.nanometer)
+
+    numpy.testing.assert_allclose(after - origins, 2 * (before - origins))
+
+    groups = collection._get_local_frame_groups()
+
+    collection.key_map[next(iter(collection.key_map))] = next(iter(collection.potentials))
+
+    assert collection._get_local_frame_groups() is not groups
+
+
+def test_cached_local_frames_not_compared(tip4p, water_dimer):
+    first = tip4p.create_interchange(water_dimer)
+
+    # share the topology and positions, which can not be compared by value, but not the collections
+    second = first.model_copy(update={"collections": copy.deepcopy(first.collections)})
+
+    get_positions_with_virtual_sites(first)
+
+    assert first["VirtualSites"] == second["VirtualSites"]
+    assert first == second
+
+    get_positions_with_virtual_sites(second)
+
+    assert first["VirtualSites"] == second["VirtualSites"]
+    assert first == second
+
+
+@pytest.mark.parametrize("collate", [True, False])
+def test_iter_positions_with_virtual_sites(tip4p, water_dimer, collate):
+    out = tip4p.create_interchange(water_dimer)
+
+    rng = numpy.random.default_rng(0)
+    frames = out.positions + Quantity(rng.normal(scale=0.01, size=(5, 6, 3)), unit.nanometer)
+
+    expected = list()
+
+    for frame in frames:
+        out.positions = frame
+        expected.append(get_positions_with_virtual_sites(out, collate=collate).m_as(unit.nanometer))
+
+    from_array = list(iter_positions_with_virtual_sites(out, frames, collate=collate, chunk_size=2))
+    from_iterator = list(iter_positions_with_virtual_sites(out, iter(frames), collate=collate, chunk_size=2))
+
+    assert [chunk.shape for chunk in from_array] == [(2, 8, 3), (2, 8, 3), (1, 8, 3)]
+
+    for chunks in (from_array, from_iterator):
+        numpy.testing.assert_allclose(
+            numpy.concatenate([chunk.m_as(unit.nanometer) for chunk in chunks]),
+            numpy.stack(expected),
+        )
@@ -13,6 +13,7 @@ from openff.interchange.smirnoff import (
     SMIRNOFFCollection,
     SMIRNOFFElectrostaticsCollection,
 )
+from openff.interchange.smirnoff._base import _find_matches_from_templates
 
 
 class TestSMIRNOFFCollection:
@@ -67,3 +68,19 @@ def test_json_roundtrip_preserves_float_values():
     )
 
     assert roundtripped.scale_14 == scale_factor
+
+
+@pytest.mark.parametrize("handler_name", ["Bonds", "Angles", "ProperTorsions", "ImproperTorsions", "vdW"])
+def test_template_matches_same_as_full_topology(sage, ethanol, reversed_ethanol, water, handler_name):
+    topology = Topology.from_molecules([ethanol, water, reversed_ethanol, water, ethanol])
+
+    parameter_handler = sage[handler_name]
+
+    expected = parameter_handler.find_matches(topology)
+    found = _find_matches_from_templates(parameter_handler, topology)
+
+    assert type(found) is type(expected)
+    assert found.keys() == expected.keys()
+
+    for key in expected:
+        assert found[key].parameter_type.smirks == expected[key].parameter_type.smirks
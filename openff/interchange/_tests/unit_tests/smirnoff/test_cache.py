@@ -0,0 +1,76 @@
+import pickle
+
+from openff.toolkit import Topology
+
+from openff.interchange import Interchange
+from openff.interchange.smirnoff import SMIRNOFFParameterCache
+
+
+class TestSMIRNOFFParameterCache:
+    def test_get_put(self, tmp_path):
+        cache = SMIRNOFFParameterCache(tmp_path / "cache.sqlite")
+
+        key = cache.make_key("abc", "[H:1][O:2][H:3]", "Bonds")
+
+        assert cache.get(key) is None
+
+        cache.put(key, [((0, 1), 0), ((1, 2), 0)])
+
+        assert cache.get(key) == [((0, 1), 0), ((1, 2), 0)]
+        assert len(cache) == 1
+
+        cache.clear()
+
+        assert len(cache) == 0
+
+    def test_keys_differ_by_component(self):
+        keys = {
+            SMIRNOFFParameterCache.make_key(*args)
+            for args in [
+                ("abc", "[H:1][O:2][H:3]", "Bonds"),
+                ("abd", "[H:1][O:2][H:3]", "Bonds"),
+                ("abc", "[H:1][O:3][H:2]", "Bonds"),
+                ("abc", "[H:1][O:2][H:3]", "Angles"),
+            ]
+        }
+
+        assert len(keys) == 4
+
+    def test_lru_eviction(self, tmp_path):
+        cache = SMIRNOFFParameterCache(tmp_path / "cache.sqlite", max_size=250)
+
+        for index in range(10):
+            cache.put(str(index), b"x" * 50)
+
+            # keep the first entry fresh
+            cache.get("0")
+
+        assert cache.get("0") is not None
+        assert cache.get("1") is None
+        assert cache.get("9") is not None
+
+    def test_pickle_reopens_connection(self, tmp_path):
+        cache = SMIRNOFFParameterCache(tmp_path / "cache.sqlite")
+        cache.put("foo", "bar")
+
+        unpickled = pickle.loads(pickle.dumps(cache))
+
+        assert unpickled.path == cache.path
+        assert unpickled.get("foo") == "bar"
+
+    def test_cached_interchange_matches_uncached(self, tmp_path, sage, ethanol, water):
+        topology = Topology.from_molecules([ethanol, water, water, ethanol])
+
+        cache = SMIRNOFFParameterCache(tmp_path / "cache.sqlite")
+
+        reference = Interchange.from_smirnoff(sage, topology)
+
+        # the first call populates the cache, the second is served from it
+        for _ in range(2):
+            cached = Interchange.from_smirnoff(sage, topology, cache=cache)
+
+            for name, collection in reference.collections.items():
+                assert cached[name].key_map == collection.key_map
+                assert cached[name].potentials == collection.potentials
+
+        assert len(cache) > 0
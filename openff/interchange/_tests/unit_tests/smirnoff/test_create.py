@@ -107,6 +107,106 @@ class TestCreate:
             for potential_key in out[collection].potentials:
                 assert potential_key.cosmetic_attributes["fOO"] == "bAR"
 
+    def test_concurrent_stages(self, sage, ethanol, water):
+        topology = Topology.from_molecules([ethanol, water, water])
+
+        sequential = Interchange.from_smirnoff(sage, topology)
+        concurrent = Interchange.from_smirnoff(sage, topology, n_workers=4)
+
+        assert [*concurrent.collections] == [*sequential.collections]
+
+        for name, collection in sequential.collections.items():
+            assert concurrent[name].key_map == collection.key_map
+            assert concurrent[name].potentials == collection.potentials
+
+
+class TestUpdateForceField:
+    def test_only_parameter_values_changed(self, sage, ethanol):
+        force_field = ForceField(sage.to_string())
+        topology = Topology.from_molecules([ethanol, ethanol])
+
+        interchange = force_field.create_interchange(topology)
+
+        # recorded while creating, so that the first update only re-assigns what changed
+        assert [*interchange._handler_states] == force_field.registered_parameter_handlers
+
+        bonds, angles = interchange["Bonds"], interchange["Angles"]
+        key_map = dict(bonds.key_map)
+
+        force_field["Bonds"].parameters["[#6X4:1]-[#6X4:2]"].k *= 1.1
+
+        interchange.update_force_field(force_field)
+
+        # re-used, not re-created, collections
+        assert interchange["Bonds"] is bonds
+        assert interchange["Angles"] is angles
+        assert bonds.key_map == key_map
+
+        reference = force_field.create_interchange(topology)
+
+        for name, collection in reference.collections.items():
+            assert interchange[name].key_map == collection.key_map
+            assert interchange[name].potentials == collection.potentials
+
+    def test_smirks_changed(self, sage, ethanol):
+        force_field = ForceField(sage.to_string())
+        topology = Topology.from_molecules([ethanol])
+
+        interchange = force_field.create_interchange(topology)
+
+        force_field["Bonds"].add_parameter(
+            {
+                "smirks": "[#6:1]-[#8:2]",
+                "k": Quantity(500.0, kcal_mol_a2),
+                "length": Quantity(1.5, unit.angstrom),
+                "id": "b-new",
+            },
+        )
+
+        interchange.update_force_field(force_field)
+
+        assert any(key.id == "[#6:1]-[#8:2]" for key in interchange["Bonds"].key_map.values())
+
+        reference = force_field.create_interchange(topology)
+
+        assert [*interchange.collections] == [*reference.collections]
+
+        for name, collection in reference.collections.items():
+            assert interchange[name].key_map == collection.key_map
+            assert interchange[name].potentials == collection.potentials
+
+
+class TestCreateBatch:
+    def test_failures_do_not_stop_batch(self, sage, ethanol, water):
+        results = dict(
+            Interchange.from_smirnoff_batch(
+                sage,
+                [ethanol.to_topology(), "not a topology", water.to_topology()],
+            ),
+        )
+
+        assert [*results] == [0, 1, 2]
+
+        assert isinstance(results[0], Interchange)
+        assert isinstance(results[1], Exception)
+        assert isinstance(results[2], Interchange)
+
+        assert results[2]["Bonds"].key_map == sage.create_interchange(water.to_topology())["Bonds"].key_map
+
+    def test_process_pool(self, sage, ethanol, water):
+        topologies = [ethanol.to_topology(), water.to_topology(), Topology.from_molecules([ethanol, water])]
+
+        results = dict(Interchange.from_smirnoff_batch(sage, topologies, n_workers=2, max_pending=2))
+
+        assert sorted(results) == [0, 1, 2]
+
+        for index, topology in enumerate(topologies):
+            reference = sage.create_interchange(topology)
+
+            for name, collection in reference.collections.items():
+                assert results[index][name].key_map == collection.key_map
+                assert results[index][name].potentials == collection.potentials
+
 
 class TestUnassignedParameters:
     def test_catch_unassigned_bonds(self, sage, ethanol_top):
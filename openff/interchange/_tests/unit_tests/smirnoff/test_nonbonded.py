@@ -225,6 +225,35 @@ class TestElectrostatics:
         compare_charges(original, get_charges_from_interchange(original))
         compare_charges(reordered, get_charges_from_interchange(reordered))
 
+    def test_charges_replicated_to_duplicate_molecules(self, sage, ethanol, reversed_ethanol, water):
+        topology = Topology.from_molecules([ethanol, water, reversed_ethanol, water, ethanol])
+
+        interchange = sage.create_interchange(topology)
+
+        charges = interchange["Electrostatics"]._get_charges()
+
+        assert len(charges) == topology.n_atoms
+
+        for molecule in interchange.topology.molecules:
+            assert molecule.partial_charges is not None
+
+            for atom, partial_charge in zip(molecule.atoms, molecule.partial_charges):
+                assert charges[interchange.topology.atom_index(atom),] == partial_charge
+
+        numpy.testing.assert_allclose(
+            interchange.topology.molecule(0).partial_charges.m,
+            interchange.topology.molecule(4).partial_charges.m,
+        )
+
+    def test_charges_computed_in_process_pool(self, sage, ethanol, reversed_ethanol, water):
+        topology = Topology.from_molecules([ethanol, water, reversed_ethanol, water, ethanol])
+
+        serial = sage.create_interchange(topology)
+        parallel = Interchange.from_smirnoff(sage, topology, n_workers=2)
+
+        assert parallel["Electrostatics"].key_map == serial["Electrostatics"].key_map
+        assert parallel["Electrostatics"].potentials == serial["Electrostatics"].potentials
+
 
 def test_nonintegral_molecule_charge_error(sage, water):
     funky_charges = Quantity([0, 0, -5.5], "elementary_charge")
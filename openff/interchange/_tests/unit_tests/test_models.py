@@ -197,3 +197,39 @@ def test_torsionkey_eq_hash():
         None,
         1.5,
     )
+
+
+def test_constructed_keys_match_validated_keys():
+    """Keys built without validation on internal hot paths must behave like validated keys."""
+    for key_class, kwargs in [
+        (TopologyKey, {"atom_indices": (4,)}),
+        (BondKey, {"atom_indices": (0, 1), "bond_order": 1.5}),
+        (AngleKey, {"atom_indices": (0, 1, 2)}),
+        (ProperTorsionKey, {"atom_indices": (0, 1, 2, 3), "mult": 2}),
+        (ImproperTorsionKey, {"atom_indices": (1, 0, 2, 3), "mult": 0}),
+    ]:
+        validated = key_class(**kwargs)
+        constructed = key_class.model_construct(**kwargs)
+
+        assert constructed == validated
+        assert hash(constructed) == hash(validated)
+        assert constructed.model_dump() == validated.model_dump()
+
+    validated_potential_key = PotentialKey(id="[#6:1]", mult=1, associated_handler="ProperTorsions")
+    constructed_potential_key = PotentialKey.model_construct(
+        id="[#6:1]",
+        mult=1,
+        associated_handler="ProperTorsions",
+    )
+
+    assert constructed_potential_key == validated_potential_key
+    assert hash(constructed_potential_key) == hash(validated_potential_key)
+    assert {validated_potential_key: 0}[constructed_potential_key] == 0
+
+
+def test_copied_keys_are_independent():
+    key = ProperTorsionKey(atom_indices=(0, 1, 2, 3), mult=1)
+    copied = key.model_copy(update={"atom_indices": (10, 11, 12, 13)})
+
+    assert key.atom_indices == (0, 1, 2, 3)
+    assert copied == ((10, 11, 12, 13), 1, None, None)
@@ -0,0 +1,107 @@
+"""Content fingerprints of Interchange objects."""
+
+import hashlib
+from typing import TYPE_CHECKING, Any
+
+from openff.interchange.components.potentials import Potential, WrappedPotential
+
+if TYPE_CHECKING:
+    from openff.interchange import Interchange
+    from openff.interchange.components.potentials import Collection
+
+
+def _key_repr(key: Any) -> str:
+    """Return a string representation of a topology or potential key, including all fields and its type."""
+    return repr((type(key).__name__, *(getattr(key, name) for name in type(key).model_fields)))
+
+
+def _potential_repr(potential: Potential | WrappedPotential) -> str:
+    if isinstance(potential, WrappedPotential):
+        return repr(
+            [(inner.model_dump_json(), coefficient) for inner, coefficient in potential._inner_data.items()],
+        )
+
+    return potential.model_dump_json()
+
+
+def _get_collection_fingerprint(name: str, collection: "Collection") -> str:
+    """
+    Return a hash of a collection's settings, key map, and potentials.
+
+    This is stored on the collection and only re-computed after its revision changes, i.e. after any of its fields
+    are assigned or its key map, potentials, or their parameters are changed in-place.
+    """
+    cache = collection._fingerprint
+    state = (name, collection._revision.value)
+
+    if cache.state == state:
+        return cache.value
+
+    parts: list[str] = [name]
+
+    parts.append(f"{type(collection).__module__}.{type(collection).__qualname__}")
+    parts.append(repr(collection.model_dump(exclude={"key_map", "potentials"})))
+
+    parts.extend(f"{_key_repr(top_key)}:{_key_repr(pot_key)}" for top_key, pot_key in collection.key_map.items())
+    parts.extend(
+        f"{_key_repr(pot_key)}:{_potential_repr(potential)}" for pot_key, potential in collection.potentials.items()
+    )
+
+    fingerprint = hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+    cache.state = state
+    cache.value = fingerprint
+
+    return fingerprint
+
+
+def _get_topology_fingerprint(interchange: "Interchange") -> str:
+    """
+    Return a hash of the chemical graph of each molecule in the topology.
+
+    Like its index arrays, this is stored on the Interchange and only re-computed if the topology was replaced or
+    atoms, bonds, or molecules were added to or removed from it.
+    """
+    topology = interchange.topology
+    counts = (topology.n_atoms, topology.n_bonds, topology.n_molecules)
+
+    cache = interchange._topology_fingerprint
+
+    if cache.state is not None and cache.state[0] is topology and cache.state[1] == counts:
+        return cache.value
+
+    fingerprint = hashlib.sha256(
+        "\n".join(molecule.ordered_connection_table_hash() for molecule in topology.molecules).encode(),
+    ).hexdigest()
+
+    cache.state = (topology, counts)
+    cache.value = fingerprint
+
+    return fingerprint
+
+
+def _get_fingerprint(interchange: "Interchange") -> str:
+    """
+    Return a hash of the contents of an Interchange that define the physics of the system.
+
+    This includes every collection (its settings, key map, and potentials), the chemical graph of each
+    molecule in the topology, and the box vectors, but not positions or velocities. Any change to a
+    collection, including in-place changes to its key map or potentials, changes the fingerprint. The
+    fingerprint is stable across processes and sessions of the same version of Interchange.
+
+    The hashes of collections and of the topology are stored and re-used until they change, so that getting the
+    fingerprint of an unchanged Interchange again does not hash its contents again.
+    """
+    from openff.interchange import __version__
+
+    parts: list[str] = [__version__]
+
+    parts.extend(
+        _get_collection_fingerprint(name, collection) for name, collection in sorted(interchange.collections.items())
+    )
+
+    parts.append(_get_topology_fingerprint(interchange))
+
+    parts.append("None" if interchange.box is None else repr(interchange.box.m_as("nanometer").tolist()))
+
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
@@ -2,13 +2,20 @@
 A wrapper around PACKMOL. Adapted from OpenFF Evaluator v0.4.3.
 """
 
+import contextvars
+import functools
+import hashlib
+import itertools
 import os
+import pathlib
+import re
 import shutil
 import subprocess
 import tempfile
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
 from copy import deepcopy
-from typing import Literal
+from typing import Any, Literal
 
 import numpy
 from numpy.typing import ArrayLike, NDArray
@@ -65,6 +72,9 @@ sphere. A hexagonal intersection with the XY plane is convenient for membrane
 simulations,
 """
 
+_DEFAULT_TOLERANCE = Quantity(2.0, "angstrom")
+"""The default minimum distance between molecules of a packing, shared by `pack_box` and `pack_boxes`."""
+
 
 def _find_packmol() -> str | None:
     """
@@ -80,6 +90,138 @@ def _find_packmol() -> str | None:
     return shutil.which("packmol")
 
 
+@functools.lru_cache
+def _get_packmol_version(packmol_path: str) -> str:
+    """Get the version of a packmol binary from its banner, falling back to its path and modification time."""
+    try:
+        output = subprocess.run(
+            packmol_path,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            timeout=30,
+        ).stdout.decode("utf-8", errors="replace")
+    except (OSError, subprocess.SubprocessError):
+        output = ""
+
+    match = re.search(r"Version\s+(\S+)", output)
+
+    if match is not None:
+        return match.group(1)
+
+    return f"{packmol_path}:{os.stat(packmol_path).st_mtime_ns}"
+
+
+class PackmolCache:
+    """
+    A local, content-addressed cache of the structure files written for and the packings produced by packmol.
+
+    Within a ``with`` block using this cache, ``pack_box``, ``pack_boxes``, ``solvate_topology``, and
+    ``solvate_topology_nonwater`` re-use the PDB file of any molecule that was written before, and skip running
+    packmol if a packing of identical inputs (structure files, counts, box, tolerance, and seed) with the same
+    version of packmol was stored before. Entries are files in ``directory``, so the cache persists across
+    processes and sessions and can be shared by concurrent jobs.
+
+    .. warning :: This API is experimental and subject to change.
+
+    Parameters
+    ----------
+    directory : str or os.PathLike, default="~/.cache/openff-interchange/packmol"
+        The directory storing the cached files. It is created if it does not exist.
+
+    Examples
+    --------
+    Re-build the same boxes in later runs without running packmol again
+
+    .. code-block:: pycon
+
+        >>> from openff.interchange.components._packmol import PackmolCache, pack_box
+        >>> with PackmolCache("packmol_cache"):  # doctest: +SKIP
+        ...     topology = pack_box([water], [1000], target_density=Quantity(1.0, "g/mL"))
+
+    """
+
+    def __init__(self, directory: str | os.PathLike = "~/.cache/openff-interchange/packmol"):
+        self.directory = pathlib.Path(directory).expanduser()
+
+        self._tokens: list[contextvars.Token] = list()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(directory={str(self.directory)!r})"
+
+    def __enter__(self) -> "PackmolCache":
+        self._tokens.append(_ACTIVE_PACKMOL_CACHE.set(self))
+
+        return self
+
+    def __exit__(self, *args):
+        _ACTIVE_PACKMOL_CACHE.reset(self._tokens.pop())
+
+    def _path(self, kind: str, key: str, suffix: str) -> pathlib.Path:
+        return self.directory / kind / f"{key}{suffix}"
+
+    def _store(self, path: pathlib.Path, write: Callable[[pathlib.Path], None]):
+        """Write a file next to its final path and then move it there, so that readers never see partial files."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=path.parent, suffix=path.suffix)
+        os.close(file_descriptor)
+
+        try:
+            write(pathlib.Path(temporary_path))
+            os.replace(temporary_path, path)
+        finally:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+    def get_molecule_pdb(self, key: str) -> pathlib.Path | None:
+        """Return the path of the PDB file stored with a key, or ``None`` if it is not present."""
+        path = self._path("molecules", key, ".pdb")
+
+        return path if path.exists() else None
+
+    def put_molecule_pdb(self, key: str, pdb_file: str | os.PathLike):
+        """Store a copy of a PDB file with a key."""
+        self._store(self._path("molecules", key, ".pdb"), lambda path: shutil.copyfile(pdb_file, path))
+
+    def get_positions(self, key: str) -> NDArray | None:
+        """Return the positions (in Angstrom) of the packing stored with a key, or ``None`` if it is not present."""
+        path = self._path("packings", key, ".npy")
+
+        return numpy.load(path) if path.exists() else None
+
+    def put_positions(self, key: str, positions: NDArray):
+        """Store the positions (in Angstrom) of a packing with a key."""
+        self._store(self._path("packings", key, ".npy"), lambda path: numpy.save(path, positions))
+
+    def clear(self):
+        """Remove all files from this cache."""
+        for kind in ("molecules", "packings"):
+            shutil.rmtree(self.directory / kind, ignore_errors=True)
+
+
+_ACTIVE_PACKMOL_CACHE: contextvars.ContextVar[PackmolCache | None] = contextvars.ContextVar(
+    "_ACTIVE_PACKMOL_CACHE",
+    default=None,
+)
+
+
+def _hash_molecule(molecule: Molecule) -> str:
+    """Hash the contents of a molecule, including its conformers and metadata."""
+    return hashlib.sha256(molecule.to_json().encode()).hexdigest()
+
+
+def _hash_packing(input_file_path: str, structure_file_names: list[str], packmol_version: str) -> str:
+    """Hash a packmol input file, the structure files it reads, and the version of packmol."""
+    digest = hashlib.sha256(packmol_version.encode())
+
+    for file_name in [input_file_path, *structure_file_names]:
+        with open(file_name, "rb") as file_handle:
+            digest.update(file_handle.read())
+
+    return digest.hexdigest()
+
+
 def _check_add_positive_mass(mass_to_add):
     if mass_to_add.m < 0:
         raise PACKMOLValueError(
@@ -413,10 +555,22 @@ def _create_solute_pdb(
     return solute_pdb_filename
 
 
-def _create_molecule_pdbs(molecules: list[Molecule]) -> list[str]:
-    """Write out PDBs of the molecules so that packmol can read them."""
+def _create_molecule_pdbs(molecules: list[Molecule], cache: PackmolCache | None = None) -> list[str]:
+    """Write out PDBs of the molecules so that packmol can read them, copying them from a cache if possible."""
     pdb_file_names = []
     for index, molecule in enumerate(molecules):
+        if cache is not None:
+            key = _hash_molecule(molecule)
+            cached_pdb_file = cache.get_molecule_pdb(key)
+
+            if cached_pdb_file is not None:
+                pdb_file_name = f"_PACKING_MOLECULE{index}.pdb"
+                pdb_file_names.append(pdb_file_name)
+
+                shutil.copyfile(cached_pdb_file, pdb_file_name)
+
+                continue
+
         # Make a copy of the molecule so we don't change the input
         molecule = Molecule(molecule)
 
@@ -442,6 +596,10 @@ def _create_molecule_pdbs(molecules: list[Molecule]) -> list[str]:
             file_format="PDB",
             toolkit_registry=RDKitToolkitWrapper(),
         )
+
+        if cache is not None:
+            cache.put_molecule_pdb(key, pdb_file_name)
+
     return pdb_file_names
 
 
@@ -451,6 +609,7 @@ def _build_input_file(
     structure_to_solvate: str | None,
     box_size: Quantity,
     tolerance: Quantity,
+    seed: int | None = None,
 ) -> tuple[str, str]:
     """
     Construct the packmol input file.
@@ -469,6 +628,8 @@ def _build_input_file(
         packmol box will be shrunk by the tolerance.
     tolerance: openff.units.Quantity
         The packmol convergence tolerance.
+    seed: int, optional
+        The seed of packmol's random number generator. If ``None``, packmol's default is used.
 
     Returns
     -------
@@ -490,6 +651,9 @@ def _build_input_file(
         "",
     ]
 
+    if seed is not None:
+        input_lines.insert(3, f"seed {seed:d}")
+
     # Add the section of the molecule to solvate if provided.
     if structure_to_solvate is not None:
         input_lines.extend(
@@ -561,13 +725,15 @@ def pack_box(
     molecules: list[Molecule],
     number_of_copies: list[int],
     solute: Topology | None = None,
-    tolerance: Quantity = Quantity(2.0, "angstrom"),
+    tolerance: Quantity = _DEFAULT_TOLERANCE,
     box_vectors: Quantity | None = None,
     target_density: Quantity | None = None,
     box_shape: ArrayLike = RHOMBIC_DODECAHEDRON,
     center_solute: bool | Literal["BOX_VECS", "ORIGIN", "BRICK"] = False,
     working_directory: str | None = None,
     retain_working_files: bool = False,
+    seed: int | None = None,
+    timeout: float | None = None,
 ) -> Topology:
     """
     Run packmol to generate a box containing a mixture of molecules.
@@ -617,6 +783,12 @@ def pack_box(
     retain_working_files: bool
         If ``True`` all of the working files, such as individual molecule
         coordinate files, will be retained.
+    seed: int, optional
+        The seed of packmol's random number generator. If ``None``, packmol's
+        default seed is used, so that packing the same inputs is reproducible.
+    timeout: float, optional
+        The maximum time, in seconds, to let packmol run. If ``None``, packmol
+        is never stopped.
 
     Returns
     -------
@@ -626,7 +798,7 @@ def pack_box(
     Raises
     ------
     PACKMOLRuntimeError
-        When packmol fails to execute / converge.
+        When packmol fails to execute / converge or does not finish within ``timeout``.
 
     Notes
     -----
@@ -702,6 +874,8 @@ def pack_box(
     if len(working_directory) > 0:
         os.makedirs(working_directory, exist_ok=True)
 
+    cache = _ACTIVE_PACKMOL_CACHE.get()
+
     with temporary_cd(working_directory):
         solute_pdb_filename = _create_solute_pdb(
             solute,
@@ -709,7 +883,7 @@ def pack_box(
         )
 
         # Create PDB files for all of the molecules.
-        pdb_file_names = _create_molecule_pdbs(molecules)
+        pdb_file_names = _create_molecule_pdbs(molecules, cache=cache)
 
         # Generate the input file.
         input_file_path, output_file_path = _build_input_file(
@@ -718,35 +892,27 @@ def pack_box(
             solute_pdb_filename,
             brick_size,
             tolerance,
+            seed,
         )
 
-        with open(input_file_path) as file_handle:
-            try:
-                result = subprocess.check_output(
-                    packmol_path,
-                    stdin=file_handle,
-                    stderr=subprocess.STDOUT,
-                )
-            except subprocess.CalledProcessError as error:
-                # Custom error codes seem to start at 170
-                # https://github.com/m3g/packmol/blob/v20.15.1/src/exit_codes.f90#L13-L16
-                open("packmol_error.log", "w").write(error.stdout.decode("utf-8"))
-
-                raise PACKMOLRuntimeError(
-                    f"PACKMOL failed with error code {error.returncode}. Wrote file packmol_error.log in working "
-                    "directory, which might be a temporary directory. Set the argument `working_directory` to "
-                    "point this to a persistent path.",
-                ) from error
-
-            packmol_succeeded = result.decode("utf-8").find("Success!") > 0
-
-        if not packmol_succeeded:
-            raise PACKMOLRuntimeError(
-                "PACKMOL did not raise an error code, but 'Success!' not found in output. "
-                "Please raise an issue showing how you arrived at this error.",
+        positions = None
+
+        if cache is not None:
+            packing_key = _hash_packing(
+                input_file_path,
+                [*pdb_file_names, *([] if solute_pdb_filename is None else [solute_pdb_filename])],
+                _get_packmol_version(packmol_path),
             )
 
-        positions = _load_positions(output_file_path)
+            positions = cache.get_positions(packing_key)
+
+        if positions is None:
+            _run_packmol(packmol_path, input_file_path, timeout)
+
+            positions = _load_positions(output_file_path)
+
+            if cache is not None:
+                cache.put_positions(packing_key, positions)
 
     # TODO: This currently does not run if we encountered an error in the
     # context manager
@@ -773,6 +939,182 @@ def pack_box(
     return topology
 
 
+def _pack_box_with_retries(
+    job: dict[str, Any],
+    max_retries: int,
+    tolerance_perturbation: float,
+    cache_directory: pathlib.Path | None = None,
+) -> Topology:
+    """
+    Run `pack_box` with the arguments of a job, retrying after packmol fails.
+
+    Each retry lowers the tolerance by a factor of `1 - tolerance_perturbation` and, if a seed is given, increments
+    it, so that packmol starts from a different and less constrained initial guess.
+
+    The active `PackmolCache` is not visible to worker processes, so its directory is passed explicitly.
+    """
+    if cache_directory is not None:
+        with PackmolCache(cache_directory):
+            return _pack_box_with_retries(job, max_retries, tolerance_perturbation)
+
+    tolerance = job.get("tolerance", _DEFAULT_TOLERANCE)
+    seed = job.get("seed")
+
+    def perturbed(attempt: int) -> dict[str, Any]:
+        return {
+            **job,
+            "tolerance": tolerance * (1.0 - tolerance_perturbation) ** attempt,
+            "seed": None if seed is None else seed + attempt,
+        }
+
+    for attempt in range(max_retries):
+        try:
+            return pack_box(**perturbed(attempt))
+        except PACKMOLRuntimeError:
+            continue
+
+    return pack_box(**perturbed(max_retries))
+
+
+def pack_boxes(
+    jobs: Iterable[dict[str, Any]],
+    n_workers: int | None = None,
+    max_retries: int = 2,
+    tolerance_perturbation: float = 0.1,
+    max_pending: int | None = None,
+) -> Iterator[tuple[int, Topology | Exception]]:
+    """
+    Run many independent ``pack_box`` jobs, concurrently if ``n_workers`` is greater than one.
+
+    Parameters
+    ----------
+    jobs : iterable of dict
+        The keyword arguments of ``pack_box`` for each box, i.e. ``molecules``, ``number_of_copies``,
+        ``target_density``, and optionally ``seed`` and ``timeout``. Jobs are consumed lazily.
+    n_workers : int, optional
+        The number of processes running jobs. If ``None`` or one, jobs are run in order in this process.
+    max_retries : int, default=2
+        The number of times to retry a job after packmol fails or times out.
+    tolerance_perturbation : float, default=0.1
+        The fraction by which the tolerance of a job is lowered on each retry. A job's seed, if given, is also
+        incremented on each retry.
+    max_pending : int, optional
+        The maximum number of jobs held at once. Defaults to twice ``n_workers``.
+
+    Jobs use the ``PackmolCache`` active when this is called, including in worker processes.
+
+    Yields
+    ------
+    index : int
+        The index of a job in ``jobs``.
+    result : Topology or Exception
+        The packed topology, or the exception raised by the last attempt of the job.
+
+    Examples
+    --------
+    Pack boxes of several mixtures on eight cores
+
+    .. code-block:: pycon
+
+        >>> from openff.interchange.components._packmol import pack_boxes
+        >>> jobs = [  # doctest: +SKIP
+        ...     {
+        ...         "molecules": [water, ethanol],
+        ...         "number_of_copies": [n_water, 1000 - n_water],
+        ...         "target_density": Quantity(0.9, "g/mL"),
+        ...         "seed": n_water,
+        ...         "timeout": 600,
+        ...     }
+        ...     for n_water in range(100, 1000, 100)
+        ... ]
+        >>> for index, topology in pack_boxes(jobs, n_workers=8):  # doctest: +SKIP
+        ...     ...
+
+    """
+    if n_workers is None or n_workers <= 1:
+        for index, job in enumerate(jobs):
+            try:
+                topology = _pack_box_with_retries(job, max_retries, tolerance_perturbation)
+            except Exception as error:
+                yield index, error
+            else:
+                yield index, topology
+
+        return
+
+    max_pending = 2 * n_workers if max_pending is None else max(max_pending, 1)
+
+    cache = _ACTIVE_PACKMOL_CACHE.get()
+    cache_directory = None if cache is None else cache.directory
+
+    items = enumerate(jobs)
+    pending: dict[Future, int] = dict()
+
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        try:
+            while True:
+                # Consume jobs lazily, keeping at most `max_pending` in flight
+                for index, job in itertools.islice(items, max_pending - len(pending)):
+                    pending[
+                        pool.submit(
+                            _pack_box_with_retries,
+                            job,
+                            max_retries,
+                            tolerance_perturbation,
+                            cache_directory,
+                        )
+                    ] = index
+
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    error = future.exception()
+
+                    yield pending.pop(future), future.result() if error is None else error
+
+        finally:
+            # if the consumer stops early, do not wait on jobs that have not started
+            for future in pending:
+                future.cancel()
+
+
+def _run_packmol(packmol_path: str, input_file_path: str, timeout: float | None):
+    """Run packmol on an input file in the current directory, raising if it fails."""
+    with open(input_file_path) as file_handle:
+        try:
+            result = subprocess.check_output(
+                packmol_path,
+                stdin=file_handle,
+                stderr=subprocess.STDOUT,
+                timeout=timeout,
+            )
+        except subprocess.TimeoutExpired as error:
+            raise PACKMOLRuntimeError(
+                f"PACKMOL did not finish within {timeout} seconds.",
+            ) from error
+        except subprocess.CalledProcessError as error:
+            # Custom error codes seem to start at 170
+            # https://github.com/m3g/packmol/blob/v20.15.1/src/exit_codes.f90#L13-L16
+            open("packmol_error.log", "w").write(error.stdout.decode("utf-8"))
+
+            raise PACKMOLRuntimeError(
+                f"PACKMOL failed with error code {error.returncode}. Wrote file packmol_error.log in working "
+                "directory, which might be a temporary directory. Set the argument `working_directory` to "
+                "point this to a persistent path.",
+            ) from error
+
+        packmol_succeeded = result.decode("utf-8").find("Success!") > 0
+
+    if not packmol_succeeded:
+        raise PACKMOLRuntimeError(
+            "PACKMOL did not raise an error code, but 'Success!' not found in output. "
+            "Please raise an issue showing how you arrived at this error.",
+        )
+
+
 def _max_dist_between_points(points: Quantity) -> Quantity:
     """
     Compute the greatest distance between two points in the array.
@@ -0,0 +1,118 @@
+"""Integer index arrays relating the atoms, virtual sites, molecules, and particles of an Interchange."""
+
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+import numpy
+
+from openff.interchange.components.toolkit import _get_atom_molecule_indices
+from openff.interchange.models import VirtualSiteKey
+
+if TYPE_CHECKING:
+    from openff.interchange import Interchange
+
+
+class _TopologyIndices:
+    """
+    Index arrays relating the atoms, virtual sites, molecules, and particles of an Interchange, built in O(n).
+
+    Particles are atoms and virtual sites. Arrays over particles contain all atoms, in topology order, followed by
+    all virtual sites, in the order of the virtual site collection's key map. Virtual sites belong to the molecule
+    of their first orientation atom and, as in all exporters, are ordered by molecule and then by key map order.
+
+    Use ``Interchange._get_topology_indices``, which re-builds these arrays only if the topology or virtual sites
+    changed since they were last built.
+    """
+
+    def __init__(self, interchange: "Interchange"):
+        topology = interchange.topology
+
+        self.topology = topology
+        self.n_atoms = topology.n_atoms
+        self.n_molecules = topology.n_molecules
+
+        # atom index -> index of the molecule containing it
+        self.atom_molecule_indices = _get_atom_molecule_indices(topology)
+
+        # the atoms of molecule i are atoms molecule_atom_offsets[i] through molecule_atom_offsets[i + 1] - 1
+        self.molecule_atom_offsets = numpy.concatenate(
+            [[0], numpy.cumsum(numpy.bincount(self.atom_molecule_indices, minlength=self.n_molecules))],
+        ).astype(numpy.int64)
+
+        self.virtual_site_keys: tuple[VirtualSiteKey, ...] = (
+            tuple(interchange["VirtualSites"].key_map) if "VirtualSites" in interchange.collections else tuple()
+        )
+
+        n_virtual_sites = len(self.virtual_site_keys)
+
+        parent_atom_indices = numpy.fromiter(
+            (key.orientation_atom_indices[0] for key in self.virtual_site_keys),
+            dtype=numpy.int64,
+            count=n_virtual_sites,
+        )
+
+        # virtual site index (in key map order) -> index of the molecule containing it
+        self.virtual_site_molecule_indices = self.atom_molecule_indices[parent_atom_indices]
+
+        virtual_site_offsets = numpy.concatenate(
+            [[0], numpy.cumsum(numpy.bincount(self.virtual_site_molecule_indices, minlength=self.n_molecules))],
+        ).astype(numpy.int64)
+
+        # position of each virtual site among all virtual sites ordered by molecule
+        virtual_site_ranks = numpy.empty(n_virtual_sites, dtype=numpy.int64)
+        virtual_site_ranks[numpy.argsort(self.virtual_site_molecule_indices, kind="stable")] = numpy.arange(
+            n_virtual_sites,
+        )
+
+        # particle index when virtual sites follow all atoms
+        self.uncollated_particle_indices = numpy.concatenate(
+            [numpy.arange(self.n_atoms), self.n_atoms + virtual_site_ranks],
+        )
+
+        # particle index when virtual sites follow the atoms of their molecule
+        self.collated_particle_indices = numpy.concatenate(
+            [
+                numpy.arange(self.n_atoms) + virtual_site_offsets[self.atom_molecule_indices],
+                self.molecule_atom_offsets[self.virtual_site_molecule_indices + 1] + virtual_site_ranks,
+            ],
+        )
+
+    def is_current(self, interchange: "Interchange") -> bool:
+        """Return whether these arrays still describe the topology and virtual sites of an Interchange."""
+        if interchange.topology is not self.topology:
+            return False
+
+        if interchange.topology.n_atoms != self.n_atoms or interchange.topology.n_molecules != self.n_molecules:
+            return False
+
+        if "VirtualSites" in interchange.collections:
+            return tuple(interchange["VirtualSites"].key_map) == self.virtual_site_keys
+
+        return len(self.virtual_site_keys) == 0
+
+    @property
+    def molecule_virtual_site_map(self) -> defaultdict[int, list[VirtualSiteKey]]:
+        """Map the index of each molecule to the virtual site keys it contains."""
+        molecule_virtual_site_map: defaultdict[int, list[VirtualSiteKey]] = defaultdict(list)
+
+        for virtual_site_key, molecule_index in zip(
+            self.virtual_site_keys,
+            self.virtual_site_molecule_indices.tolist(),
+        ):
+            molecule_virtual_site_map[molecule_index].append(virtual_site_key)
+
+        return molecule_virtual_site_map
+
+    def get_particle_map(self, collate: bool = False) -> dict[int | VirtualSiteKey, int]:
+        """Map atom indices and virtual site keys to particle indices, ordered by particle index."""
+        particle_indices = self.collated_particle_indices if collate else self.uncollated_particle_indices
+
+        particles: list[int | VirtualSiteKey] = [*range(self.n_atoms), *self.virtual_site_keys]
+
+        return {
+            particles[index]: particle_index
+            for index, particle_index in zip(
+                numpy.argsort(particle_indices).tolist(),
+                numpy.sort(particle_indices).tolist(),
+            )
+        }
@@ -2,13 +2,13 @@
 
 import tempfile
 import warnings
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal, Union, overload
+from typing import TYPE_CHECKING, Any, Literal, Union, overload
 
 from openff.toolkit import Molecule, Quantity, Topology, unit
 from openff.utilities.utilities import has_package, requires_package
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from openff.interchange._annotations import (
     PositiveFloat,
@@ -25,7 +25,7 @@ from openff.interchange.common._valence import (
     ProperTorsionCollection,
 )
 from openff.interchange.components.mdconfig import MDConfig
-from openff.interchange.components.potentials import Collection, _AnnotatedCollections
+from openff.interchange.components.potentials import Collection, _AnnotatedCollections, _Cache
 from openff.interchange.exceptions import (
     MissingParameterHandlerError,
     MissingPositionsError,
@@ -44,11 +44,16 @@ from openff.interchange.smirnoff._gbsa import SMIRNOFFGBSACollection
 from openff.interchange.warnings import InterchangeDeprecationWarning
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
     import openmm
     import openmm.app
     from openff.toolkit import ForceField
 
+    from openff.interchange.components._topology_indices import _TopologyIndices
     from openff.interchange.foyer._guard import has_foyer
+    from openff.interchange.interop.gromacs.export._export import _MergedAtomTypes
+    from openff.interchange.smirnoff import SMIRNOFFParameterCache
 
     if has_foyer:
         try:
@@ -89,6 +94,18 @@ class Interchange(_BaseModel):
     positions: _PositionsQuantity | None = Field(None)  # Ditto
     velocities: _VelocityQuantity | None = Field(None)  # Ditto
 
+    # The state of each handler of the SMIRNOFF force field this was created or last updated with, and the options
+    # it was created with, which let `update_force_field` re-assign only what changed
+    _handler_states: dict[str, tuple] = PrivateAttr(default_factory=dict)
+    _smirnoff_options: dict[str, Any] = PrivateAttr(default_factory=dict)
+
+    # Index arrays relating atoms, virtual sites, molecules, and particles, re-built when the topology changes
+    _topology_indices: _Cache = PrivateAttr(default_factory=_Cache)
+
+    # The hash of the graphs of the topology's molecules, and the topology and its numbers of atoms, bonds, and
+    # molecules when they were last hashed
+    _topology_fingerprint: _Cache = PrivateAttr(default_factory=_Cache)
+
     @classmethod
     def from_smirnoff(
         cls,
@@ -99,6 +116,9 @@ class Interchange(_BaseModel):
         charge_from_molecules: list[Molecule] | None = None,
         partial_bond_orders_from_molecules: list[Molecule] | None = None,
         allow_nonintegral_charges: bool = False,
+        cache: Union["SMIRNOFFParameterCache", None] = None,
+        executor: Union["Executor", None] = None,
+        n_workers: int | None = None,
     ) -> "Interchange":
         """
         Create a new object by parameterizing a topology with a SMIRNOFF force field.
@@ -128,6 +148,19 @@ class Interchange(_BaseModel):
             instead of being determined by the force field.
         allow_nonintegral_charges : bool, optional, default=False
             If True, allow molecules to have approximately non-integral charges.
+        cache : `openff.interchange.smirnoff.SMIRNOFFParameterCache`, optional
+            If specified, parameter assignments (SMIRKS matches and partial charges) of each unique
+            molecule are looked up in, and stored to, this on-disk cache. Cached assignments are re-used
+            only for the same force field contents and the same (mapped) molecule.
+        executor : `concurrent.futures.Executor`, optional
+            If specified, partial charges from charge models (i.e. ``ToolkitAM1BCC`` and the base charges of
+            ``ChargeIncrementModel``) are computed concurrently for all unique molecules using this executor.
+            Results are assigned back to molecules independently of the order in which they finish.
+        n_workers : int, optional
+            If specified and greater than one, independent parametrization stages (i.e. bonds, angles, torsions,
+            vdW, and electrostatics) run concurrently in a thread pool of this many workers. If no ``executor``
+            is given, partial charges from charge models are also computed concurrently in a process pool of
+            this many workers.
 
         Notes
         -----
@@ -166,8 +199,131 @@ class Interchange(_BaseModel):
             molecules_with_preset_charges=charge_from_molecules,
             partial_bond_orders_from_molecules=partial_bond_orders_from_molecules,
             allow_nonintegral_charges=allow_nonintegral_charges,
+            cache=cache,
+            executor=executor,
+            n_workers=n_workers,
         )
 
+    @classmethod
+    def from_smirnoff_batch(
+        cls,
+        force_field: "ForceField",
+        topologies: Iterable[Topology | list[Molecule]],
+        charge_from_molecules: list[Molecule] | None = None,
+        partial_bond_orders_from_molecules: list[Molecule] | None = None,
+        allow_nonintegral_charges: bool = False,
+        cache: Union["SMIRNOFFParameterCache", None] = None,
+        n_workers: int | None = None,
+        max_pending: int | None = None,
+    ) -> Iterator[tuple[int, Union["Interchange", Exception]]]:
+        """
+        Create many new objects by parameterizing each of many topologies with the same SMIRNOFF force field.
+
+        The force field is validated and prepared only once, rather than once per topology. Failures are
+        reported per topology and do not stop the rest of the batch.
+
+        .. warning :: This API is experimental and subject to change.
+
+        Parameters
+        ----------
+        force_field : `openff.toolkit.ForceField`
+            The force field to parameterize the topologies with.
+        topologies : iterable of `openff.toolkit.Topology` or `list[openff.toolkit.Molecule]`
+            The topologies to parameterize, which are consumed lazily.
+        charge_from_molecules : `list[openff.toolkit.molecule.Molecule]`, optional
+            See ``Interchange.from_smirnoff``.
+        partial_bond_orders_from_molecules : list[openff.toolkit.molecule.Molecule], optional
+            See ``Interchange.from_smirnoff``.
+        allow_nonintegral_charges : bool, optional, default=False
+            See ``Interchange.from_smirnoff``.
+        cache : `openff.interchange.smirnoff.SMIRNOFFParameterCache`, optional
+            See ``Interchange.from_smirnoff``. A cache is shared by all topologies, including across processes.
+        n_workers : int, optional
+            If specified and greater than one, topologies are parameterized in a process pool of this many workers,
+            each of which loads the force field once. Otherwise, topologies are parameterized in order.
+        max_pending : int, optional
+            The maximum number of topologies submitted to the process pool but not yet yielded, which bounds memory
+            use. Defaults to twice ``n_workers``.
+
+        Yields
+        ------
+        index : int
+            The index of a topology in ``topologies``.
+        result : `openff.interchange.Interchange` or Exception
+            The object created from the topology, or the exception raised while trying to create it.
+
+        Notes
+        -----
+        When using a process pool, results are yielded in the order they finish, not the order of ``topologies``.
+
+        Examples
+        --------
+        .. code-block:: pycon
+
+            >>> from openff.toolkit import ForceField, Molecule
+            >>> sage = ForceField("openff-2.2.0.offxml")
+            >>> topologies = [Molecule.from_smiles(smiles).to_topology() for smiles in ["CCO", "c1ccccc1"]]
+            >>> for index, result in Interchange.from_smirnoff_batch(sage, topologies):
+            ...     if isinstance(result, Exception):
+            ...         print(f"Topology {index} failed: {result}")
+
+        """
+        from openff.interchange.smirnoff._create import _create_interchanges
+
+        yield from _create_interchanges(
+            force_field=force_field,
+            topologies=topologies,
+            molecules_with_preset_charges=charge_from_molecules,
+            partial_bond_orders_from_molecules=partial_bond_orders_from_molecules,
+            allow_nonintegral_charges=allow_nonintegral_charges,
+            cache=cache,
+            n_workers=n_workers,
+            max_pending=max_pending,
+        )
+
+    def update_force_field(self, force_field: "ForceField"):
+        """
+        Update this object in-place with the parameters of a (modified) SMIRNOFF force field.
+
+        Collections are only updated if their parameter handlers changed since this object was created from,
+        or last updated with, a force field. If only the values of parameters changed, new potentials are
+        assigned using the existing SMIRKS matches. If SMIRKS or other attributes of a handler changed,
+        parameters are matched anew. Charges, virtual sites, and plugins are always assigned anew if any
+        handler they depend on changed.
+
+        .. warning :: This API is experimental and subject to change.
+
+        Parameters
+        ----------
+        force_field : `openff.toolkit.ForceField`
+            The force field to update parameters from.
+
+        Notes
+        -----
+        If this object was not created by ``Interchange.from_smirnoff`` (i.e. it was created by another
+        method, combined, or deserialized), all collections are assigned anew from the force field, with
+        default options.
+
+        Options passed to ``Interchange.from_smirnoff``, like ``charge_from_molecules``, are re-used when
+        assigning collections anew.
+
+        Examples
+        --------
+        Update the force constant of a bond parameter without re-matching SMIRKS patterns
+
+        .. code-block:: pycon
+
+            >>> from openff.toolkit import ForceField, Molecule
+            >>> sage = ForceField("openff-2.2.0.offxml")
+            >>> interchange = sage.create_interchange(Molecule.from_smiles("CCO").to_topology())
+            >>> sage["Bonds"].parameters["[#6X4:1]-[#6X4:2]"].k *= 1.1
+            >>> interchange.update_force_field(sage)
+
+        """
+        from openff.interchange.smirnoff._create import _update_interchange
+
+        _update_interchange(self, force_field)
+
     def visualize(
         self,
         backend: str = "nglview",
@@ -332,6 +488,7 @@ class Interchange(_BaseModel):
         hydrogen_mass: PositiveFloat = 1.007947,
         monolithic: bool = True,
         _merge_atom_types: bool = False,
+        _merged_atom_types: "_MergedAtomTypes | None" = None,
     ):
         """
         Export this Interchange object to GROMACS files.
@@ -353,6 +510,9 @@ class Interchange(_BaseModel):
         _merge_atom_types: bool, default = False
             The flag to define behaviour of GROMACSWriter. If True, then similar atom types will be merged.
             If False, each atom will have its own atom type.
+        _merged_atom_types: _MergedAtomTypes, optional
+            A table of merged atom types to re-use and extend, i.e. when writing several systems that share
+            molecules. Only used if `_merge_atom_types=True`.
 
         Notes
         -----
@@ -371,7 +531,11 @@ class Interchange(_BaseModel):
             gro_file=prefix + ".gro",
         )
 
-        writer.to_top(monolithic=monolithic, _merge_atom_types=_merge_atom_types)
+        writer.to_top(
+            monolithic=monolithic,
+            _merge_atom_types=_merge_atom_types,
+            _merged_atom_types=_merged_atom_types,
+        )
         writer.to_gro(decimal=decimal)
 
         self.to_mdp(prefix + "_pointenergy.mdp")
@@ -407,6 +571,7 @@ class Interchange(_BaseModel):
         hydrogen_mass: PositiveFloat = 1.007947,
         monolithic: bool = True,
         _merge_atom_types: bool = False,
+        _merged_atom_types: "_MergedAtomTypes | None" = None,
     ):
         """
         Export this Interchange to a GROMACS topology file.
@@ -425,6 +590,9 @@ class Interchange(_BaseModel):
         _merge_atom_types: book, default=False
             The flag to define behaviour of GROMACSWriter. If True, then similar atom types will be merged.
             If False, each atom will have its own atom type.
+        _merged_atom_types: _MergedAtomTypes, optional
+            A table of merged atom types to re-use and extend, i.e. when writing several systems that share
+            molecules. Only used if `_merge_atom_types=True`.
 
         Notes
         -----
@@ -442,6 +610,7 @@ class Interchange(_BaseModel):
         ).to_top(
             monolithic=monolithic,
             _merge_atom_types=_merge_atom_types,
+            _merged_atom_types=_merged_atom_types,
         )
 
     def to_gro(self, file_path: Path | str, decimal: int = 3):
@@ -955,6 +1124,17 @@ class Interchange(_BaseModel):
             box_vectors=box_vectors,
         )
 
+    def _get_topology_indices(self) -> "_TopologyIndices":
+        """Get index arrays relating atoms, virtual sites, molecules, and particles, re-building them if stale."""
+        from openff.interchange.components._topology_indices import _TopologyIndices
+
+        cache = self._topology_indices
+
+        if cache.value is None or not cache.value.is_current(self):
+            cache.value = _TopologyIndices(self)
+
+        return cache.value
+
     def _get_parameters(self, handler_name: str, atom_indices: tuple[int]) -> dict:
         """
         Get parameter values of a specific potential.
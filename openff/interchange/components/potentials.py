@@ -2,6 +2,7 @@
 
 import ast
 import json
+from collections.abc import Iterator, Mapping, MutableMapping
 from typing import TYPE_CHECKING, Annotated, Any, TypeAlias
 
 import numpy
@@ -14,14 +15,19 @@ from pydantic import (
     ValidationInfo,
     ValidatorFunctionWrapHandler,
     WrapSerializer,
+    field_validator,
 )
 from pydantic.functional_validators import WrapValidator
 
 from openff.interchange._annotations import _Quantity
 from openff.interchange.exceptions import MissingParametersError
 from openff.interchange.models import (
+    AngleKey,
+    BondKey,
+    ImproperTorsionKey,
     LibraryChargeTopologyKey,
     PotentialKey,
+    ProperTorsionKey,
     TopologyKey,
 )
 from openff.interchange.pydantic import _BaseModel
@@ -35,12 +41,164 @@ else:
     Array: TypeAlias = ArrayLike
 
 
+class _Revision:
+    """A counter of changes to the contents of a collection."""
+
+    def __init__(self):
+        self.value = 0
+
+    def __eq__(self, other) -> bool:
+        # only used to invalidate caches, so it should not make otherwise equal collections compare unequal
+        return isinstance(other, _Revision)
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+class _Cache:
+    """
+    A value derived from the contents of a model, stored alongside the state it was derived from.
+
+    Like revisions, caches compare equal to each other, so that models differing only in what they have cached
+    still compare equal.
+    """
+
+    def __init__(self):
+        self.state: Any = None
+        self.value: Any = None
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, _Cache)
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+class _Tracked:
+    """A container which counts changes to its contents in the revisions of the collections holding it."""
+
+    _revisions: tuple[_Revision, ...] = tuple()
+
+    def _link(self, revisions: tuple[_Revision, ...]):
+        for revision in revisions:
+            if not any(linked is revision for linked in self._revisions):
+                self._revisions = (*self._revisions, revision)
+
+    def _bump(self):
+        for revision in self._revisions:
+            revision.value += 1
+
+
+class _TrackedDict(_Tracked, dict):
+    """
+    A dictionary which counts changes to its contents.
+
+    Setting items one at a time costs a Python-level call per item, so hot loops should fill a plain dictionary and
+    add it with `update`, which counts as one change.
+    """
+
+    def __setitem__(self, key, value):
+        dict.__setitem__(self, key, value)
+
+        # inlined, since this is called for each key when populating key maps
+        for revision in self._revisions:
+            revision.value += 1
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._bump()
+
+    def pop(self, *args):
+        """Remove a key and return its value."""
+        value = super().pop(*args)
+        self._bump()
+        return value
+
+    def popitem(self):
+        """Remove and return the last inserted pair."""
+        item = super().popitem()
+        self._bump()
+        return item
+
+    def clear(self):
+        """Remove all items."""
+        super().clear()
+        self._bump()
+
+    def update(self, *args, **kwargs):
+        """Add or replace items from a mapping or iterable of pairs."""
+        super().update(*args, **kwargs)
+        self._bump()
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def setdefault(self, key, default=None):
+        """Return the value of a key, inserting a default if it is not present."""
+        if key not in self:
+            self[key] = default
+
+        return self[key]
+
+
+class _TrackedPotentials(_TrackedDict):
+    """A dictionary of potentials which also counts changes to the parameters of the potentials it holds."""
+
+    def _link(self, revisions: tuple[_Revision, ...]):
+        super()._link(revisions)
+
+        for potential in self.values():
+            _link_potential(potential, self._revisions)
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        _link_potential(value, self._revisions)
+
+    def update(self, *args, **kwargs):
+        """Add or replace potentials from a mapping or iterable of pairs."""
+        other = dict(*args, **kwargs)
+
+        super().update(other)
+
+        for potential in other.values():
+            _link_potential(potential, self._revisions)
+
+
+def _link_potential(potential: "Potential | WrappedPotential", revisions: tuple[_Revision, ...]):
+    """Count changes to the parameters of a potential, or of each potential it wraps, in some revisions."""
+    if isinstance(potential, WrappedPotential):
+        for inner in potential._inner_data:
+            _link_potential(inner, revisions)
+
+    elif isinstance(potential, Potential):
+        if type(potential.parameters) is dict:
+            # created without validation
+            potential.__dict__["parameters"] = _TrackedDict(potential.parameters)
+
+        if isinstance(potential.parameters, _Tracked):
+            potential.parameters._link(revisions)
+
+
 class Potential(_BaseModel):
     """Base class for storing applied parameters."""
 
     parameters: dict[str, _Quantity] = Field(dict())
     map_key: int | None = None
 
+    @field_validator("parameters", mode="after")
+    @classmethod
+    def _track_parameters(cls, value: dict[str, Quantity]) -> dict[str, Quantity]:
+        return _TrackedDict(value)
+
+    def __setattr__(self, name: str, value: Any):
+        revisions = getattr(self.parameters, "_revisions", tuple())
+
+        super().__setattr__(name, value)
+
+        _link_potential(self, revisions)
+
+        for revision in revisions:
+            revision.value += 1
+
     def __hash__(self) -> int:
         return hash(tuple(self.parameters.values()))
 
@@ -109,7 +267,10 @@ def validate_key_map(v: Any, handler, info) -> dict:
         SingleAtomChargeTopologyKey,
     )
 
-    tmp = dict()
+    if isinstance(v, ColumnarKeyMap):
+        return v
+
+    tmp = _TrackedDict()
     if info.mode in ("json", "python"):
         for key, val in v.items():
             val_dict = json.loads(val)
@@ -180,18 +341,25 @@ def validate_potential_dict(
     info: ValidationInfo,
 ):
     """Validate the parameters field of a Potential object."""
+    if isinstance(v, ColumnarPotentials):
+        return v
+
     if info.mode == "json":
-        return {PotentialKey.model_validate_json(key): Potential.model_validate_json(val) for key, val in v.items()}
+        return _TrackedPotentials(
+            {PotentialKey.model_validate_json(key): Potential.model_validate_json(val) for key, val in v.items()},
+        )
 
     elif info.mode == "python":
         # Unclear why str sometimes sneak into here in Python mode; everything
         # should be object (PotentialKey/Potential) or dict at this point ...
-        return {
-            PotentialKey.model_validate_json(key) if isinstance(key, str) else key: (
-                Potential.model_validate_json(val) if isinstance(val, str) else val
-            )
-            for key, val in v.items()
-        }
+        return _TrackedPotentials(
+            {
+                PotentialKey.model_validate_json(key) if isinstance(key, str) else key: (
+                    Potential.model_validate_json(val) if isinstance(val, str) else val
+                )
+                for key, val in v.items()
+            },
+        )
 
     else:
         raise NotImplementedError(f"Validation mode {info.mode} not implemented.")
@@ -217,6 +385,355 @@ Potentials = Annotated[
 ]
 
 
+# Topology key classes whose fields can be stored in columns, and which optional fields they have
+_COLUMNAR_KEY_FIELDS: dict[type[TopologyKey], tuple[str, ...]] = {
+    TopologyKey: (),
+    BondKey: ("bond_order",),
+    AngleKey: (),
+    ProperTorsionKey: ("mult", "phase", "bond_order"),
+    ImproperTorsionKey: ("mult", "phase", "bond_order"),
+}
+
+
+class ColumnarKeyMap(_Tracked, MutableMapping):
+    """
+    A mapping between topology keys and potential keys stored in arrays.
+
+    Atom indices of each term are stored in an integer array of shape (n_terms, n_atoms_per_term) and the potential
+    key of each term as an index into a list of unique potential keys. Optional fields of topology keys are stored
+    in columns, with -1 (`mult`) or NaN (`phase`, `bond_order`) representing `None`. Topology keys are only created
+    when accessed, so iterating over `atom_indices` and `potential_indices` directly avoids creating Python objects.
+
+    Looking up a key builds an index of all keys on first use. Adding new keys copies the arrays, so it is best to
+    create this from a populated mapping with `from_mapping`.
+    """
+
+    def __init__(
+        self,
+        key_class: type[TopologyKey],
+        atom_indices: numpy.ndarray,
+        potential_indices: numpy.ndarray,
+        potential_keys: list[PotentialKey],
+        columns: dict[str, numpy.ndarray] | None = None,
+    ):
+        self.key_class = key_class
+        self.atom_indices = atom_indices
+        self.potential_indices = potential_indices
+        self.potential_keys = potential_keys
+        self.columns = dict() if columns is None else columns
+
+        self._index: dict[tuple, int] | None = None
+        self._potential_key_indices = {key: index for index, key in enumerate(potential_keys)}
+
+    @classmethod
+    def from_mapping(cls, key_map: Mapping) -> "ColumnarKeyMap":
+        """
+        Create from a mapping between topology keys and potential keys.
+
+        Raises a ValueError if keys are not all of the same supported class and number of atoms.
+        """
+        key_classes = {type(key) for key in key_map}
+
+        if len(key_classes) != 1 or not key_classes.issubset(_COLUMNAR_KEY_FIELDS):
+            raise ValueError(f"Cannot store keys of type(s) {key_classes} in columns.")
+
+        key_class = key_classes.pop()
+
+        if len({len(key.atom_indices) for key in key_map}) != 1:
+            raise ValueError("Cannot store keys with different numbers of atoms in columns.")
+
+        potential_key_indices: dict[PotentialKey, int] = dict()
+
+        potential_indices = numpy.fromiter(
+            (potential_key_indices.setdefault(value, len(potential_key_indices)) for value in key_map.values()),
+            dtype=numpy.int32,
+            count=len(key_map),
+        )
+
+        columns = dict()
+
+        for field in _COLUMNAR_KEY_FIELDS[key_class]:
+            values = [getattr(key, field) for key in key_map]
+
+            if field == "mult":
+                columns[field] = numpy.array([-1 if value is None else value for value in values], dtype=numpy.int32)
+            else:
+                columns[field] = numpy.array(
+                    [numpy.nan if value is None else value for value in values],
+                    dtype=numpy.float64,
+                )
+
+        return cls(
+            key_class=key_class,
+            atom_indices=numpy.array([key.atom_indices for key in key_map], dtype=numpy.int32),
+            potential_indices=potential_indices,
+            potential_keys=[*potential_key_indices],
+            columns=columns,
+        )
+
+    def _keys(self) -> Iterator[TopologyKey]:
+        columns = {field: column.tolist() for field, column in self.columns.items()}
+
+        for row, atom_indices in enumerate(self.atom_indices.tolist()):
+            fields: dict[str, Any] = {"atom_indices": tuple(atom_indices)}
+
+            for field, column in columns.items():
+                value = column[row]
+
+                if field == "mult":
+                    fields[field] = None if value == -1 else value
+                else:
+                    fields[field] = None if value != value else value
+
+            # these fields were validated when this mapping was populated
+            yield self.key_class.model_construct(**fields)
+
+    def _get_index(self) -> dict[tuple, int]:
+        if self._index is None:
+            self._index = {key._tuple(): row for row, key in enumerate(self._keys())}
+
+        return self._index
+
+    @staticmethod
+    def _lookup(key) -> tuple:
+        return key._tuple() if isinstance(key, TopologyKey) else key
+
+    def __getitem__(self, key) -> PotentialKey:
+        return self.potential_keys[self.potential_indices[self._get_index()[self._lookup(key)]]]
+
+    def __setitem__(self, key: TopologyKey, value: PotentialKey):
+        if value not in self._potential_key_indices:
+            self._potential_key_indices[value] = len(self.potential_keys)
+            self.potential_keys.append(value)
+
+        self._bump()
+
+        index = self._get_index()
+        row = index.get(self._lookup(key))
+
+        if row is not None:
+            self.potential_indices[row] = self._potential_key_indices[value]
+            return
+
+        if type(key) is not self.key_class:
+            raise ValueError(f"Cannot add key of type {type(key)} to columns of {self.key_class}.")
+
+        index[self._lookup(key)] = len(self.potential_indices)
+
+        self.atom_indices = numpy.vstack([self.atom_indices, numpy.array([key.atom_indices], dtype=numpy.int32)])
+        self.potential_indices = numpy.append(self.potential_indices, self._potential_key_indices[value])
+
+        for field, column in self.columns.items():
+            field_value = getattr(key, field)
+
+            if field_value is None:
+                field_value = -1 if field == "mult" else numpy.nan
+
+            self.columns[field] = numpy.append(column, numpy.array([field_value], dtype=column.dtype))
+
+    def __delitem__(self, key):
+        row = self._get_index()[self._lookup(key)]
+
+        self.atom_indices = numpy.delete(self.atom_indices, row, axis=0)
+        self.potential_indices = numpy.delete(self.potential_indices, row)
+        self.columns = {field: numpy.delete(column, row) for field, column in self.columns.items()}
+
+        self._index = None
+        self._bump()
+
+    def __iter__(self) -> Iterator[TopologyKey]:
+        return self._keys()
+
+    def __len__(self) -> int:
+        return len(self.potential_indices)
+
+    def __contains__(self, key) -> bool:
+        return self._lookup(key) in self._get_index()
+
+    def values(self):  # type: ignore[override]
+        """Return the potential key of each term, without creating topology keys."""
+        return [self.potential_keys[index] for index in self.potential_indices.tolist()]
+
+    def items(self):  # type: ignore[override]
+        """Iterate over pairs of topology keys and potential keys, without building an index of keys."""
+        return zip(self._keys(), self.values())
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__} with {len(self)} keys of type {self.key_class.__name__}"
+
+
+class _ColumnarParameters(dict):
+    """
+    The parameters of one potential stored in columns, which writes changes of parameter values back to the columns.
+
+    Parameters can not be added or removed, since all potentials stored in the same columns share parameters.
+    """
+
+    def __init__(self, potentials: "ColumnarPotentials", key: PotentialKey):
+        row = potentials._rows[key]
+
+        super().__init__(
+            {
+                name: Quantity(float(column[row]), potentials.units[name])
+                for name, column in potentials.parameters.items()
+            },
+        )
+
+        self._potentials = potentials
+        self._key = key
+
+    def __setitem__(self, name: str, value: Quantity):
+        if name not in self:
+            raise ValueError(f"Cannot add parameter {name} to potentials stored in columns.")
+
+        self._potentials._set_value(self._key, name, value)
+
+        super().__setitem__(name, value)
+
+    def update(self, *args, **kwargs):
+        """Set the values of existing parameters, writing them back to the columns."""
+        for name, value in dict(*args, **kwargs).items():
+            self[name] = value
+
+    def __ior__(self, other):
+        self.update(other)
+
+        return self
+
+    def _not_supported(self, *args, **kwargs):
+        raise ValueError("Cannot remove parameters from potentials stored in columns.")
+
+    __delitem__ = pop = popitem = clear = _not_supported  # type: ignore[assignment]
+
+    def setdefault(self, name: str, default: Quantity | None = None) -> Quantity:
+        """Return the value of an existing parameter; parameters can not be added."""
+        if name not in self:
+            raise ValueError(f"Cannot add parameter {name} to potentials stored in columns.")
+
+        return self[name]
+
+    def __reduce__(self):
+        # copies are detached from the columns
+        return dict, (dict(self),)
+
+
+class ColumnarPotentials(_Tracked, MutableMapping):
+    """
+    A mapping between potential keys and potentials stored in arrays.
+
+    The value of each parameter is stored in a float array with one element per potential, with units stored once
+    per parameter. Potentials are only created when accessed. All potentials must have the same parameters.
+
+    Setting a parameter value of a potential returned by this mapping, i.e.
+    ``potentials[key].parameters["k"] = ...``, writes the value back to the columns. Assigning a new dictionary of
+    parameters to a returned potential does not; assign the potential back to this mapping instead.
+    """
+
+    def __init__(
+        self,
+        potential_keys: list[PotentialKey],
+        parameters: dict[str, numpy.ndarray],
+        units: dict[str, Any],
+    ):
+        self.potential_keys = potential_keys
+        self.parameters = parameters
+        self.units = units
+
+        self._rows = {key: row for row, key in enumerate(potential_keys)}
+
+    @classmethod
+    def from_mapping(cls, potentials: Mapping) -> "ColumnarPotentials":
+        """
+        Create from a mapping between potential keys and potentials.
+
+        Raises a ValueError if potentials are wrapped or do not all have the same parameters.
+        """
+        if any(type(potential) is not Potential or potential.map_key is not None for potential in potentials.values()):
+            raise ValueError("Cannot store wrapped potentials or potentials with map keys in columns.")
+
+        if len({tuple(potential.parameters) for potential in potentials.values()}) > 1:
+            raise ValueError("Cannot store potentials with different parameters in columns.")
+
+        potential_keys = [*potentials]
+
+        if len(potential_keys) == 0:
+            return cls(potential_keys=list(), parameters=dict(), units=dict())
+
+        units = {name: value.units for name, value in potentials[potential_keys[0]].parameters.items()}
+
+        return cls(
+            potential_keys=potential_keys,
+            parameters={
+                name: numpy.array(
+                    [potentials[key].parameters[name].m_as(unit) for key in potential_keys],
+                    dtype=numpy.float64,
+                )
+                for name, unit in units.items()
+            },
+            units=units,
+        )
+
+    def __getitem__(self, key: PotentialKey) -> Potential:
+        # the values were validated when this mapping was populated
+        return Potential.model_construct(parameters=_ColumnarParameters(self, key))
+
+    def _set_value(self, key: PotentialKey, name: str, value: Quantity):
+        """Set the value of one parameter of one potential."""
+        self.parameters[name][self._rows[key]] = value.m_as(self.units[name])
+        self._bump()
+
+    def __setitem__(self, key: PotentialKey, potential: Potential):
+        if type(potential) is not Potential or potential.map_key is not None:
+            raise ValueError("Cannot store wrapped potentials or potentials with map keys in columns.")
+
+        if len(self.potential_keys) == 0:
+            self.units = {name: value.units for name, value in potential.parameters.items()}
+            self.parameters = {name: numpy.empty(0, dtype=numpy.float64) for name in self.units}
+
+        if set(potential.parameters) != set(self.parameters):
+            raise ValueError(f"Cannot store potential with parameters {[*potential.parameters]} in these columns.")
+
+        self._bump()
+
+        row = self._rows.get(key)
+
+        if row is None:
+            self._rows[key] = len(self.potential_keys)
+            self.potential_keys.append(key)
+
+            for name, column in self.parameters.items():
+                self.parameters[name] = numpy.append(column, potential.parameters[name].m_as(self.units[name]))
+
+        else:
+            for name, column in self.parameters.items():
+                column[row] = potential.parameters[name].m_as(self.units[name])
+
+    def __delitem__(self, key: PotentialKey):
+        row = self._rows[key]
+
+        del self.potential_keys[row]
+        self.parameters = {name: numpy.delete(column, row) for name, column in self.parameters.items()}
+
+        self._rows = {key: row for row, key in enumerate(self.potential_keys)}
+        self._bump()
+
+    def __iter__(self) -> Iterator[PotentialKey]:
+        return iter(self.potential_keys)
+
+    def __len__(self) -> int:
+        return len(self.potential_keys)
+
+    def __contains__(self, key) -> bool:
+        return key in self._rows
+
+    def get_rows(self, potential_keys: list[PotentialKey]) -> numpy.ndarray:
+        """Return the rows of the parameter arrays associated with some potential keys."""
+        return numpy.array([self._rows[key] for key in potential_keys], dtype=numpy.int32)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__} with {len(self)} potentials and parameters {[*self.parameters]}"
+
+
 class Collection(_BaseModel):
     """Base class for storing parametrized force field data."""
 
@@ -238,6 +755,114 @@ class Collection(_BaseModel):
         description="A mapping between PotentialKey objects and Potential objects.",
     )
 
+    # Counts changes to the fields of this collection, including in-place changes to its key map, its potentials,
+    # and their parameters, so that values derived from its contents can be cached until it changes
+    _revision: _Revision = PrivateAttr(default_factory=_Revision)
+
+    # The hash of the contents of this collection, and its name and revision when they were last hashed
+    _fingerprint: _Cache = PrivateAttr(default_factory=_Cache)
+
+    def model_post_init(self, __context: Any):
+        self._track()
+
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+
+        if name in type(self).model_fields:
+            self._track()
+            self._revision.value += 1
+
+    def _track(self):
+        """Count changes to the contents of the dictionaries, key map, and potentials of this collection."""
+        for name in type(self).model_fields:
+            value = self.__dict__.get(name)
+
+            if type(value) is dict:
+                value = _TrackedPotentials(value) if name == "potentials" else _TrackedDict(value)
+                self.__dict__[name] = value
+
+            if isinstance(value, _Tracked):
+                value._link((self._revision,))
+
+    def compact(self):
+        """
+        Store the key map and potentials of this collection in arrays, in-place.
+
+        This uses much less memory for large topologies. The key map and potentials keep their dict-like interfaces,
+        but create keys and potentials only when accessed. A key map is only compacted if all of its keys are of the
+        same type (one of `TopologyKey`, `BondKey`, `AngleKey`, `ProperTorsionKey`, or `ImproperTorsionKey`) and
+        number of atoms, and potentials are only compacted if none are wrapped and all have the same parameters;
+        otherwise, each is kept as a dictionary.
+
+        .. warning :: This API is experimental and subject to change.
+        """
+        if len(self.key_map) > 0 and not isinstance(self.key_map, ColumnarKeyMap):
+            try:
+                self.key_map = ColumnarKeyMap.from_mapping(self.key_map)
+            except ValueError:
+                pass
+
+        if len(self.potentials) > 0 and not isinstance(self.potentials, ColumnarPotentials):
+            try:
+                self.potentials = ColumnarPotentials.from_mapping(self.potentials)
+            except ValueError:
+                pass
+
+    def _get_arrays(
+        self,
+        key_class: type[TopologyKey] | None = None,
+    ) -> tuple[numpy.ndarray, numpy.ndarray, list[PotentialKey]]:
+        """
+        Return the atom indices of each term, the index of each term's potential key, and the unique potential keys.
+
+        If `key_class` is given, only terms with topology keys of exactly this type are included, i.e. the atoms,
+        but not the virtual sites, of a non-bonded collection. If the key map of this collection is compacted, its
+        arrays are returned directly; otherwise, they are built in one pass over the key map. Atom indices are of
+        shape (n_terms, n_atoms_per_term), so all included terms must have the same number of atoms.
+        """
+        if isinstance(self.key_map, ColumnarKeyMap):
+            if key_class is None or key_class is self.key_map.key_class:
+                return self.key_map.atom_indices, self.key_map.potential_indices, self.key_map.potential_keys
+
+            return numpy.empty((0, 0), dtype=numpy.int32), numpy.empty(0, dtype=numpy.int32), list()
+
+        items = (
+            self.key_map.items()
+            if key_class is None
+            else [(key, value) for key, value in self.key_map.items() if type(key) is key_class]
+        )
+
+        if len(items) == 0:
+            return numpy.empty((0, 0), dtype=numpy.int32), numpy.empty(0, dtype=numpy.int32), list()
+
+        potential_key_indices: dict[PotentialKey, int] = dict()
+
+        atom_indices = numpy.array([key.atom_indices for key, _ in items], dtype=numpy.int32)
+        potential_indices = numpy.fromiter(
+            (potential_key_indices.setdefault(value, len(potential_key_indices)) for _, value in items),
+            dtype=numpy.int32,
+            count=len(items),
+        )
+
+        return atom_indices.reshape(len(items), -1), potential_indices, [*potential_key_indices]
+
+    def _get_parameter_arrays(self, potential_keys: list[PotentialKey]) -> dict[str, Quantity]:
+        """
+        Return the value of each parameter of some potentials, as one array (with units) per parameter.
+
+        If the potentials of this collection are compacted, their columns are used directly. Raises a ValueError if
+        the potentials are wrapped or do not all have the same parameters.
+        """
+        potentials = (
+            self.potentials
+            if isinstance(self.potentials, ColumnarPotentials)
+            else ColumnarPotentials.from_mapping({key: self.potentials[key] for key in potential_keys})
+        )
+
+        rows = potentials.get_rows(potential_keys)
+
+        return {name: Quantity(column[rows], potentials.units[name]) for name, column in potentials.parameters.items()}
+
     @property
     def independent_variables(self) -> set[str]:
         """
@@ -293,7 +918,10 @@ class Collection(_BaseModel):
                 parameter_units = potential.parameters[parameter_key].units
                 modified_parameter = new_p[potential_index, parameter_index]  # type: ignore
 
-                self.potentials[potential_key].parameters[parameter_key] = modified_parameter * parameter_units
+                potential.parameters[parameter_key] = modified_parameter * parameter_units
+
+            # re-assign, rather than only modify, in case potentials are not stored as objects
+            self.potentials[potential_key] = potential
 
     def get_system_parameters(
         self,
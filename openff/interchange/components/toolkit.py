@@ -1,7 +1,8 @@
 """Utilities for processing and interfacing with the OpenFF Toolkit."""
 
+import itertools
 from functools import lru_cache
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, NamedTuple, Union
 
 import networkx
 import numpy
@@ -77,6 +78,154 @@ def _get_14_pairs(topology_or_molecule: Union["Topology", "Molecule"]):
                         yield (atom_i_partner, atom_j_partner)
 
 
+class _BondedPairs(NamedTuple):
+    """
+    Pairs of atoms separated by one, two, or three bonds, as arrays of shape (n_pairs, 2).
+
+    Each pair is listed once with the lower atom index first, rows are sorted, and a pair is only
+    included at its shortest separation, i.e. a pair in a four-membered ring is a 1-2 pair, not a 1-4 pair.
+    """
+
+    pairs_12: numpy.ndarray
+    pairs_13: numpy.ndarray
+    pairs_14: numpy.ndarray
+
+    @property
+    def excluded_pairs(self) -> numpy.ndarray:
+        """All 1-2, 1-3, and 1-4 pairs, sorted."""
+        return _sort_pairs(numpy.concatenate([self.pairs_12, self.pairs_13, self.pairs_14]))
+
+
+def _sort_pairs(pairs: numpy.ndarray) -> numpy.ndarray:
+    """Put the lower index of each pair first, then sort and de-duplicate the rows."""
+    pairs = numpy.sort(pairs.reshape(-1, 2), axis=1)
+
+    return numpy.unique(pairs, axis=0) if len(pairs) > 0 else pairs
+
+
+def _extend_walks(
+    walks: numpy.ndarray,
+    indptr: numpy.ndarray,
+    neighbors: numpy.ndarray,
+) -> numpy.ndarray:
+    """Extend each walk by every neighbor of its last atom, skipping walks that immediately turn back."""
+    last = walks[:, -1]
+    counts = indptr[last + 1] - indptr[last]
+
+    # position of each new step within the neighbor list of the last atom of its walk
+    offsets = numpy.arange(counts.sum()) - numpy.repeat(numpy.cumsum(counts) - counts, counts)
+
+    extended = numpy.column_stack(
+        [
+            numpy.repeat(walks, counts, axis=0),
+            neighbors[numpy.repeat(indptr[last], counts) + offsets],
+        ],
+    )
+
+    return extended[extended[:, -1] != extended[:, -3]]
+
+
+def _difference(pairs: numpy.ndarray, others: numpy.ndarray, n_atoms: int) -> numpy.ndarray:
+    """Return the rows of sorted pairs that are not in another array of sorted pairs."""
+    return pairs[~numpy.isin(pairs[:, 0] * n_atoms + pairs[:, 1], others[:, 0] * n_atoms + others[:, 1])]
+
+
+@lru_cache(maxsize=1024)
+def _get_bonded_pairs_from_bonds(n_atoms: int, bonds: bytes) -> _BondedPairs:
+    """Enumerate 1-2, 1-3, and 1-4 pairs from a (serialized) array of bonds using a sparse adjacency graph."""
+    bond_array = numpy.frombuffer(bonds, dtype=numpy.int64).reshape(-1, 2)
+
+    # compressed sparse row adjacency; the neighbors of atom i are neighbors[indptr[i]:indptr[i + 1]]
+    edges = numpy.concatenate([bond_array, bond_array[:, ::-1]])
+    edges = edges[numpy.argsort(edges[:, 0], kind="stable")]
+
+    indptr = numpy.zeros(n_atoms + 1, dtype=numpy.int64)
+    numpy.cumsum(numpy.bincount(edges[:, 0], minlength=n_atoms), out=indptr[1:])
+    neighbors = edges[:, 1]
+
+    walks_3 = _extend_walks(edges, indptr, neighbors)
+    walks_4 = _extend_walks(walks_3, indptr, neighbors)
+
+    pairs_12 = _sort_pairs(bond_array)
+
+    pairs_13 = _sort_pairs(walks_3[:, [0, 2]])
+    pairs_13 = _difference(pairs_13[pairs_13[:, 0] != pairs_13[:, 1]], pairs_12, n_atoms)
+
+    pairs_14 = _sort_pairs(walks_4[:, [0, 3]])
+    pairs_14 = _difference(pairs_14[pairs_14[:, 0] != pairs_14[:, 1]], pairs_12, n_atoms)
+    pairs_14 = _difference(pairs_14, pairs_13, n_atoms)
+
+    for pairs in (pairs_12, pairs_13, pairs_14):
+        pairs.setflags(write=False)
+
+    return _BondedPairs(pairs_12, pairs_13, pairs_14)
+
+
+def _get_bond_array(molecule: Union["Molecule", "_SimpleMolecule"]) -> numpy.ndarray:
+    """Return the (molecule) atom indices of each bond in a molecule as an array of shape (n_bonds, 2)."""
+    return numpy.asarray(
+        [(molecule.atom_index(bond.atom1), molecule.atom_index(bond.atom2)) for bond in molecule.bonds],
+        dtype=numpy.int64,
+    ).reshape(-1, 2)
+
+
+def _get_bonded_pairs(topology_or_molecule: Union["Topology", "Molecule"]) -> _BondedPairs:
+    """
+    Return the pairs of atoms separated by one, two, or three bonds in a topology or molecule.
+
+    Pairs are enumerated once per unique molecule (and cached by the bond graph) and then replicated onto each
+    duplicate molecule via the atom maps of `Topology.identical_molecule_groups`, so the cost scales with the
+    number of bonds in unique molecules.
+    """
+    if not isinstance(topology_or_molecule, Topology):
+        return _get_bonded_pairs_from_bonds(
+            topology_or_molecule.n_atoms,
+            _get_bond_array(topology_or_molecule).tobytes(),
+        )
+
+    topology = topology_or_molecule
+
+    atom_offsets = list(
+        itertools.accumulate(
+            (molecule.n_atoms for molecule in topology.molecules),
+            initial=0,
+        ),
+    )
+
+    collected: tuple[list[numpy.ndarray], list[numpy.ndarray], list[numpy.ndarray]] = ([], [], [])
+
+    for unique_molecule_index, group in topology.identical_molecule_groups.items():
+        unique_molecule = topology.molecule(unique_molecule_index)
+        unique_pairs = _get_bonded_pairs(unique_molecule)
+
+        for duplicate_molecule_index, atom_map in group:
+            topology_indices = atom_offsets[duplicate_molecule_index] + numpy.asarray(
+                [atom_map[index] for index in range(unique_molecule.n_atoms)],
+                dtype=numpy.int64,
+            )
+
+            for pairs, unique in zip(collected, unique_pairs):
+                pairs.append(topology_indices[unique])
+
+    return _BondedPairs(
+        *(
+            _sort_pairs(numpy.concatenate(pairs)) if pairs else numpy.empty((0, 2), dtype=numpy.int64)
+            for pairs in collected
+        ),
+    )
+
+
+def _get_atom_molecule_indices(topology: "Topology") -> numpy.ndarray:
+    """Get the index of the molecule containing each atom in a topology."""
+    n_atoms_per_molecule = numpy.fromiter(
+        (molecule.n_atoms for molecule in topology.molecules),
+        dtype=numpy.int64,
+        count=topology.n_molecules,
+    )
+
+    return numpy.repeat(numpy.arange(topology.n_molecules), n_atoms_per_molecule)
+
+
 def _validated_list_to_array(validated_list: "ValidatedList") -> Quantity:
     unit_ = validated_list[0].units
     return Quantity(numpy.asarray([val.m for val in validated_list]), unit_)
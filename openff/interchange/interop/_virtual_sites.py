@@ -2,7 +2,8 @@
 Common helpers for exporting virtual sites.
 """
 
-from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from itertools import islice
 
 import numpy
 from openff.toolkit import Quantity, unit
@@ -32,26 +33,19 @@ def _virtual_site_parent_molecule_mapping(
         A dictionary mapping virtual site keys to the index of the molecule they belong to.
 
     """
-    mapping: dict[VirtualSiteKey, int] = dict()
+    indices = interchange._get_topology_indices()
 
-    if "VirtualSites" not in interchange.collections:
-        return mapping
-
-    # TODO: This implicitly assumes the ordering of virtual sites is defined by
-    # how they are presented in the iterator; this may cause problems when a
-    # molecule (a large ligand? polymer?) has many virtual sites
-    for virtual_site_key in interchange["VirtualSites"].key_map:
-        assert isinstance(virtual_site_key, VirtualSiteKey)
-
-        parent_atom_index = virtual_site_key.orientation_atom_indices[0]
+    return dict(zip(indices.virtual_site_keys, indices.virtual_site_molecule_indices.tolist()))
 
-        parent_atom = interchange.topology.atom(parent_atom_index)
 
-        parent_molecule = parent_atom.molecule
+def _get_uncollated_to_collated_mapping(interchange: Interchange) -> list[int]:
+    """Get the index of each particle, in collated order, in the uncollated order of particles."""
+    indices = interchange._get_topology_indices()
 
-        mapping[virtual_site_key] = interchange.topology.molecule_index(parent_molecule)
-
-    return mapping
+    # for i.e. a 4-site water dimer, the uncollated particle indices would be [0, 1, 2, 3, 4, 5, 6, 7]
+    # and the collated particle indices [0, 1, 2, 4, 5, 6, 3, 7], and so the mapping from collated
+    # to uncollated would be [0, 1, 2, 6, 3, 4, 5, 7]
+    return indices.uncollated_particle_indices[numpy.argsort(indices.collated_particle_indices)].tolist()
 
 
 def get_positions_with_virtual_sites(
@@ -60,8 +54,6 @@ def get_positions_with_virtual_sites(
     use_zeros: bool = False,
 ) -> Quantity:
     """Return the positions of all particles (atoms and virtual sites)."""
-    from openff.interchange.interop.common import _build_particle_map
-
     if interchange.positions is None:
         raise MissingPositionsError(
             f"Positions are required, found {interchange.positions=}.",
@@ -73,16 +65,6 @@ def get_positions_with_virtual_sites(
     if len(interchange["VirtualSites"].key_map) == 0:
         raise MissingVirtualSitesError()
 
-    # map of molecule index to *list* of virtual site keys contained therein
-    molecule_virtual_site_map: defaultdict[int, list[VirtualSiteKey]] = defaultdict(
-        list,
-    )
-
-    virtual_site_molecule_map = _virtual_site_parent_molecule_mapping(interchange)
-
-    for virtual_site, molecule_index in virtual_site_molecule_map.items():
-        molecule_virtual_site_map[molecule_index].append(virtual_site)
-
     if "VirtualSites" in interchange.collections:
         if use_zeros:
             # TODO: Consider removing this behavior
@@ -101,50 +83,12 @@ def get_positions_with_virtual_sites(
             )
 
         if collate:
-            # for i.e. a 4-site water dimer, these would be
-
-            # {
-            #   0: 0,
-            #   1: 1,
-            #   2: 2,
-            #   3: 3,
-            #   4: 4,
-            #   5: 5,
-            #   VirtualSiteKey with atom indices None: 6,
-            #   VirtualSiteKey with atom indices None: 7,
-            #   }
-            uncollated = _build_particle_map(
-                interchange=interchange,
-                molecule_virtual_site_map=molecule_virtual_site_map,
-                collate=False,
-            )
-
-            # {
-            #   0: 0,
-            #   1: 1,
-            #   2: 2,
-            #   VirtualSiteKey with atom indices None: 3,
-            #   3: 4:
-            #   4: 5,
-            #   5: 6,
-            #   VirtualSiteKey with atom indices None: 7,
-            #   }
-            collated = _build_particle_map(
-                interchange=interchange,
-                molecule_virtual_site_map=molecule_virtual_site_map,
-                collate=True,
-            )
-
-            # and so the mapping from collated to uncollated would be
-            # [0, 1, 2, 6, 3, 4, 5, 7]
-            uncollated_to_collated_mapping = [uncollated[key] for key in collated]
-
             return numpy.concatenate(
                 [
                     interchange.positions,
                     virtual_site_positions,
                 ],
-            )[uncollated_to_collated_mapping]
+            )[_get_uncollated_to_collated_mapping(interchange)]
 
         else:
             # could just pass it through a [0, 1, 3, 4, ...] mapping
@@ -160,6 +104,83 @@ def get_positions_with_virtual_sites(
         return interchange.positions
 
 
+def _iter_frame_chunks(
+    frames: Quantity | Iterable[Quantity],
+    n_atoms: int,
+    chunk_size: int,
+) -> Iterator[numpy.ndarray]:
+    """Yield chunks of frames as arrays (nm) of shape (n_frames_in_chunk, n_atoms, 3)."""
+    if isinstance(frames, Quantity):
+        array = frames.m_as(unit.nanometer).reshape(-1, n_atoms, 3)
+
+        for start in range(0, len(array), chunk_size):
+            yield array[start : start + chunk_size]
+
+        return
+
+    iterator = iter(frames)
+
+    while chunk := list(islice(iterator, chunk_size)):
+        yield numpy.stack([frame.m_as(unit.nanometer) for frame in chunk]).reshape(-1, n_atoms, 3)
+
+
+def iter_positions_with_virtual_sites(
+    interchange: Interchange,
+    frames: Quantity | Iterable[Quantity],
+    collate: bool = False,
+    chunk_size: int = 1000,
+) -> Iterator[Quantity]:
+    """
+    Yield the positions of all particles (atoms and virtual sites) in many frames, one chunk of frames at a time.
+
+    Virtual sites are placed in all frames of a chunk at once, re-using the local frame data cached by the
+    virtual site collection, and only one chunk of positions is held in memory at a time.
+
+    Parameters
+    ----------
+    interchange
+        The interchange whose virtual sites are placed. Its own positions are not used.
+    frames
+        The positions of the atoms in each frame, either as a single quantity of shape (n_frames, n_atoms, 3)
+        or as an iterable (i.e. a generator reading a trajectory) of quantities of shape (n_atoms, 3).
+    collate
+        If True, virtual sites are collated with each molecule's atoms, otherwise they follow all atoms.
+    chunk_size
+        The maximum number of frames in each chunk.
+
+    Yields
+    ------
+    positions
+        Positions of shape (n_frames_in_chunk, n_particles, 3), in nanometers.
+
+    """
+    from openff.interchange.smirnoff._virtual_sites import _place_virtual_sites
+
+    if "VirtualSites" not in interchange.collections:
+        raise MissingVirtualSitesError()
+
+    collection = interchange["VirtualSites"]
+
+    if len(collection.key_map) == 0:
+        raise MissingVirtualSitesError()
+
+    groups = collection._get_local_frame_groups()
+    n_virtual_sites = len(collection.key_map)
+
+    mapping = _get_uncollated_to_collated_mapping(interchange) if collate else None
+
+    for chunk in _iter_frame_chunks(frames, interchange.topology.n_atoms, chunk_size):
+        positions = numpy.concatenate(
+            [chunk, _place_virtual_sites(chunk, groups, n_virtual_sites)],
+            axis=1,
+        )
+
+        if mapping is not None:
+            positions = positions[:, mapping]
+
+        yield Quantity(positions, unit.nanometer)
+
+
 def _get_separation_by_atom_indices(
     interchange: Interchange,
     atom_indices: tuple[int, ...],
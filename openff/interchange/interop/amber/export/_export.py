@@ -1,16 +1,14 @@
 """Interfaces with Amber."""
 
 import textwrap
-from collections import defaultdict
 from collections.abc import Iterable
-from copy import deepcopy
 from pathlib import Path
 
 import numpy as np
-from openff.toolkit import Topology, unit
+from openff.toolkit import unit
 
 from openff.interchange import Interchange
-from openff.interchange.components.toolkit import _get_num_h_bonds
+from openff.interchange.components.toolkit import _get_bonded_pairs, _get_num_h_bonds
 from openff.interchange.constants import (
     _PME,
     AMBER_COULOMBS_CONSTANT,
@@ -22,90 +20,60 @@ from openff.interchange.exceptions import (
     UnsupportedExportError,
     UnsupportedMixingRuleError,
 )
+from openff.interchange.interop.common import _get_valence_arrays
 from openff.interchange.models import PotentialKey
 
 
-def _write_text_blob(file, blob):
-    def chunker(seq, size):
-        return (seq[pos : pos + size] for pos in range(0, len(seq), size))
-
-    if blob == "":
-        file.write("\n")
-    else:
-        for line in chunker(blob, 80):
-            file.write(line + "\n")
-
-
-def _flatten(list_of_lists: Iterable[list[int]]) -> list[int]:
-    return [item for sublist in list_of_lists for item in sublist]
-
-
-def _get_per_atom_exclusion_lists(
-    topology: "Topology",
-) -> dict[int, defaultdict[int, list[int]]]:
+def _write_section(file, values: Iterable, fmt: str, per_line: int):
     """
-    Get the excluded atoms of each atom in this topology.
+    Write values in fixed-width Fortran-style columns, i.e. `fmt="%8d"` and `per_line=10` for `%FORMAT(10I8)`.
 
-    Parameters
-    ----------
-    topology: Topology
-        OpenFF Topology
+    All full lines are formatted with a single string formatting operation.
+    """
+    values = tuple(values.tolist() if isinstance(values, np.ndarray) else values)
 
-    Returns
-    -------
-    per_atom_exclusions: dict[int, list[int]]
-        keys: atom indices (OpenFF atoms, zero-indexed)
-        values: defaultdict[int, list[int]]
-            list of atom indices (OpenFF atoms, zero-indexed) that are excluded from this atom,
-            keyed by their separation distance in the graph (1 for bonded, 2 for in an angle, 3
-            for in a dihedral)
+    if len(values) == 0:
+        file.write("\n")
+        return
 
-    """
-    per_atom_exclusions: dict[int, defaultdict[int, list[int]]] = dict()
+    n_full_lines, n_remaining = divmod(len(values), per_line)
 
-    for atom1 in topology.atoms:
-        # Excluded atoms _on this atom_
-        this_atom_exclusions = defaultdict(list)
-        index1 = topology.atom_index(atom1)
+    if n_full_lines > 0:
+        file.write(((fmt * per_line + "\n") * n_full_lines) % values[: n_full_lines * per_line])
 
-        for atom2 in atom1.bonded_atoms:
-            index2 = topology.atom_index(atom2)
+    if n_remaining > 0:
+        file.write((fmt * n_remaining + "\n") % values[n_full_lines * per_line :])
 
-            if index2 > index1:
-                # These atoms are bonded
-                this_atom_exclusions[1].append(index2)
 
-            for atom3 in atom2.bonded_atoms:
-                atom3_index = topology.atom_index(atom3)
+def _write_integers(file, values: Iterable[int]):
+    """Write a `%FORMAT(10I8)` section."""
+    _write_section(file, values, "%8d", 10)
 
-                if atom3_index > index1:
-                    # These atoms are included in an angle
-                    this_atom_exclusions[2].append(atom3_index)
 
-                for atom4 in atom3.bonded_atoms:
-                    atom4_index = topology.atom_index(atom4)
-                    if atom4_index > index1 and atom4_index:
-                        # These atoms are included in a torsion
-                        this_atom_exclusions[3].append(atom4_index)
+def _write_floats(file, values: Iterable[float]):
+    """Write a `%FORMAT(5E16.8)` section."""
+    _write_section(file, values, "%16.8E", 5)
 
-        per_atom_exclusions[index1] = this_atom_exclusions
 
-    return per_atom_exclusions
+def _write_strings(file, values: Iterable[str], left_justify: bool = True):
+    """Write a `%FORMAT(20a4)` section."""
+    _write_section(file, values, "%-4s" if left_justify else "%4s", 20)
 
 
 def _get_exclusion_lists(
-    per_atom_exclusions: dict[int, defaultdict[int, list[int]]],
+    n_atoms: int,
+    excluded_pairs: np.ndarray,
 ) -> tuple[list[int], list[int]]:
     """
-    Convert a per-atom exclusion dict to Amer structures.
+    Convert excluded pairs to Amber structures.
 
     Parameters
     ----------
-    per_atom_exclusions: dict[int, list[int]]
-        keys: atom indices (OpenFF atoms, zero-indexed)
-        values: list of atom indices (OpenFF atoms, zero-indexed) that are excluded from this atom
-
-        See _getper_atom_exclusion_lists
+    n_atoms: int
+        The number of atoms in the topology
+    excluded_pairs: np.ndarray
+        Sorted pairs of atom indices (OpenFF atoms, zero-indexed, lower index first) that are separated
+        by one, two, or three bonds. See `_BondedPairs.excluded_pairs`
 
     Returns
     -------
@@ -116,164 +84,188 @@ def _get_exclusion_lists(
         See EXCLUDED_ATOMS_LIST in https://ambermd.org/prmtop.pdf
 
     """
-    excluded_atoms_list: list[int] = list()
-    number_excluded_atoms: list[int] = list()
+    number_excluded_atoms = np.bincount(excluded_pairs[:, 0], minlength=n_atoms)
+
+    # Amber expects this list to have a 1 in it, pointing to a non-existent
+    # atom with index 0, when an atom has no exclusions
+    (atoms_without_exclusions,) = np.nonzero(number_excluded_atoms == 0)
 
-    for this_atom, this_atom_exclusions in per_atom_exclusions.items():
-        if len(this_atom_exclusions) == 0:
-            # Amber expects this list to have a 1 in it, pointing to a non-existent
-            # atom with index 0, when an atom has no exclusions
-            tmp = {0}
+    atoms = np.concatenate([excluded_pairs[:, 0], atoms_without_exclusions])
+    excluded_atoms = np.concatenate([excluded_pairs[:, 1] + 1, np.zeros_like(atoms_without_exclusions)])
 
-        else:
-            tmp = set()
-            for other_atom in _flatten(this_atom_exclusions.values()):
-                if other_atom > this_atom:
-                    tmp.add(other_atom + 1)
+    excluded_atoms_list = excluded_atoms[np.lexsort((excluded_atoms, atoms))]
 
-        for val in sorted(tmp):
-            excluded_atoms_list.append(val)
+    return np.maximum(number_excluded_atoms, 1).tolist(), excluded_atoms_list.tolist()
 
-        number_excluded_atoms.append(len(tmp))
 
-    return number_excluded_atoms, excluded_atoms_list
+def _split_by_hydrogen(
+    entries: np.ndarray,
+    atom_indices: np.ndarray,
+    is_hydrogen: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Split rows of (Amber) entries into those of terms that contain a hydrogen atom and those that do not."""
+    contains_hydrogen = is_hydrogen[atom_indices].any(axis=1)
+
+    return entries[contains_hydrogen].ravel(), entries[~contains_hydrogen].ravel()
 
 
 def _get_bond_lists(
     interchange: "Interchange",
-    atomic_numbers: tuple,
+    is_hydrogen: np.ndarray,
     potential_key_to_bond_type_mapping: dict[PotentialKey, int],
-) -> tuple[list[int], list[int]]:
-    bonds_inc_hydrogen: list[int] = list()
-    bonds_without_hydrogen: list[int] = list()
-
+) -> tuple[np.ndarray, np.ndarray]:
     # TODO: Should probably build bond lists and exclusions without assuming bond physics
-    for bond, key_ in interchange["Bonds"].key_map.items():
-        bond_type_index = potential_key_to_bond_type_mapping[key_]
-
-        these_atomic_numbers = tuple(atomic_numbers[index] for index in bond.atom_indices)
-
-        bond_indices = tuple(sorted(bond.atom_indices))
+    atom_indices, type_indices = _get_valence_arrays(interchange["Bonds"], potential_key_to_bond_type_mapping, 2)
 
-        bonds_list = bonds_inc_hydrogen if 1 in these_atomic_numbers else bonds_without_hydrogen
+    entries = np.column_stack([np.sort(atom_indices, axis=1) * 3, type_indices + 1])
 
-        bonds_list.append(bond_indices[0] * 3)
-        bonds_list.append(bond_indices[1] * 3)
-        bonds_list.append(bond_type_index + 1)
-
-    return bonds_inc_hydrogen, bonds_without_hydrogen
+    return _split_by_hydrogen(entries, atom_indices, is_hydrogen)
 
 
 def _get_angle_lists(
     interchange: "Interchange",
-    atomic_numbers: tuple,
+    is_hydrogen: np.ndarray,
     potential_key_to_angle_type_mapping: dict[PotentialKey, int],
-) -> tuple[list[int], list[int]]:
-    angles_inc_hydrogen: list[int] = list()
-    angles_without_hydrogen: list[int] = list()
+) -> tuple[np.ndarray, np.ndarray]:
+    atom_indices, type_indices = _get_valence_arrays(interchange["Angles"], potential_key_to_angle_type_mapping, 3)
 
-    for angle, key_ in interchange["Angles"].key_map.items():
-        angle_type_index = potential_key_to_angle_type_mapping[key_]
+    # list the lower of the outer atoms first
+    ordered = np.where(
+        (atom_indices[:, 0] < atom_indices[:, -1])[:, None],
+        atom_indices,
+        atom_indices[:, ::-1],
+    )
 
-        these_atomic_numbers = tuple(atomic_numbers[index] for index in angle.atom_indices)
+    entries = np.column_stack([ordered * 3, type_indices + 1])
 
-        angle_indices = list(angle.atom_indices)
-        angle_indices = angle_indices if angle_indices[0] < angle_indices[-1] else list(reversed(angle_indices))
-
-        angles_list = angles_inc_hydrogen if 1 in these_atomic_numbers else angles_without_hydrogen
-
-        angles_list.append(angle_indices[0] * 3)
-        angles_list.append(angle_indices[1] * 3)
-        angles_list.append(angle_indices[2] * 3)
-        angles_list.append(angle_type_index + 1)
-
-    return angles_inc_hydrogen, angles_without_hydrogen
+    return _split_by_hydrogen(entries, atom_indices, is_hydrogen)
 
 
 def _get_dihedral_lists(
     interchange: "Interchange",
-    atomic_numbers: tuple,
+    is_hydrogen: np.ndarray,
     potential_key_to_dihedral_type_mapping: dict[PotentialKey, int],
-    already_counted: set[tuple[int, ...]],
-    exclusions: dict[int, defaultdict[int, list[int]]],  # per-atom exclusions
-) -> tuple[list[int], list[int]]:
-    dihedrals_inc_hydrogen: list[int] = list()
-    dihedrals_without_hydrogen: list[int] = list()
+    pairs_12_13: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    n_atoms = len(is_hydrogen)
+
+    inc_hydrogen: list[np.ndarray] = list()
+    without_hydrogen: list[np.ndarray] = list()
 
     if "ProperTorsions" in interchange.collections:
-        for dihedral, proper_key in interchange["ProperTorsions"].key_map.items():
-            dihedral_type_index = potential_key_to_dihedral_type_mapping[proper_key]
-
-            atom1_index, atom2_index, atom3_index, atom4_index = dihedral.atom_indices
-
-            # Since 0 can't be negative, attempt to re-arrange this torsion
-            # such that the third atom listed is negative.
-            # This should only be strictly necessary when _14_tag is -1, but
-            # ParmEd likes to always flip it, and always flipping should be harmless.
-            # Could put this in an if block if desired.
-            if atom3_index == 0:
-                atom1_index, atom2_index, atom3_index, atom4_index = reversed(
-                    (
-                        atom1_index,
-                        atom2_index,
-                        atom3_index,
-                        atom4_index,
-                    ),
-                )
+        atom_indices, type_indices = _get_valence_arrays(
+            interchange["ProperTorsions"],
+            potential_key_to_dihedral_type_mapping,
+            4,
+        )
 
-            these_atomic_numbers = tuple(atomic_numbers[index] for index in dihedral.atom_indices)
+        # Since 0 can't be negative, attempt to re-arrange this torsion
+        # such that the third atom listed is negative.
+        # This should only be strictly necessary when _14_tag is -1, but
+        # ParmEd likes to always flip it, and always flipping should be harmless.
+        ordered = np.where(
+            (atom_indices[:, 2] == 0)[:, None],
+            atom_indices[:, ::-1],
+            atom_indices,
+        )
 
-            # See if the non-bonded interactions of the first and fourth atoms need to be exluded
+        # See if the non-bonded interactions of the first and fourth atoms need to be exluded
+        pairs = np.sort(ordered[:, [0, 3]], axis=1)
+        pair_keys = pairs[:, 0] * n_atoms + pairs[:, 1]
 
-            atom1_neighbors = exclusions[atom1_index][1] + exclusions[atom1_index][2]
-            atom4_neighbors = exclusions[atom4_index][1] + exclusions[atom4_index][2]
+        # Exclude because these atoms are separated by only one or two bonds
+        exclude_nonbonded = np.isin(pair_keys, pairs_12_13[:, 0] * n_atoms + pairs_12_13[:, 1])
 
-            _sorted = tuple(sorted([atom1_index, atom4_index]))
+        # Exclude because these were already counted once in another torsion
+        _, first_occurrences = np.unique(pair_keys, return_index=True)
+        already_counted = np.ones(len(pair_keys), dtype=bool)
+        already_counted[first_occurrences] = False
 
-            if atom4_index in atom1_neighbors:
-                # Exclude because these atoms are separated by only one or two bonds
-                exclude_nonbonded = -1
+        exclude_nonbonded |= already_counted
 
-            elif atom1_index in atom4_neighbors:
-                # Exclude because these atoms are separated by only one or two bonds
-                exclude_nonbonded = -1
+        entries = np.column_stack(
+            [
+                ordered[:, :2] * 3,
+                ordered[:, 2] * 3 * np.where(exclude_nonbonded, -1, 1),
+                ordered[:, 3] * 3,
+                type_indices + 1,
+            ],
+        )
 
-            elif _sorted in already_counted:
-                # Exclude because these were already counted once in another torsion
-                exclude_nonbonded = -1
+        these_inc_hydrogen, these_without_hydrogen = _split_by_hydrogen(entries, atom_indices, is_hydrogen)
 
-            else:
-                exclude_nonbonded = 1
+        inc_hydrogen.append(these_inc_hydrogen)
+        without_hydrogen.append(these_without_hydrogen)
 
-            dihedrals_list = dihedrals_inc_hydrogen if 1 in these_atomic_numbers else dihedrals_without_hydrogen
+    if "ImproperTorsions" in interchange.collections:
+        atom_indices, type_indices = _get_valence_arrays(
+            interchange["ImproperTorsions"],
+            potential_key_to_dihedral_type_mapping,
+            4,
+        )
 
-            dihedrals_list.append(atom1_index * 3)
-            dihedrals_list.append(atom2_index * 3)
-            dihedrals_list.append(atom3_index * 3 * exclude_nonbonded)
-            dihedrals_list.append(atom4_index * 3)
-            dihedrals_list.append(dihedral_type_index + 1)
+        # Assume that no improper torsions include 1-4 pairs, so don't check nor track them
+        entries = np.column_stack(
+            [
+                atom_indices[:, :2] * 3,
+                atom_indices[:, 2:] * -3,
+                type_indices + 1,
+            ],
+        )
 
-            already_counted.add(_sorted)
+        these_inc_hydrogen, these_without_hydrogen = _split_by_hydrogen(entries, atom_indices, is_hydrogen)
 
-    if "ImproperTorsions" in interchange.collections:
-        for improper, improper_key in interchange["ImproperTorsions"].key_map.items():
-            dihedral_type_index = potential_key_to_dihedral_type_mapping[improper_key]
+        inc_hydrogen.append(these_inc_hydrogen)
+        without_hydrogen.append(these_without_hydrogen)
+
+    return (
+        np.concatenate(inc_hydrogen) if inc_hydrogen else np.empty(0, dtype=np.int64),
+        np.concatenate(without_hydrogen) if without_hydrogen else np.empty(0, dtype=np.int64),
+    )
+
+
+def _get_lennard_jones_tables(
+    sigmas: np.ndarray,
+    epsilons: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Get the Lennard-Jones A and B coefficients of each pair of atom types and the index of each pair into them.
+
+    Parameters
+    ----------
+    sigmas: np.ndarray
+        The sigma of each atom type, in Angstrom
+    epsilons: np.ndarray
+        The epsilon of each atom type, in kcal/mol
+
+    Returns
+    -------
+    acoefs: np.ndarray
+        LENNARD_JONES_ACOEF, with the coefficient of atom types i <= j at i + j * (j + 1) / 2
+    bcoefs: np.ndarray
+        LENNARD_JONES_BCOEF, ordered as `acoefs`
+    nonbonded_parm_indices: np.ndarray
+        NONBONDED_PARM_INDEX (Fortran indices), the index of atom types i, j at NTYPES * i + j
+
+    """
+    n_types = len(sigmas)
 
-            atom1_index, atom2_index, atom3_index, atom4_index = improper.atom_indices
+    # TODO: Figure out the right way to map cross-interactions, using the
+    #       potential keys as lookups to parameters
+    sigma = (sigmas[:, None] + sigmas[None, :]) * 0.5
+    epsilon = np.sqrt(epsilons[:, None] * epsilons[None, :])
 
-            # Assume that no improper torsions include 1-4 pairs, so don't check nor track them
+    # (j, i) pairs with i <= j, ordered by j then i
+    j, i = np.tril_indices(n_types)
 
-            these_atomic_numbers = tuple(atomic_numbers[index] for index in improper.atom_indices)
+    acoefs = (4 * epsilon * sigma**12)[i, j]
+    bcoefs = (4 * epsilon * sigma**6)[i, j]
 
-            dihedrals_list = dihedrals_inc_hydrogen if 1 in these_atomic_numbers else dihedrals_without_hydrogen
+    lower, upper = np.sort(np.indices((n_types, n_types)), axis=0)
 
-            dihedrals_list.append(atom1_index * 3)
-            dihedrals_list.append(atom2_index * 3)
-            dihedrals_list.append(atom3_index * 3 * -1)
-            dihedrals_list.append(atom4_index * 3 * -1)
-            dihedrals_list.append(dihedral_type_index + 1)
+    nonbonded_parm_indices = (lower + upper * (upper + 1) // 2 + 1).ravel()  # FORTRAN IDX
 
-    return dihedrals_inc_hydrogen, dihedrals_without_hydrogen
+    return acoefs, bcoefs, nonbonded_parm_indices
 
 
 # TODO: Split this mono-function into smaller functions
@@ -335,46 +327,41 @@ def to_prmtop(interchange: "Interchange", file_path: Path | str):
             key: i for i, key in enumerate(interchange["Angles"].potentials)
         }
 
-        dihedral_potentials = dict()
+        potential_key_to_dihedral_type_mapping: dict[PotentialKey, int] = dict()
         for key in ["ProperTorsions", "ImproperTorsions"]:
             if key in interchange.collections:
-                dihedral_potentials.update(deepcopy(interchange[key].potentials))
-                dihedral_potentials.update(deepcopy(interchange[key].potentials))
-
-        potential_key_to_dihedral_type_mapping: dict[PotentialKey, int] = {
-            key: i for i, key in enumerate(dihedral_potentials)
-        }
+                for potential_key in interchange[key].potentials:
+                    potential_key_to_dihedral_type_mapping.setdefault(
+                        potential_key,
+                        len(potential_key_to_dihedral_type_mapping),
+                    )
 
-        # This is only used to track 1-4 pairs that are already counted. Since we
-        # only care about membership and never indexing and the membership check
-        # will happen roughly once per dihedral, use a set for speed.
-        already_counted: set[tuple[int, ...]] = set()
-
-        per_atom_exclusion_lists = _get_per_atom_exclusion_lists(interchange.topology)
+        bonded_pairs = _get_bonded_pairs(interchange.topology)
 
         number_excluded_atoms, excluded_atoms_list = _get_exclusion_lists(
-            per_atom_exclusion_lists,
+            interchange.topology.n_atoms,
+            bonded_pairs.excluded_pairs,
         )
-        atomic_numbers = tuple(atom.atomic_number for atom in interchange.topology.atoms)
+        atomic_numbers = np.asarray([atom.atomic_number for atom in interchange.topology.atoms], dtype=np.int64)
+        is_hydrogen = atomic_numbers == 1
 
         bonds_inc_hydrogen, bonds_without_hydrogen = _get_bond_lists(
             interchange,
-            atomic_numbers,
+            is_hydrogen,
             potential_key_to_bond_type_mapping,
         )
 
         angles_inc_hydrogen, angles_without_hydrogen = _get_angle_lists(
             interchange,
-            atomic_numbers,
+            is_hydrogen,
             potential_key_to_angle_type_mapping,
         )
 
         dihedrals_inc_hydrogen, dihedrals_without_hydrogen = _get_dihedral_lists(
             interchange,
-            atomic_numbers,
+            is_hydrogen,
             potential_key_to_dihedral_type_mapping,
-            already_counted,
-            per_atom_exclusion_lists,
+            np.concatenate([bonded_pairs.pairs_12, bonded_pairs.pairs_13]),
         )
 
         # total number of atoms
@@ -465,8 +452,7 @@ def to_prmtop(interchange: "Interchange", file_path: Path | str):
         ]
 
         prmtop.write("%FLAG POINTERS\n%FORMAT(10I8)\n")
-        text_blob = "".join([str(val).rjust(8) for val in pointers])
-        _write_text_blob(prmtop, text_blob)
+        _write_integers(prmtop, pointers)
 
         prmtop.write("%FLAG ATOM_NAME\n%FORMAT(20a4)\n")
 
@@ -481,86 +467,45 @@ def to_prmtop(interchange: "Interchange", file_path: Path | str):
             else:
                 atom_names.append(atom.symbol)
 
-        text_blob = "".join([str(val).rjust(4) for val in atom_names])
-        _write_text_blob(prmtop, text_blob)
+        _write_strings(prmtop, atom_names, left_justify=False)
 
         prmtop.write("%FLAG CHARGE\n%FORMAT(5E16.8)\n")
         charges = [
             charge.m_as(unit.e) * AMBER_COULOMBS_CONSTANT for charge in interchange["Electrostatics"].charges.values()
         ]
-        text_blob = "".join([f"{val:16.8E}" for val in charges])
-        _write_text_blob(prmtop, text_blob)
+        _write_floats(prmtop, charges)
 
         prmtop.write("%FLAG ATOMIC_NUMBER\n%FORMAT(10I8)\n")
-        text_blob = "".join([str(val).rjust(8) for val in atomic_numbers])
-        _write_text_blob(prmtop, text_blob)
+        _write_integers(prmtop, atomic_numbers)
 
         prmtop.write("%FLAG MASS\n%FORMAT(5E16.8)\n")
         masses = [a.mass.m for a in interchange.topology.atoms]
-        text_blob = "".join([f"{val:16.8E}" for val in masses])
-        _write_text_blob(prmtop, text_blob)
+        _write_floats(prmtop, masses)
 
         prmtop.write("%FLAG ATOM_TYPE_INDEX\n%FORMAT(10I8)\n")
-        text_blob = "".join([str(val + 1).rjust(8) for val in atom_type_indices])
-        _write_text_blob(prmtop, text_blob)
+        _write_integers(prmtop, np.asarray(atom_type_indices, dtype=np.int64) + 1)
 
         prmtop.write("%FLAG NUMBER_EXCLUDED_ATOMS\n%FORMAT(10I8)\n")
         # https://ambermd.org/prmtop.pdf says this section is ignored (!?)
-        text_blob = "".join([str(val).rjust(8) for val in number_excluded_atoms])
-        _write_text_blob(prmtop, text_blob)
-
-        acoefs = [None] * int((NTYPES + 1) * NTYPES / 2)
-        bcoefs = [None] * int((NTYPES + 1) * NTYPES / 2)
-
-        nonbonded_parm_indices: list[int | None] = [None] * (NTYPES * NTYPES)
-
-        for key_i, i in potential_key_to_atom_type_mapping.items():
-            for key_j, j in potential_key_to_atom_type_mapping.items():
-                if j < i:
-                    # Only need to handle the lower triangle as everything symmetric.
-                    continue
-
-                atom_type_index_i = i + 1
-                atom_type_index_j = j + 1
-
-                coeff_index = int(i + (j + 1) * j / 2) + 1  # FORTRAN IDX
+        _write_integers(prmtop, number_excluded_atoms)
 
-                # index = NONBONDED PARM INDEX [NTYPES * (ATOM TYPE INDEX(i) - 1) + ATOM TYPE INDEX(j)]
-                parm_index_fwd = (
-                    NTYPES * (atom_type_index_i - 1) + atom_type_index_j  # FORTRAN IDX
-                )
-                parm_index_rev = (
-                    NTYPES * (atom_type_index_j - 1) + atom_type_index_i  # FORTRAN IDX
+        vdw_parameters = np.asarray(
+            [
+                (
+                    interchange["vdW"].potentials[key].parameters["sigma"].m_as(unit.angstrom),
+                    interchange["vdW"].potentials[key].parameters["epsilon"].m_as(kcal_mol),
                 )
+                for key in potential_key_to_atom_type_mapping
+            ],
+        ).reshape(-1, 2)
 
-                # TODO: Figure out the right way to map cross-interactions, using the
-                #       key_i and key_j objects as lookups to parameters
-                sigma_i = interchange["vdW"].potentials[key_i].parameters["sigma"]
-                sigma_j = interchange["vdW"].potentials[key_j].parameters["sigma"]
-                epsilon_i = interchange["vdW"].potentials[key_i].parameters["epsilon"]
-                epsilon_j = interchange["vdW"].potentials[key_j].parameters["epsilon"]
-
-                sigma = (sigma_i + sigma_j) * 0.5
-                epsilon = (epsilon_i * epsilon_j) ** 0.5
-
-                acoef = (4 * epsilon * sigma**12).m_as(kcal_mol * unit.angstrom**12)
-                bcoef = (4 * epsilon * sigma**6).m_as(kcal_mol * unit.angstrom**6)
-
-                acoefs[coeff_index - 1] = acoef
-                bcoefs[coeff_index - 1] = bcoef
-
-                nonbonded_parm_indices[parm_index_fwd - 1] = coeff_index
-                nonbonded_parm_indices[parm_index_rev - 1] = coeff_index
-
-        assert all(
-            value is not None
-            for values in [acoefs, bcoefs, nonbonded_parm_indices]
-            for value in values  # type: ignore
-        ), "an internal error occurred"
+        acoefs, bcoefs, nonbonded_parm_indices = _get_lennard_jones_tables(
+            vdw_parameters[:, 0],
+            vdw_parameters[:, 1],
+        )
 
         prmtop.write("%FLAG NONBONDED_PARM_INDEX\n%FORMAT(10I8)\n")
-        text_blob = "".join([str(val).rjust(8) for val in nonbonded_parm_indices])
-        _write_text_blob(prmtop, text_blob)
+        _write_integers(prmtop, nonbonded_parm_indices)
 
         residue_names = [
             getattr(residue, "residue_name", "RES") for residue in interchange.topology.hierarchy_iterator("residues")
@@ -571,8 +516,7 @@ def to_prmtop(interchange: "Interchange", file_path: Path | str):
             residue_names = ["RES"]
 
         prmtop.write("%FLAG RESIDUE_LABEL\n%FORMAT(20a4)\n")
-        text_blob = "".join([val.ljust(4) for val in residue_names])
-        _write_text_blob(prmtop, text_blob)
+        _write_strings(prmtop, residue_names)
 
         residue_pointers = (
             [
@@ -583,8 +527,7 @@ def to_prmtop(interchange: "Interchange", file_path: Path | str):
             else [0]
         )
         prmtop.write("%FLAG RESIDUE_POINTER\n%FORMAT(10I8)\n")
-        text_blob = "".join([str(val + 1).rjust(8) for val in residue_pointers])
-        _write_text_blob(prmtop, text_blob)
+        _write_integers(prmtop, np.asarray(residue_pointers, dtype=np.int64) + 1)
 
         # TODO: Exclude (?) bonds containing hydrogens
         prmtop.write("%FLAG BOND_FORCE_CONSTANT\n%FORMAT(5E16.8)\n")
@@ -592,32 +535,28 @@ def to_prmtop(interchange: "Interchange", file_path: Path | str):
             interchange["Bonds"].potentials[key].parameters["k"].m_as(kcal_mol_a2) / 2
             for key in potential_key_to_bond_type_mapping
         ]
-        text_blob = "".join([f"{val:16.8E}" for val in bond_k])
-        _write_text_blob(prmtop, text_blob)
+        _write_floats(prmtop, bond_k)
 
         prmtop.write("%FLAG BOND_EQUIL_VALUE\n%FORMAT(5E16.8)\n")
         bond_length = [
             interchange["Bonds"].potentials[key].parameters["length"].m_as(unit.angstrom)
             for key in potential_key_to_bond_type_mapping
         ]
-        text_blob = "".join([f"{val:16.8E}" for val in bond_length])
-        _write_text_blob(prmtop, text_blob)
+        _write_floats(prmtop, bond_length)
 
         prmtop.write("%FLAG ANGLE_FORCE_CONSTANT\n%FORMAT(5E16.8)\n")
         angle_k = [
             interchange["Angles"].potentials[key].parameters["k"].m_as(kcal_mol_rad2) / 2
             for key in potential_key_to_angle_type_mapping
         ]
-        text_blob = "".join([f"{val:16.8E}" for val in angle_k])
-        _write_text_blob(prmtop, text_blob)
+        _write_floats(prmtop, angle_k)
 
         prmtop.write("%FLAG ANGLE_EQUIL_VALUE\n%FORMAT(5E16.8)\n")
         angle_theta = [
             interchange["Angles"].potentials[key].parameters["angle"].m_as(unit.radian)
             for key in potential_key_to_angle_type_mapping
         ]
-        text_blob = "".join([f"{val:16.8E}" for val in angle_theta])
-        _write_text_blob(prmtop, text_blob)
+        _write_floats(prmtop, angle_theta)
 
         dihedral_k: list[int] = list()
         dihedral_periodicity: list[int] = list()
@@ -631,93 +570,75 @@ def to_prmtop(interchange: "Interchange", file_path: Path | str):
             dihedral_phase.append(params["phase"].m_as(unit.radian))
 
         prmtop.write("%FLAG DIHEDRAL_FORCE_CONSTANT\n%FORMAT(5E16.8)\n")
-        text_blob = "".join([f"{val:16.8E}" for val in dihedral_k])
-        _write_text_blob(prmtop, text_blob)
+        _write_floats(prmtop, dihedral_k)
 
         prmtop.write("%FLAG DIHEDRAL_PERIODICITY\n%FORMAT(5E16.8)\n")
-        text_blob = "".join([f"{val:16.8E}" for val in dihedral_periodicity])
-        _write_text_blob(prmtop, text_blob)
+        _write_floats(prmtop, dihedral_periodicity)
 
         prmtop.write("%FLAG DIHEDRAL_PHASE\n%FORMAT(5E16.8)\n")
-        text_blob = "".join([f"{val:16.8E}" for val in dihedral_phase])
-        _write_text_blob(prmtop, text_blob)
+        _write_floats(prmtop, dihedral_phase)
 
         prmtop.write("%FLAG SCEE_SCALE_FACTOR\n%FORMAT(5E16.8)\n")
         scee = NPTRA * [1.2]
-        text_blob = "".join([f"{val:16.8E}" for val in scee])
-        _write_text_blob(prmtop, text_blob)
+        _write_floats(prmtop, scee)
 
         prmtop.write("%FLAG SCNB_SCALE_FACTOR\n%FORMAT(5E16.8)\n")
         scnb = NPTRA * [2.0]
-        text_blob = "".join([f"{val:16.8E}" for val in scnb])
-        _write_text_blob(prmtop, text_blob)
+        _write_floats(prmtop, scnb)
 
         prmtop.write("%FLAG SOLTY\n%FORMAT(5E16.8)\n")
         prmtop.write(f"{0:16.8E}\n")
 
         prmtop.write("%FLAG LENNARD_JONES_ACOEF\n%FORMAT(5E16.8)\n")
-        text_blob = "".join([f"{val:16.8E}" for val in acoefs])
-        _write_text_blob(prmtop, text_blob)
+        _write_floats(prmtop, acoefs)
 
         prmtop.write("%FLAG LENNARD_JONES_BCOEF\n%FORMAT(5E16.8)\n")
-        text_blob = "".join([f"{val:16.8E}" for val in bcoefs])
-        _write_text_blob(prmtop, text_blob)
+        _write_floats(prmtop, bcoefs)
 
         prmtop.write("%FLAG BONDS_INC_HYDROGEN\n%FORMAT(10I8)\n")
-        text_blob = "".join([str(val).rjust(8) for val in bonds_inc_hydrogen])
-        _write_text_blob(prmtop, text_blob)
+        _write_integers(prmtop, bonds_inc_hydrogen)
 
         prmtop.write("%FLAG BONDS_WITHOUT_HYDROGEN\n%FORMAT(10I8)\n")
-        text_blob = "".join([str(val).rjust(8) for val in bonds_without_hydrogen])
-        _write_text_blob(prmtop, text_blob)
+        _write_integers(prmtop, bonds_without_hydrogen)
 
         prmtop.write("%FLAG ANGLES_INC_HYDROGEN\n%FORMAT(10I8)\n")
-        text_blob = "".join([str(val).rjust(8) for val in angles_inc_hydrogen])
-        _write_text_blob(prmtop, text_blob)
+        _write_integers(prmtop, angles_inc_hydrogen)
 
         prmtop.write("%FLAG ANGLES_WITHOUT_HYDROGEN\n%FORMAT(10I8)\n")
-        text_blob = "".join([str(val).rjust(8) for val in angles_without_hydrogen])
-        _write_text_blob(prmtop, text_blob)
+        _write_integers(prmtop, angles_without_hydrogen)
 
         prmtop.write("%FLAG DIHEDRALS_INC_HYDROGEN\n%FORMAT(10I8)\n")
-        text_blob = "".join([str(val).rjust(8) for val in dihedrals_inc_hydrogen])
-        _write_text_blob(prmtop, text_blob)
+        _write_integers(prmtop, dihedrals_inc_hydrogen)
 
         prmtop.write("%FLAG DIHEDRALS_WITHOUT_HYDROGEN\n%FORMAT(10I8)\n")
-        text_blob = "".join([str(val).rjust(8) for val in dihedrals_without_hydrogen])
-        _write_text_blob(prmtop, text_blob)
+        _write_integers(prmtop, dihedrals_without_hydrogen)
 
         prmtop.write("%FLAG EXCLUDED_ATOMS_LIST\n%FORMAT(10I8)\n")
-        text_blob = "".join([str(val).rjust(8) for val in excluded_atoms_list])
-        _write_text_blob(prmtop, text_blob)
+        _write_integers(prmtop, excluded_atoms_list)
 
         prmtop.write("%FLAG HBOND_ACOEF\n%FORMAT(5E16.8)\n")
-        _write_text_blob(prmtop, "")
+        prmtop.write("\n")
 
         prmtop.write("%FLAG HBOND_BCOEF\n%FORMAT(5E16.8)\n")
-        _write_text_blob(prmtop, "")
+        prmtop.write("\n")
 
         prmtop.write("%FLAG HBCUT\n%FORMAT(5E16.8)\n")
-        _write_text_blob(prmtop, "")
+        prmtop.write("\n")
 
         prmtop.write("%FLAG AMBER_ATOM_TYPE\n%FORMAT(20a4)\n")
-        text_blob = "".join([val.ljust(4) for val in typemap.values()])
-        _write_text_blob(prmtop, text_blob)
+        _write_strings(prmtop, typemap.values())
 
         prmtop.write("%FLAG TREE_CHAIN_CLASSIFICATION\n%FORMAT(20a4)\n")
         blahs = NATOM * ["BLA"]
-        text_blob = "".join([val.ljust(4) for val in blahs])
-        _write_text_blob(prmtop, text_blob)
+        _write_strings(prmtop, blahs)
 
         prmtop.write("%FLAG JOIN_ARRAY\n%FORMAT(10I8)\n")
         _ = NATOM * [0]
-        text_blob = "".join([str(val).rjust(8) for val in _])
-        _write_text_blob(prmtop, text_blob)
+        _write_integers(prmtop, _)
 
         prmtop.write("%FLAG IROTAT\n%FORMAT(10I8)\n")
         _ = NATOM * [0]
-        text_blob = "".join([str(val).rjust(8) for val in _])
-        _write_text_blob(prmtop, text_blob)
+        _write_integers(prmtop, _)
 
         if IFBOX == 1:
             if (interchange.box.m != np.diag(np.diagonal(interchange.box.m))).any():  # type: ignore[union-attr]
@@ -738,21 +659,18 @@ def to_prmtop(interchange: "Interchange", file_path: Path | str):
             box = [90.0]
             for i in range(3):
                 box.append(interchange.box[i, i].m_as(unit.angstrom))  # type: ignore
-            text_blob = "".join([f"{val:16.8E}" for val in box])
-            _write_text_blob(prmtop, text_blob)
+            _write_floats(prmtop, box)
 
         prmtop.write("%FLAG RADIUS_SET\n%FORMAT(1a80)\n")
         prmtop.write("0\n")
 
         prmtop.write("%FLAG RADII\n%FORMAT(5E16.8)\n")
         radii = NATOM * [0]
-        text_blob = "".join([f"{val:16.8E}" for val in radii])
-        _write_text_blob(prmtop, text_blob)
+        _write_floats(prmtop, radii)
 
         prmtop.write("%FLAG SCREEN\n%FORMAT(5E16.8)\n")
         screen = NATOM * [0]
-        text_blob = "".join([f"{val:16.8E}" for val in screen])
-        _write_text_blob(prmtop, text_blob)
+        _write_floats(prmtop, screen)
 
         prmtop.write("%FLAG IPOL\n%FORMAT(1I8)\n")
         prmtop.write("       0\n")
@@ -1,5 +1,6 @@
 """Utilities for interoperability with multiple packages."""
 
+import numpy
 from openff.toolkit import Quantity
 
 from openff.interchange import Interchange
@@ -8,7 +9,7 @@ from openff.interchange.exceptions import (
     MissingVirtualSitesError,
     UnsupportedExportError,
 )
-from openff.interchange.models import VirtualSiteKey
+from openff.interchange.models import PotentialKey, VirtualSiteKey
 from openff.interchange.smirnoff import SMIRNOFFVirtualSiteCollection
 
 
@@ -48,6 +49,27 @@ def _check_virtual_site_exclusion_policy(handler: "SMIRNOFFVirtualSiteCollection
         )
 
 
+def _get_valence_arrays(
+    collection,
+    potential_key_to_type_mapping: dict[PotentialKey, int],
+    n_atoms_per_term: int,
+) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """Get the atom indices, shape (n_terms, n_atoms_per_term), and zero-indexed type of each term in a collection."""
+    atom_indices, potential_indices, potential_keys = collection._get_arrays()
+
+    # look up the type of each unique potential once, not once per term
+    potential_types = numpy.fromiter(
+        (potential_key_to_type_mapping[potential_key] for potential_key in potential_keys),
+        dtype=numpy.int64,
+        count=len(potential_keys),
+    )
+
+    return (
+        atom_indices.astype(numpy.int64).reshape(-1, n_atoms_per_term),
+        potential_types[potential_indices],
+    )
+
+
 def _build_typemap(interchange: Interchange) -> dict[int, str]:
     typemap = dict()
     elements: dict[str, int] = dict()
@@ -72,7 +94,6 @@ def _build_typemap(interchange: Interchange) -> dict[int, str]:
 
 def _build_particle_map(
     interchange: Interchange,
-    molecule_virtual_site_map,
     collate: bool = False,
 ) -> dict[int | VirtualSiteKey, int]:
     """
@@ -81,29 +102,4 @@ def _build_particle_map(
     If `collate=True`, virtual sites are collated with each molecule's atoms.
     If `collate=False`, virtual sites go at the very end, after all atoms were added.
     """
-    particle_map: dict[int | VirtualSiteKey, int] = dict()
-
-    particle_index = 0
-
-    for molecule in interchange.topology.molecules:
-        for atom in molecule.atoms:
-            atom_index = interchange.topology.atom_index(atom)
-
-            particle_map[atom_index] = particle_index
-
-            particle_index += 1
-
-        if collate:
-            for virtual_site_key in molecule_virtual_site_map[interchange.topology.molecule_index(molecule)]:
-                particle_map[virtual_site_key] = particle_index
-
-                particle_index += 1
-
-    if not collate:
-        for molecule in interchange.topology.molecules:
-            for virtual_site_key in molecule_virtual_site_map[interchange.topology.molecule_index(molecule)]:
-                particle_map[virtual_site_key] = particle_index
-
-                particle_index += 1
-
-    return particle_map
+    return interchange._get_topology_indices().get_particle_map(collate=collate)
@@ -1,10 +1,14 @@
+import os
 import pathlib
+from collections.abc import Callable, Iterator
+from functools import lru_cache
+from typing import Any
 
 import numpy
 from openff.toolkit import Quantity, unit
 
 from openff.interchange._experimental import experimental
-from openff.interchange.interop.gromacs._import.combine import make_monolithic
+from openff.interchange.interop.gromacs._import.combine import _read_lines, _resolve_include
 from openff.interchange.interop.gromacs.models.models import (
     GROMACSAngle,
     GROMACSAtom,
@@ -29,96 +33,55 @@ def from_files(top_file, gro_file, cls=GROMACSSystem) -> GROMACSSystem:
     Parse a GROMACS topology file. Adapted from Intermol.
 
     https://github.com/shirtsgroup/InterMol/blob/v0.1.2/intermol/gromacs/gromacs_parser.py
-    """
-    for line in make_monolithic(top_file):
-        stripped = line.split(";")[0].strip()
-
-        if len(stripped) == 0:
-            continue
 
-        if stripped.startswith(";"):
-            continue
-
-        if stripped.startswith("["):
-            if not len(stripped.split()) == 3 and stripped.endswith("]"):
-                raise ValueError("Invalid GROMACS topology file")
+    Each file (the topology file and every file it includes) is split into directive sections once, and each
+    section is parsed once, which is cached by the path and modification time of the file. Large, per-molecule
+    sections (atoms, pairs, bonds, angles, and dihedrals) are parsed into typed arrays at once, from which the
+    models are constructed without validating each line separately. The returned system holds copies of the
+    cached models, so it can be modified without affecting later calls.
+    """
+    current_directive: str | None = None
 
-            current_directive = stripped[1:-1].strip()
+    for section in _iter_sections(top_file):
+        if section.directive is not None:
+            current_directive = section.directive
 
-            continue
+        parsed = section.parse(current_directive)
 
         if current_directive == "defaults":
-            (
-                nonbonded_function,
-                combination_rule,
-                gen_pairs,
-                vdw_14,
-                coul_14,
-            ) = _process_defaults(line)
-
-            system = cls(
-                nonbonded_function=nonbonded_function,
-                combination_rule=combination_rule,
-                gen_pairs=gen_pairs,
-                vdw_14=vdw_14,
-                coul_14=coul_14,
-            )
+            for nonbonded_function, combination_rule, gen_pairs, vdw_14, coul_14 in parsed:
+                system = cls(
+                    nonbonded_function=nonbonded_function,
+                    combination_rule=combination_rule,
+                    gen_pairs=gen_pairs,
+                    vdw_14=vdw_14,
+                    coul_14=coul_14,
+                )
 
         elif current_directive == "atomtypes":
-            atom_type = _process_atomtype(line)
-            system.atom_types[atom_type.name] = atom_type
+            for atom_type in parsed:
+                system.atom_types[atom_type.name] = atom_type.model_copy()
 
         elif current_directive == "moleculetype":
-            molecule_type = _process_moleculetype(line)
-            system.molecule_types[molecule_type.name] = molecule_type
-
-            current_molecule = molecule_type.name
-
-        elif current_directive == "atoms":
-            system.molecule_types[current_molecule].atoms.append(
-                _process_atom(line),
-            )
-
-        elif current_directive == "pairs":
-            system.molecule_types[current_molecule].pairs.append(
-                _process_pair(line),
-            )
+            for molecule_type in parsed:
+                system.molecule_types[molecule_type.name] = molecule_type.model_copy(deep=True)
 
-        elif current_directive == "settles":
-            system.molecule_types[current_molecule].settles.append(
-                _process_settles(line),
-            )
-
-        elif current_directive == "bonds":
-            system.molecule_types[current_molecule].bonds.append(
-                _process_bond(line),
-            )
-
-        elif current_directive == "angles":
-            system.molecule_types[current_molecule].angles.append(
-                _process_angle(line),
-            )
-
-        elif current_directive == "dihedrals":
-            system.molecule_types[current_molecule].dihedrals.append(
-                _process_dihedral(line),
-            )
-
-        elif current_directive in ["exclusions"]:
-            system.molecule_types[current_molecule].exclusions.append(
-                _process_exclusion(line),
-            )
+                current_molecule = molecule_type.name
 
         elif current_directive == "system":
-            system.name = _process_system(line)
+            for system_name in parsed:
+                system.name = system_name
 
         elif current_directive == "molecules":
-            molecule_name, number_of_copies = _process_molecule(line)
-
-            system.molecules.append((molecule_name, number_of_copies))
+            system.molecules.extend(parsed)
 
         else:
-            raise ValueError(f"Invalid directive {current_directive}")
+            # exclusions hold a list of atoms, which must not be shared with the cache
+            deep = current_directive == "exclusions"
+
+            getattr(system.molecule_types[current_molecule], current_directive).extend(
+                [model.model_copy(deep=deep) for model in parsed],
+            )
 
     for molecule_type in system.molecule_types.values():
         this_molecule_atom_type_names = tuple(atom.atom_type for atom in molecule_type.atoms)
@@ -133,6 +96,85 @@ def from_files(top_file, gro_file, cls=GROMACSSystem) -> GROMACSSystem:
     return system
 
 
+class _Section:
+    """
+    Consecutive data lines of one file that belong to one directive section.
+
+    The directive is ``None`` if the lines precede the first directive of a file, in which case they continue
+    the section of the including file. The parsed lines are stored per directive, so each section is only
+    parsed once.
+    """
+
+    def __init__(self, directive: str | None):
+        self.directive = directive
+        self.lines: list[str] = list()
+
+        self._parsed: dict[str, list] = dict()
+
+    def parse(self, directive: str | None) -> list:
+        """Parse the lines of this section as part of a directive section, caching the result."""
+        if directive not in self._parsed:
+            if directive in _SECTION_PARSERS:
+                parsed = _SECTION_PARSERS[directive]([line.split() for line in self.lines])
+            elif directive in _LINE_PARSERS:
+                parsed = [_LINE_PARSERS[directive](line) for line in self.lines]
+            else:
+                raise ValueError(f"Invalid directive {directive}")
+
+            self._parsed[directive] = parsed
+
+        return self._parsed[directive]
+
+
+@lru_cache(maxsize=128)
+def _split_file(file: str, mtime_ns: int) -> tuple[str | _Section, ...]:
+    """
+    Split one file into includes (as written) and directive sections, without expanding includes.
+
+    Cached by path and modification time, like the lines of the file, so that the sections (and what is parsed
+    from them) are shared by all topologies including the file.
+    """
+    entries: list[str | _Section] = list()
+
+    for line in _read_lines(file, mtime_ns):
+        stripped = line.split(";")[0].strip()
+
+        if len(stripped) == 0:
+            continue
+
+        if stripped.startswith("#include"):
+            entries.append(stripped.split()[1])
+
+            continue
+
+        if stripped.startswith("["):
+            if not len(stripped.split()) == 3 and stripped.endswith("]"):
+                raise ValueError("Invalid GROMACS topology file")
+
+            entries.append(_Section(stripped[1:-1].strip()))
+
+            continue
+
+        if len(entries) == 0 or not isinstance(entries[-1], _Section):
+            entries.append(_Section(None))
+
+        entries[-1].lines.append(stripped)
+
+    return tuple(entries)
+
+
+def _iter_sections(file: str | pathlib.Path) -> Iterator[_Section]:
+    """Yield the directive sections of a file, recursively replacing each include with the included sections."""
+    resolved = os.path.abspath(file)
+    parent = pathlib.Path(file).parent
+
+    for entry in _split_file(resolved, os.stat(resolved).st_mtime_ns):
+        if isinstance(entry, _Section):
+            yield entry
+        else:
+            yield from _iter_sections(_resolve_include(entry, parent))
+
+
 def _process_defaults(line: str) -> tuple[int, int, str, float, float]:
     split = line.split()
 
@@ -212,49 +254,83 @@ def _process_moleculetype(line: str) -> GROMACSMolecule:
     return GROMACSMolecule(name=molecule_type, nrexcl=nrexcl)
 
 
-def _process_atom(
-    line: str,
-) -> GROMACSAtom:
-    split = line.split()
+def _tokenize(rows: list[list[str]], n_columns: int, directive: str) -> numpy.ndarray:
+    """Stack the first `n_columns` tokens of each line of a directive section into a 2-D array of strings."""
+    if any(len(row) < n_columns for row in rows):
+        raise ValueError(f"Each line of [ {directive} ] must have at least {n_columns} columns.")
 
-    atom_number = int(split[0])
-    atom_type = split[1]
-    residue_number = int(split[2])
-    residue_name = split[3]
-    atom_name = split[4]
-    charge_group_number = int(split[5])
-    charge = Quantity(float(split[6]), unit.elementary_charge)
-    mass = Quantity(float(split[7]), unit.amu)
-
-    return GROMACSAtom(
-        index=atom_number,
-        atom_type=atom_type,
-        name=atom_name,
-        residue_index=residue_number,
-        residue_name=residue_name,
-        charge_group_number=charge_group_number,
-        charge=charge,
-        mass=mass,
-    )
+    return numpy.array([row[:n_columns] for row in rows], dtype=str).reshape(len(rows), n_columns)
 
 
-def _process_pair(line: str) -> GROMACSPair:
-    split = line.split()
+def _parse_indices(tokens: numpy.ndarray, directive: str) -> list[list[int]]:
+    """Parse columns of (1-indexed) atom indices, checking that they are all positive."""
+    indices = tokens.astype(int)
 
-    atom1 = int(split[0])
-    atom2 = int(split[1])
+    if (indices < 1).any():
+        raise ValueError(f"Atom indices in [ {directive} ] must be positive.")
 
-    nonbonded_function = int(split[2])
+    return indices.tolist()
 
-    if nonbonded_function == 1:
-        return GROMACSPair(
-            atom1=atom1,
-            atom2=atom2,
+
+def _parse_function(tokens: numpy.ndarray, supported: tuple[int, ...], directive: str) -> numpy.ndarray:
+    """Parse a column of function types, checking that they are all supported."""
+    functions = tokens.astype(int)
+
+    unsupported = functions[~numpy.isin(functions, supported)]
+
+    if len(unsupported) > 0:
+        raise ValueError(f"Functions {supported} supported in [ {directive} ], parsed {unsupported[0]}.")
+
+    return functions
+
+
+def _parse_quantities(tokens: numpy.ndarray, units) -> list[Quantity]:
+    """Parse a column of floats into a list of quantities."""
+    return [Quantity(value, units) for value in tokens.astype(float).tolist()]
+
+
+def _process_atoms(rows: list[list[str]]) -> list[GROMACSAtom]:
+    tokens = _tokenize(rows, 8, "atoms")
+
+    indices = _parse_indices(tokens[:, [0, 2, 5]], "atoms")
+    charges = _parse_quantities(tokens[:, 6], unit.elementary_charge)
+    masses = _parse_quantities(tokens[:, 7], unit.amu)
+
+    return [
+        GROMACSAtom.model_construct(
+            index=atom_number,
+            atom_type=atom_type,
+            name=atom_name,
+            residue_index=residue_number,
+            residue_name=residue_name,
+            charge_group_number=charge_group_number,
+            charge=charge,
+            mass=mass,
         )
-    else:
-        raise ValueError(
-            f"Nonbonded function must be 1, parsed a pair with {nonbonded_function}.",
+        for (
+            atom_number,
+            residue_number,
+            charge_group_number,
+        ), atom_type, residue_name, atom_name, charge, mass in zip(
+            indices,
+            tokens[:, 1].tolist(),
+            tokens[:, 3].tolist(),
+            tokens[:, 4].tolist(),
+            charges,
+            masses,
         )
+    ]
+
+
+def _process_pairs(rows: list[list[str]]) -> list[GROMACSPair]:
+    tokens = _tokenize(rows, 3, "pairs")
+
+    _parse_function(tokens[:, 2], (1,), "pairs")
+
+    return [
+        GROMACSPair.model_construct(atom1=atom1, atom2=atom2)
+        for atom1, atom2 in _parse_indices(tokens[:, :2], "pairs")
+    ]
 
 
 def _process_settles(line: str) -> GROMACSSettles:
@@ -272,111 +348,94 @@ def _process_settles(line: str) -> GROMACSSettles:
     )
 
 
-def _process_bond(line: str) -> GROMACSBond:
-    split = line.split()
-
-    atom1 = int(split[0])
-    atom2 = int(split[1])
+def _process_bonds(rows: list[list[str]]) -> list[GROMACSBond]:
+    tokens = _tokenize(rows, 5, "bonds")
 
-    bond_function = int(split[2])
+    _parse_function(tokens[:, 2], (1,), "bonds")
 
-    if bond_function == 1:
-        bond_length = Quantity(float(split[3]), unit.nanometer)
-        bond_k = Quantity(
-            float(split[4]),
-            unit.kilojoule_per_mole / unit.nanometer**2,
-        )
-
-        return GROMACSBond(
-            atom1=atom1,
-            atom2=atom2,
-            function=bond_function,
-            length=bond_length,
-            k=bond_k,
+    return [
+        GROMACSBond.model_construct(atom1=atom1, atom2=atom2, function=1, length=length, k=k)
+        for (atom1, atom2), length, k in zip(
+            _parse_indices(tokens[:, :2], "bonds"),
+            _parse_quantities(tokens[:, 3], unit.nanometer),
+            _parse_quantities(tokens[:, 4], unit.kilojoule_per_mole / unit.nanometer**2),
         )
+    ]
 
-    else:
-        raise ValueError(f"Bond function must be 1, parsed {bond_function}.")
-
-
-def _process_angle(
-    line: str,
-) -> GROMACSAngle:
-    split = line.split()
-
-    atom1 = int(split[0])
-    atom2 = int(split[1])
-    atom3 = int(split[2])
 
-    angle_function = int(split[3])
+def _process_angles(rows: list[list[str]]) -> list[GROMACSAngle]:
+    tokens = _tokenize(rows, 6, "angles")
 
-    if angle_function == 1:
-        angle = Quantity(float(split[4]), unit.degrees)
-        k = Quantity(float(split[5]), unit.kilojoule_per_mole)
-    else:
-        raise ValueError(f"Angle function must be 1, parsed {angle_function}.")
-
-    return GROMACSAngle(
-        atom1=atom1,
-        atom2=atom2,
-        atom3=atom3,
-        angle=angle,
-        k=k,
-    )
+    _parse_function(tokens[:, 3], (1,), "angles")
 
+    return [
+        GROMACSAngle.model_construct(atom1=atom1, atom2=atom2, atom3=atom3, angle=angle, k=k)
+        for (atom1, atom2, atom3), angle, k in zip(
+            _parse_indices(tokens[:, :3], "angles"),
+            _parse_quantities(tokens[:, 4], unit.degrees),
+            _parse_quantities(tokens[:, 5], unit.kilojoule_per_mole),
+        )
+    ]
 
-def _process_dihedral(
-    line: str,
-) -> GROMACSDihedral:
-    split = line.split()
-
-    atom1 = int(split[0])
-    atom2 = int(split[1])
-    atom3 = int(split[2])
-    atom4 = int(split[3])
 
-    dihedral_function = int(split[4])
+def _process_dihedrals(rows: list[list[str]]) -> list[GROMACSDihedral]:
+    functions = _parse_function(_tokenize(rows, 5, "dihedrals")[:, 4], (1, 3, 4), "dihedrals")
+
+    dihedrals: list[GROMACSDihedral] = [None] * len(rows)  # type: ignore[list-item]
+
+    for function, dihedral_class in (
+        (1, PeriodicProperDihedral),
+        (4, PeriodicImproperDihedral),
+    ):
+        (positions,) = numpy.nonzero(functions == function)
+        tokens = _tokenize([rows[position] for position in positions.tolist()], 8, "dihedrals")
+
+        multiplicities = tokens[:, 7].astype(float).astype(int)
+
+        if (multiplicities < 1).any():
+            raise ValueError("Multiplicities in [ dihedrals ] must be positive.")
+
+        for position, (atom1, atom2, atom3, atom4), phi, k, multiplicity in zip(
+            positions.tolist(),
+            _parse_indices(tokens[:, :4], "dihedrals"),
+            _parse_quantities(tokens[:, 5], unit.degrees),
+            _parse_quantities(tokens[:, 6], unit.kilojoule_per_mole),
+            multiplicities.tolist(),
+        ):
+            dihedrals[position] = dihedral_class.model_construct(
+                atom1=atom1,
+                atom2=atom2,
+                atom3=atom3,
+                atom4=atom4,
+                phi=phi,
+                k=k,
+                multiplicity=multiplicity,
+            )
 
-    if dihedral_function == 1:
-        return PeriodicProperDihedral(
-            atom1=atom1,
-            atom2=atom2,
-            atom3=atom3,
-            atom4=atom4,
-            phi=Quantity(float(split[5]), unit.degrees),
-            k=Quantity(float(split[6]), unit.kilojoule_per_mole),
-            multiplicity=int(float(split[7])),
-        )
+    (positions,) = numpy.nonzero(functions == 3)
+    tokens = _tokenize([rows[position] for position in positions.tolist()], 11, "dihedrals")
 
-    elif dihedral_function == 3:
-        return RyckaertBellemansDihedral(
-            atom1=atom1,
-            atom2=atom2,
-            atom3=atom3,
-            atom4=atom4,
-            c0=Quantity(float(split[5]), unit.kilojoule_per_mole),
-            c1=Quantity(float(split[6]), unit.kilojoule_per_mole),
-            c2=Quantity(float(split[7]), unit.kilojoule_per_mole),
-            c3=Quantity(float(split[8]), unit.kilojoule_per_mole),
-            c4=Quantity(float(split[9]), unit.kilojoule_per_mole),
-            c5=Quantity(float(split[10]), unit.kilojoule_per_mole),
-        )
+    coefficients = [_parse_quantities(tokens[:, column], unit.kilojoule_per_mole) for column in range(5, 11)]
 
-    elif dihedral_function == 4:
-        return PeriodicImproperDihedral(
+    for position, (atom1, atom2, atom3, atom4), (c0, c1, c2, c3, c4, c5) in zip(
+        positions.tolist(),
+        _parse_indices(tokens[:, :4], "dihedrals"),
+        zip(*coefficients),
+    ):
+        dihedrals[position] = RyckaertBellemansDihedral.model_construct(
             atom1=atom1,
             atom2=atom2,
             atom3=atom3,
             atom4=atom4,
-            phi=Quantity(float(split[5]), unit.degrees),
-            k=Quantity(float(split[6]), unit.kilojoule_per_mole),
-            multiplicity=int(float(split[7])),
+            c0=c0,
+            c1=c1,
+            c2=c2,
+            c3=c3,
+            c4=c4,
+            c5=c5,
         )
 
-    else:
-        raise ValueError(
-            f"Dihedral functions 1, 3, and 4 supported, parsed {dihedral_function}.",
-        )
+    return dihedrals
 
 
 def _process_exclusion(line: str) -> GROMACSExclusion:
@@ -405,60 +464,63 @@ def _process_system(line: str) -> str:
     return system_name
 
 
-def _read_coordinates(file_path: pathlib.Path) -> unit.Quantity:
-    def _infer_coord_precision(file_path: pathlib.Path) -> int:
-        """
-        Infer decimal precision of coordinates by parsing periods in atoms lines.
-        """
-        with open(file_path) as file_in:
-            file_in.readline()
-            file_in.readline()
-            atom_line = file_in.readline()
-            period_indices = [i for i, x in enumerate(atom_line) if x == "."]
-            spacing_between_periods = period_indices[-1] - period_indices[-2]
-            precision = spacing_between_periods - 5
-            return precision
-
-    precision = _infer_coord_precision(file_path)
-    coordinate_width = precision + 5
-    # Column numbers in file separating x, y, z coords of each atom.
-    # Default (3 decimals of precision -> 8 columns) are 20, 28, 36, 44
-    coordinate_columns = [
-        20,
-        20 + coordinate_width,
-        20 + 2 * coordinate_width,
-        20 + 3 * coordinate_width,
-    ]
-
-    with open(file_path) as gro_file:
+_SECTION_PARSERS: dict[str, Callable[[list[list[str]]], list]] = {
+    "atoms": _process_atoms,
+    "pairs": _process_pairs,
+    "bonds": _process_bonds,
+    "angles": _process_angles,
+    "dihedrals": _process_dihedrals,
+}
+
+_LINE_PARSERS: dict[str, Callable[[str], Any]] = {
+    "defaults": _process_defaults,
+    "atomtypes": _process_atomtype,
+    "moleculetype": _process_moleculetype,
+    "settles": _process_settles,
+    "exclusions": _process_exclusion,
+    "system": _process_system,
+    "molecules": _process_molecule,
+}
+
+
+def _split_gro_file(file_path: pathlib.Path) -> tuple[list[bytes], bytes]:
+    """Split a .gro file into its atom lines and box line, without parsing each line."""
+    with open(file_path, "rb") as gro_file:
         # Throw away comment / name line
         gro_file.readline()
         n_atoms = int(gro_file.readline())
 
-        unitless_coordinates = numpy.zeros((n_atoms, 3))
-        for coordinate_index in range(n_atoms):
-            line = gro_file.readline()
-            _ = int(line[:5])  # residue_index
-            _ = line[5:10]  # residue_name
-            _ = line[10:15]  # atom_name
-            _ = int(line[15:20])  # atom_index
-            x = float(line[coordinate_columns[0] : coordinate_columns[1]])
-            y = float(line[coordinate_columns[1] : coordinate_columns[2]])
-            z = float(line[coordinate_columns[2] : coordinate_columns[3]])
-            unitless_coordinates[coordinate_index] = numpy.array([x, y, z])
+        lines = gro_file.read().split(b"\n", n_atoms + 1)
 
-        coordinates = unitless_coordinates * unit.nanometer
+    return lines[:n_atoms], lines[n_atoms]
 
-    return coordinates
 
+def _read_coordinates(file_path: pathlib.Path) -> unit.Quantity:
+    atom_lines, _ = _split_gro_file(file_path)
 
-def _read_box(file_path: pathlib.Path) -> unit.Quantity:
-    with open(file_path) as gro_file:
-        # Throw away comment / name line
-        gro_file.readline()
-        n_atoms = int(gro_file.readline())
+    if len(atom_lines) == 0:
+        return numpy.zeros((0, 3)) * unit.nanometer
 
-        box_line = gro_file.readlines()[n_atoms]
+    # Infer decimal precision of coordinates by parsing periods in the first atom line
+    period_indices = [i for i, x in enumerate(atom_lines[0]) if x == ord(".")]
+    precision = period_indices[-1] - period_indices[-2] - 5
+    coordinate_width = precision + 5
+
+    # Columns 20 and onward (default 3 decimals of precision -> 8 columns each, 20 through 44)
+    # hold the x, y, z coords of each atom. Lines are padded to a common width, viewed as a
+    # (n_atoms, line_width) character array, and the coordinate columns converted in bulk
+    lines = numpy.array(atom_lines)
+    characters = lines.view("S1").reshape(len(atom_lines), lines.itemsize)
+
+    coordinate_characters = numpy.ascontiguousarray(characters[:, 20 : 20 + 3 * coordinate_width])
+
+    unitless_coordinates = coordinate_characters.view(f"S{coordinate_width}").astype(numpy.float64)
+
+    return unitless_coordinates.reshape(-1, 3) * unit.nanometer
+
+
+def _read_box(file_path: pathlib.Path) -> unit.Quantity:
+    _, box_line = _split_gro_file(file_path)
 
     parsed_box = [float(val) for val in box_line.split()]
 
@@ -1,20 +1,23 @@
+import os
+from collections.abc import Iterator
+from functools import lru_cache
 from pathlib import Path
 
 
-def make_monolithic(topology_file: str, keep_file: bool = False) -> list[str]:
-    parent = Path(topology_file).parent
-    name = Path(topology_file).name
-
-    monolithic_path = parent / f"MONOLITHIC_{name}"
-
-    return_value = list()
+@lru_cache(maxsize=128)
+def _read_lines(file: str, mtime_ns: int) -> tuple[str, ...]:
+    """
+    Return the lines of one file, skipping empty lines and comments, without expanding its includes.
 
-    with open(topology_file) as in_obj, open(monolithic_path, "w") as out_obj:
-        for line in in_obj:
-            if len(line) == 0:
-                continue
+    Cached by path and modification time, so that force field files included by many topologies (or many
+    times by one topology) are only read once, and are read again if they change on disk. Includes are
+    expanded outside of this function, so that a change to a nested file is not hidden by its parent.
+    """
+    return_value: list[str] = list()
 
-            stripped = line.strip().split()
+    with open(file) as file_obj:
+        for line in file_obj:
+            stripped = line.split()
 
             if len(stripped) == 0:
                 continue
@@ -22,27 +25,50 @@ def make_monolithic(topology_file: str, keep_file: bool = False) -> list[str]:
             if stripped[0].startswith(";"):
                 continue
 
-            if stripped[0].startswith("#include"):
-                itp_file = stripped[1].strip('"')
+            return_value.append(line)
+
+    return tuple(return_value)
+
+
+def _read_file(file: str | Path) -> tuple[str, ...]:
+    """Return the (cached) lines of one file."""
+    resolved = os.path.abspath(file)
+
+    return _read_lines(resolved, os.stat(resolved).st_mtime_ns)
 
-                with open(itp_file) as itp_obj:
-                    for itp_line in itp_obj:
-                        if len(itp_line) == 0:
-                            continue
 
-                        if itp_line.startswith(";"):
-                            continue
+def _resolve_include(include: str, parent: Path) -> Path:
+    """Resolve an include, first relative to the working directory and then to the including file."""
+    itp_file = Path(include.strip('"'))
 
-                        # TODO: itp files can load from itp files, this block should recurse
+    if not itp_file.exists() and (parent / itp_file).exists():
+        itp_file = parent / itp_file
 
-                        return_value.append(itp_line)
-                        out_obj.write(itp_line)
+    return itp_file
+
+
+def _iter_lines(file: str | Path) -> Iterator[str]:
+    """Yield the lines of a file, recursively replacing each include with the lines of the included file."""
+    parent = Path(file).parent
+
+    for line in _read_file(file):
+        stripped = line.split()
+
+        if stripped[0].startswith("#include"):
+            yield from _iter_lines(_resolve_include(stripped[1], parent))
+
+        else:
+            yield line
+
+
+def make_monolithic(topology_file: str, keep_file: bool = False) -> list[str]:
+    parent = Path(topology_file).parent
+    name = Path(topology_file).name
 
-            else:
-                return_value.append(line)
-                out_obj.write(line)
+    return_value = list(_iter_lines(topology_file))
 
-    if Path(monolithic_path).exists() and not keep_file:
-        Path(monolithic_path).unlink()
+    if keep_file:
+        with open(parent / f"MONOLITHIC_{name}", "w") as out_obj:
+            out_obj.writelines(return_value)
 
     return return_value
@@ -87,13 +87,13 @@ def to_interchange(
         for _ in range(n_copies):
             for atom in molecule_type.atoms:
                 topology_atom_index = molecule_start_index + atom.index - 1
-                topology_key = TopologyKey(
+                topology_key = TopologyKey.model_construct(
                     atom_indices=(topology_atom_index,),
                 )
 
                 vdw.key_map.update(
                     {
-                        topology_key: PotentialKey(
+                        topology_key: PotentialKey.model_construct(
                             id=f"{atom.atom_type}",
                             associated_handler="ExternalSource",
                         ),
@@ -101,7 +101,7 @@ def to_interchange(
                 )
 
                 # GROMACS does NOT necessarily tie partial charges to atom types, so need a new key for each atom
-                electrostatics_key = PotentialKey(
+                electrostatics_key = PotentialKey.model_construct(
                     id=f"{topology_key.atom_indices[0]}",
                     associated_handler="ExternalSource",
                 )
@@ -178,14 +178,14 @@ def to_interchange(
 
             # TODO: Build constraints from settles
             for bond in molecule_type.bonds:
-                topology_key = BondKey(
+                topology_key = BondKey.model_construct(
                     atom_indices=(
                         bond.atom1 + molecule_start_index - 1,
                         bond.atom2 + molecule_start_index - 1,
                     ),
                 )
 
-                potential_key = PotentialKey(
+                potential_key = PotentialKey.model_construct(
                     id="-".join(map(str, topology_key.atom_indices)),
                     associated_handler="ExternalSource",
                 )
@@ -201,7 +201,7 @@ def to_interchange(
                 bonds.potentials.update({potential_key: potential})
 
             for angle in molecule_type.angles:
-                topology_key = AngleKey(
+                topology_key = AngleKey.model_construct(
                     atom_indices=(
                         angle.atom1 + molecule_start_index - 1,
                         angle.atom2 + molecule_start_index - 1,
@@ -209,7 +209,7 @@ def to_interchange(
                     ),
                 )
 
-                potential_key = PotentialKey(
+                potential_key = PotentialKey.model_construct(
                     id="-".join(map(str, topology_key.atom_indices)),
                     associated_handler="ExternalSource",
                 )
@@ -242,7 +242,7 @@ def to_interchange(
                 _key_assigned = False
                 mult = 0
                 while not _key_assigned:
-                    topology_key = key_type(
+                    topology_key = key_type.model_construct(
                         atom_indices=(
                             dihedral.atom1 + molecule_start_index - 1,
                             dihedral.atom2 + molecule_start_index - 1,
@@ -256,7 +256,7 @@ def to_interchange(
                     else:
                         mult += 1
 
-                potential_key = PotentialKey(
+                potential_key = PotentialKey.model_construct(
                     id="-".join(map(str, topology_key.atom_indices)),
                     mult=topology_key.mult,  # type: ignore[attr-defined]
                     associated_handler="ExternalSource",
@@ -1,3 +1,5 @@
+import itertools
+import math
 import pathlib
 import warnings
 from typing import IO
@@ -19,6 +21,71 @@ from openff.interchange.interop.gromacs.models.models import (
 from openff.interchange.pydantic import _BaseModel
 from openff.interchange.warnings import MissingPositionsWarning
 
+# the maximum number of atom lines formatted at once when writing a .gro file
+_GRO_LINES_PER_BLOCK = 100_000
+
+
+class _MergedAtomTypes:
+    """
+    A table of atom types merged by atomic number, mass, sigma, and epsilon.
+
+    Atom types are considered equal if their atomic numbers match and their masses, sigmas, and epsilons
+    each differ by less than a tolerance. Each merged atom type is stored in a bucket keyed by its atomic
+    number and quantized parameters, so that finding a match only checks neighboring buckets rather than
+    every merged atom type. A table can be passed to ``GROMACSWriter.to_top`` for several systems so that
+    atom types shared between them are written with the same names.
+    """
+
+    mass_tolerance = 1e-5  # amu
+    sigma_tolerance = 1e-5  # nanometer
+    epsilon_tolerance = 1e-5  # kilojoule_per_mole
+
+    def __init__(self):
+        self.atom_types: list[tuple[str, LennardJonesAtomType]] = list()
+
+        self._buckets: dict[tuple[int, ...], list[tuple[int, float, float, float]]] = dict()
+
+    def __len__(self) -> int:
+        return len(self.atom_types)
+
+    def find_or_add(self, atom_type: LennardJonesAtomType) -> str:
+        """Return the name of the merged atom type matching an atom type, adding it as a new one if none match."""
+        values = (
+            atom_type.mass.m_as(unit.amu),
+            atom_type.sigma.m_as(unit.nanometer),
+            atom_type.epsilon.m_as(unit.kilojoule_per_mole),
+        )
+        tolerances = (self.mass_tolerance, self.sigma_tolerance, self.epsilon_tolerance)
+
+        bucket = tuple(math.floor(value / tolerance) for value, tolerance in zip(values, tolerances))
+
+        # a match can only be within one bucket of this one along each parameter
+        matches = [
+            index
+            for offsets in itertools.product((-1, 0, 1), repeat=3)
+            for index, *other_values in self._buckets.get(
+                (atom_type.atomic_number, *(key + offset for key, offset in zip(bucket, offsets))),
+                (),
+            )
+            if all(
+                abs(value - other_value) < tolerance
+                for value, other_value, tolerance in zip(values, other_values, tolerances)
+            )
+        ]
+
+        if matches:
+            # match the earliest added atom type, as would a linear search
+            return self.atom_types[min(matches)][0]
+
+        name = f"AT_{len(self.atom_types)}"
+
+        self._buckets.setdefault((atom_type.atomic_number, *bucket), list()).append(
+            (len(self.atom_types), *values),
+        )
+        self.atom_types.append((name, atom_type))
+
+        return name
+
 
 class GROMACSWriter(_BaseModel):
     """Thin wrapper for writing GROMACS systems."""
@@ -27,8 +94,18 @@ class GROMACSWriter(_BaseModel):
     top_file: pathlib.Path | str
     gro_file: pathlib.Path | str
 
-    def to_top(self, monolithic: bool = True, _merge_atom_types: bool = False):
-        """Write a GROMACS topology file."""
+    def to_top(
+        self,
+        monolithic: bool = True,
+        _merge_atom_types: bool = False,
+        _merged_atom_types: _MergedAtomTypes | None = None,
+    ):
+        """
+        Write a GROMACS topology file.
+
+        If merging atom types, a table of merged atom types from writing other systems can be passed to re-use
+        (and extend) it, otherwise a new one is created.
+        """
         with open(self.top_file, "w") as top:
             self._write_defaults(top)
 
@@ -45,6 +122,7 @@ class GROMACSWriter(_BaseModel):
             mapping_to_reduced_atom_types = self._write_atomtypes(
                 top=atomtypes_file_object,
                 merge_atom_types=_merge_atom_types,
+                merged_atom_types=_merged_atom_types,
             )
 
             self._write_moleculetypes(
@@ -81,47 +159,21 @@ class GROMACSWriter(_BaseModel):
             f"{self.system.coul_14:8.6f}\n\n",
         )
 
-    def _write_atomtypes(self, top: IO[str], merge_atom_types: bool) -> dict[str, bool | str]:
+    def _write_atomtypes(
+        self,
+        top: IO[str],
+        merge_atom_types: bool,
+        merged_atom_types: _MergedAtomTypes | None = None,
+    ) -> dict[str, str]:
         top.write("[ atomtypes ]\n")
         top.write(
             ";type, bondingtype, atomic_number, mass, charge, ptype, sigma, epsilon\n",
         )
 
-        reduced_atom_types: list[tuple[str, LennardJonesAtomType]] = list()
-        mapping_to_reduced_atom_types = dict()
-
-        def _is_atom_type_in_list(
-            atom_type,
-            atom_type_list,
-        ) -> bool | str:
-            """
-            Check if the atom type is already in list.
-            """
-            from openff.units import Quantity
-
-            mass_tolerance = Quantity("1e-5 amu")
-            sigma_tolerance = Quantity("1e-5 nanometer")
-            epsilon_tolerance = Quantity("1e-5 kilojoule_per_mole")
-            for _at_name, _atom_type in atom_type_list:
-                if (
-                    atom_type.atomic_number == _atom_type.atomic_number
-                    and abs(atom_type.mass - _atom_type.mass) < mass_tolerance
-                    and abs(atom_type.sigma - _atom_type.sigma) < sigma_tolerance
-                    and abs(atom_type.epsilon - _atom_type.epsilon) < epsilon_tolerance
-                ):
-                    return _at_name
-            return False
-
-        def _get_new_entry_name(atom_type_list) -> str:
-            """
-            Entry name for atom type to be added.
-            """
-            if len(reduced_atom_types) > 0:
-                _previous_name = reduced_atom_types[-1][0]
-                _previous_idx = int(_previous_name.split("_")[1])
-                return f"AT_{_previous_idx + 1}"
-            else:
-                return "AT_0"
+        if merged_atom_types is None:
+            merged_atom_types = _MergedAtomTypes()
+
+        mapping_to_reduced_atom_types: dict[str, str] = dict()
 
         for atom_type in self.system.atom_types.values():
             if not isinstance(atom_type, LennardJonesAtomType):
@@ -130,15 +182,7 @@ class GROMACSWriter(_BaseModel):
                 )
 
             if merge_atom_types:
-                if _is_atom_type_in_list(atom_type, reduced_atom_types):
-                    mapping_to_reduced_atom_types[atom_type.name] = _is_atom_type_in_list(
-                        atom_type,
-                        reduced_atom_types,
-                    )
-                else:
-                    _at_name = _get_new_entry_name(reduced_atom_types)
-                    reduced_atom_types.append((_at_name, atom_type))
-                    mapping_to_reduced_atom_types[atom_type.name] = _at_name
+                mapping_to_reduced_atom_types[atom_type.name] = merged_atom_types.find_or_add(atom_type)
             else:
                 top.write(
                     f"{atom_type.name:<11s}\t"
@@ -154,7 +198,7 @@ class GROMACSWriter(_BaseModel):
             top.write("\n")
             return mapping_to_reduced_atom_types
 
-        for atom_type_name, atom_type in reduced_atom_types:
+        for atom_type_name, atom_type in merged_atom_types.atom_types:
             top.write(
                 f"{atom_type_name:<11s}\t"
                 f"{atom_type.atomic_number:6d}\t"
@@ -464,29 +508,44 @@ class GROMACSWriter(_BaseModel):
         gro.write("Generated by Interchange\n")
         gro.write(f"{n_particles}\n")
 
+        line_format = f"%5d%-5s%5s%5d%{decimal + 5}.{decimal}f%{decimal + 5}.{decimal}f%{decimal + 5}.{decimal}f\n"
+
         count = 0
         for molecule_name, n_copies in self.system.molecules:
             molecule = self.system.molecule_types[molecule_name]
 
-            for copy_index in range(n_copies):
-                for atom in molecule.atoms:
-                    gro.write(
-                        f"%5d%-5s%5s%5d"
-                        f"%{decimal + 5}.{decimal}f"
-                        f"%{decimal + 5}.{decimal}f"
-                        f"%{decimal + 5}.{decimal}f\n"
-                        % (
-                            (atom.residue_index + copy_index) % 100_000,
-                            atom.residue_name[:5],
-                            atom.name[:5],
-                            (count + 1) % 100000,
-                            positions[count, 0],
-                            positions[count, 1],
-                            positions[count, 2],
-                        ),
-                    )
-
-                    count += 1
+            n_atoms = len(molecule.atoms)
+
+            if n_atoms == 0 or n_copies == 0:
+                continue
+
+            residue_indices = numpy.asarray([atom.residue_index for atom in molecule.atoms], dtype=numpy.int64)
+            residue_names = [atom.residue_name[:5] for atom in molecule.atoms]
+            atom_names = [atom.name[:5] for atom in molecule.atoms]
+
+            # write in blocks of copies, each block formatted in a single operation
+            copies_per_block = max(1, _GRO_LINES_PER_BLOCK // n_atoms)
+
+            for first_copy in range(0, n_copies, copies_per_block):
+                these_copies = min(copies_per_block, n_copies - first_copy)
+                n_lines = these_copies * n_atoms
+
+                residue_numbers = (
+                    residue_indices[None, :] + numpy.arange(first_copy, first_copy + these_copies)[:, None]
+                ) % 100_000
+                atom_numbers = numpy.arange(count + 1, count + n_lines + 1) % 100_000
+
+                columns = zip(
+                    residue_numbers.ravel().tolist(),
+                    residue_names * these_copies,
+                    atom_names * these_copies,
+                    atom_numbers.tolist(),
+                    *positions[count : count + n_lines].T.tolist(),
+                )
+
+                gro.write((line_format * n_lines) % tuple(itertools.chain.from_iterable(columns)))
+
+                count += n_lines
 
         if self.system.box is None:
             raise UnsupportedExportError(
@@ -1,16 +1,19 @@
 """Export to LAMMPS."""
 
+from itertools import chain
 from pathlib import Path
 from typing import IO
 
 import numpy
 import packaging.version
-from openff.toolkit.topology.molecule import Atom, unit
+from openff.toolkit.topology.molecule import unit
 
 from openff.interchange import Interchange
 from openff.interchange.exceptions import UnsupportedExportError
+from openff.interchange.interop.common import _get_valence_arrays
 from openff.interchange.interop.lammps.export.provenance import get_lammps_version
-from openff.interchange.models import PotentialKey
+
+_LINES_PER_BLOCK = 100_000
 
 
 def to_lammps(interchange: Interchange, file_path: Path | str, include_type_labels: bool = False):
@@ -334,6 +337,19 @@ def _write_improper_coeffs(lmp_file: IO, interchange: Interchange):
     lmp_file.write("\n")
 
 
+def _write_rows(lmp_file: IO, line_format: str, columns: list[list]):
+    """Write rows of a section, formatting blocks of many lines with a single string formatting operation."""
+    n_rows = len(columns[0])
+
+    for start in range(0, n_rows, _LINES_PER_BLOCK):
+        stop = min(start + _LINES_PER_BLOCK, n_rows)
+
+        lmp_file.write(
+            (line_format * (stop - start))
+            % tuple(chain.from_iterable(zip(*(column[start:stop] for column in columns)))),
+        )
+
+
 def _write_atoms(lmp_file: IO, interchange: Interchange, atom_type_map: dict):
     """Write the Atoms section of a LAMMPS data file."""
     lmp_file.write("\nAtoms\n\n")
@@ -345,152 +361,74 @@ def _write_atoms(lmp_file: IO, interchange: Interchange, atom_type_map: dict):
     charges = interchange["Electrostatics"].charges
     positions = interchange.positions.m_as(unit.angstrom)  # type: ignore[union-attr]
 
-    """
-    for molecule_index, molecule in enumerate(interchange.topology.molecules):
-        for atom in molecule.atoms:
-            atom._molecule_index = molecule_index
-    """
-    # Looking up an atom in a topology is slow, so establish a mapping between
-    # atom and molecule indices by iterating through the topology once beforehand
-    atom_map: dict[int, Atom] = dict()
-
-    # the molecule is hashed for speed (bypassing an RDKit/OpenEye conversion)
-    # didn't look into hashing atoms
-    molecule_map: dict[int, int] = dict()
-    atom_molecule_map: dict[Atom, int] = dict()
-
-    for atom_index, atom in enumerate(interchange.topology.atoms):
-        atom_map[atom_index] = atom
-
-    for molecule_index, molecule in enumerate(interchange.topology.molecules):
-        # inject mol ID into hash to allow chemically-identical Molecules
-        # to be labelled with distinct IDs
-        molecule_hash = hash(
-            f"{molecule_index}_{molecule.ordered_connection_table_hash()}",
-        )
-        # TODO: see if this fix also applied for the same issue in GROMACS/AMBER writers
-
-        molecule_map[molecule_hash] = molecule_index
-        for atom in molecule.atoms:
-            atom_molecule_map[atom] = molecule_hash
-
-    def atom_index_to_molecule_index(atom_index: int) -> int:
-        """Given an atom index (in the topology), return the molecule index."""
-        return molecule_map[atom_molecule_map[atom_map[atom_index]]]
+    molecule_indices = interchange._get_topology_indices().atom_molecule_indices
+
+    atom_indices, type_indices = _get_valence_arrays(vdw_handler, atom_type_map_inv, 1)
+    atom_indices = atom_indices[:, 0]
+
+    _write_rows(
+        lmp_file,
+        "%d\t%d\t%d\t%.8g\t%.8g\t%.8g\t%.8g\n",
+        [
+            (atom_indices + 1).tolist(),
+            (molecule_indices[atom_indices] + 1).tolist(),
+            (type_indices + 1).tolist(),
+            [charges[top_key].m for top_key in vdw_handler.key_map],
+            *positions[atom_indices].T.tolist(),
+        ],
+    )
+
+
+def _write_valence_section(lmp_file: IO, collection, n_atoms_per_term: int):
+    """Write the terms of a valence collection, numbering types by the order of its potentials."""
+    atom_indices, type_indices = _get_valence_arrays(
+        collection,
+        {potential_key: index for index, potential_key in enumerate(collection.potentials)},
+        n_atoms_per_term,
+    )
+
+    _write_rows(
+        lmp_file,
+        "\t".join(["%d"] * (n_atoms_per_term + 2)) + "\n",
+        [
+            list(range(1, len(type_indices) + 1)),
+            (type_indices + 1).tolist(),
+            *(atom_indices + 1).T.tolist(),
+        ],
+    )
 
-    for _, (top_key, pot_key) in enumerate(vdw_handler.key_map.items()):
-        # TODO: Surely there's an easier way to get the molecule
-        #       index from an atom index?
-        atom_index = top_key.atom_indices[0]
-        molecule_index = atom_index_to_molecule_index(atom_index)
 
-        atom_type = atom_type_map_inv[pot_key]
-
-        charge = charges[top_key].m
-
-        pos = positions[atom_index]
-
-        lmp_file.write(
-            f"{atom_index + 1:d}\t"
-            f"{molecule_index + 1:d}\t"
-            f"{atom_type + 1:d}\t"
-            f"{charge:.8g}\t"
-            f"{pos[0]:.8g}\t"
-            f"{pos[1]:.8g}\t"
-            f"{pos[2]:.8g}\n",
-        )
-
-
-# Note: For this and the other valence writers, a significant portion of runtime
-# appears to be spent looking up the LAMMPS "type" index from the potential key.
-# (bond_map[pot_key]). Not sure why - I thought dictionary lookups were always
-# fast - but it might be worth looking into.
 def _write_bonds(lmp_file: IO, interchange: Interchange):
     """Write the Bonds section of a LAMMPS data file."""
     lmp_file.write("\nBonds\n\n")
 
-    bond_handler = interchange["Bonds"]
-    bond_map: dict[PotentialKey, int] = {
-        potential_key: index for index, potential_key in enumerate(bond_handler.potentials)
-    }
-
-    for bond_index, (top_key, pot_key) in enumerate(bond_handler.key_map.items()):
-        indices = top_key.atom_indices
-
-        lmp_file.write(
-            f"{bond_index + 1:d}\t{bond_map[pot_key] + 1:d}\t{indices[0] + 1:d}\t{indices[1] + 1:d}\n",
-        )
+    _write_valence_section(lmp_file, interchange["Bonds"], 2)
 
 
 def _write_angles(lmp_file: IO, interchange: Interchange):
     """Write the Angles section of a LAMMPS data file."""
     lmp_file.write("\nAngles\n\n")
 
-    angle_handler = interchange["Angles"]
-    angle_map: dict[PotentialKey, int] = {
-        potential_key: index for index, potential_key in enumerate(angle_handler.potentials)
-    }
-
-    for angle_index, (top_key, pot_key) in enumerate(angle_handler.key_map.items()):
-        indices = top_key.atom_indices
-
-        lmp_file.write(
-            f"{angle_index + 1:d}\t"
-            f"{angle_map[pot_key] + 1:d}\t"
-            f"{indices[0] + 1:d}\t"
-            f"{indices[1] + 1:d}\t"
-            f"{indices[2] + 1:d}\n",
-        )
+    _write_valence_section(lmp_file, interchange["Angles"], 3)
 
 
 def _write_propers(lmp_file: IO, interchange: Interchange):
     """Write the Dihedrals section of a LAMMPS data file."""
     lmp_file.write("\nDihedrals\n\n")
 
-    proper_handler = interchange["ProperTorsions"]
-    proper_map: dict[PotentialKey, int] = {
-        potential_key: index for index, potential_key in enumerate(proper_handler.potentials)
-    }
-
-    for proper_index, (top_key, pot_key) in enumerate(proper_handler.key_map.items()):
-        indices = top_key.atom_indices
-
-        lmp_file.write(
-            f"{proper_index + 1:d}\t"
-            f"{proper_map[pot_key] + 1:d}\t"
-            f"{indices[0] + 1:d}\t"
-            f"{indices[1] + 1:d}\t"
-            f"{indices[2] + 1:d}\t"
-            f"{indices[3] + 1:d}\n",
-        )
+    _write_valence_section(lmp_file, interchange["ProperTorsions"], 4)
 
 
 def _write_impropers(lmp_file: IO, interchange: Interchange):
     """Write the Impropers section of a LAMMPS data file."""
     lmp_file.write("\nImpropers\n\n")
 
-    improper_handler = interchange["ImproperTorsions"]
-    improper_map: dict[PotentialKey, int] = {
-        potential_key: index for index, potential_key in enumerate(improper_handler.potentials)
-    }
-
     # Molecule/Topology.impropers lists the central atom SECOND,
     # but the improper collection lists the central atom FIRST,
     # However, at this point we're not looking in the topology directly,
     # we're assuming that the contents of the collection is encompassing
-    for improper_index, (top_key, pot_key) in enumerate(
-        improper_handler.key_map.items(),
-    ):
-        indices = top_key.atom_indices
-
-        # https://github.com/openforcefield/openff-interchange/issues/544
-        # LAMMPS, at least with `improper_style cvff`, lists the
-        # central atom FIRST, which matches the collection
-        lmp_file.write(
-            f"{improper_index + 1:d}\t"
-            f"{improper_map[pot_key] + 1:d}\t"
-            f"{indices[0] + 1:d}\t"
-            f"{indices[1] + 1:d}\t"
-            f"{indices[2] + 1:d}\t"
-            f"{indices[3] + 1:d}\n",
-        )
+
+    # https://github.com/openforcefield/openff-interchange/issues/544
+    # LAMMPS, at least with `improper_style cvff`, lists the
+    # central atom FIRST, which matches the collection
+    _write_valence_section(lmp_file, interchange["ImproperTorsions"], 4)
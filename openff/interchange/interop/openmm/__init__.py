@@ -12,9 +12,11 @@ from openff.interchange.exceptions import (
     PluginCompatibilityError,
     UnsupportedExportError,
 )
+from openff.interchange.interop.openmm._cache import OpenMMSystemCache
 from openff.interchange.interop.openmm._import._import import from_openmm
 from openff.interchange.interop.openmm._positions import to_openmm_positions
 from openff.interchange.interop.openmm._topology import to_openmm_topology
+from openff.interchange.interop.openmm._update import OpenMMContextUpdater
 from openff.interchange.smirnoff._base import SMIRNOFFCollection
 
 if has_package("openmm"):
@@ -23,8 +25,11 @@ if has_package("openmm"):
 
 if TYPE_CHECKING:
     from openff.interchange import Interchange
+    from openff.interchange.interop.openmm._update import _ExportedTerms
 
 __all__ = [
+    "OpenMMContextUpdater",
+    "OpenMMSystemCache",
     "from_openmm",
     "to_openmm",
     "to_openmm_positions",
@@ -64,7 +69,52 @@ def to_openmm_system(
     system : openmm.System
         The corresponding OpenMM System object
 
+    Notes
+    -----
+    If an :py:class:`OpenMMSystemCache` is active, a copy of a System previously exported from an Interchange
+    with the same contents, using the same arguments, is returned instead of building a new System.
+
     """
+    from openff.interchange.components._fingerprint import _get_fingerprint
+    from openff.interchange.interop.openmm._cache import _ACTIVE_SYSTEM_CACHE
+
+    export_arguments = {
+        "combine_nonbonded_forces": combine_nonbonded_forces,
+        "add_constrained_forces": add_constrained_forces,
+        "ewald_tolerance": ewald_tolerance,
+        "hydrogen_mass": hydrogen_mass,
+    }
+
+    cache = _ACTIVE_SYSTEM_CACHE.get()
+
+    if cache is None:
+        return _create_openmm_system(interchange, **export_arguments)
+
+    key = cache.make_key(_get_fingerprint(interchange), **export_arguments)
+
+    system = cache.get(key)
+
+    if system is None:
+        system = _create_openmm_system(interchange, **export_arguments)
+
+        cache.put(key, system)
+
+    return system
+
+
+to_openmm = to_openmm_system
+
+
+@requires_package("openmm")
+def _create_openmm_system(
+    interchange: "Interchange",
+    combine_nonbonded_forces: bool,
+    add_constrained_forces: bool,
+    ewald_tolerance: float,
+    hydrogen_mass: PositiveFloat,
+    terms: "_ExportedTerms | None" = None,
+) -> "openmm.System":
+    """Build an OpenMM System, optionally recording the force and term indices produced by each potential."""
     from openff.toolkit import unit as off_unit
 
     from openff.interchange.interop.openmm._gbsa import _process_gbsa
@@ -99,18 +149,20 @@ def to_openmm_system(
         system,
         combine_nonbonded_forces=combine_nonbonded_forces,
         ewald_tolerance=ewald_tolerance,
+        terms=terms,
     )
 
     constrained_pairs = _process_constraints(interchange, system, particle_map)
 
-    _process_torsion_forces(interchange, system, particle_map)
-    _process_improper_torsion_forces(interchange, system, particle_map)
+    _process_torsion_forces(interchange, system, particle_map, terms=terms)
+    _process_improper_torsion_forces(interchange, system, particle_map, terms=terms)
     _process_angle_forces(
         interchange,
         system,
         add_constrained_forces=add_constrained_forces,
         constrained_pairs=constrained_pairs,
         particle_map=particle_map,
+        terms=terms,
     )
     _process_bond_forces(
         interchange,
@@ -118,6 +170,7 @@ def to_openmm_system(
         add_constrained_forces=add_constrained_forces,
         constrained_pairs=constrained_pairs,
         particle_map=particle_map,
+        terms=terms,
     )
 
     _process_gbsa(
@@ -152,9 +205,6 @@ def to_openmm_system(
     return system
 
 
-to_openmm = to_openmm_system
-
-
 @requires_package("openmm")
 def _to_pdb(
     file_path: Path | str | TextIO,
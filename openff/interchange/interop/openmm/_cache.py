@@ -0,0 +1,110 @@
+"""In-memory caching of exported OpenMM Systems."""
+
+import contextvars
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import openmm
+
+
+class OpenMMSystemCache:
+    """
+    A bounded, in-memory cache of OpenMM Systems keyed by the contents of the Interchange they were exported from.
+
+    Within a ``with`` block using this cache, every export of an ``Interchange`` to an OpenMM System - including
+    via ``Interchange.to_openmm_simulation``, ``Interchange.minimize``, and ``get_openmm_energies`` - first looks
+    for a System exported from an Interchange with the same collections, topology, and box, using the same
+    export arguments. Systems are stored serialized and each hit returns a new copy, so modifying a returned System
+    does not affect the cache. Because entries are keyed by contents, modifying any collection of an Interchange
+    means its previously cached Systems are no longer found.
+
+    .. warning :: This API is not stable and subject to change.
+
+    Parameters
+    ----------
+    max_size : int, default=8
+        The maximum number of stored Systems. When exceeded, the least recently used System is evicted.
+
+    Examples
+    --------
+    Compute energies and minimize without building the OpenMM System twice
+
+    .. code-block:: pycon
+
+        >>> from openff.interchange.drivers import get_openmm_energies
+        >>> from openff.interchange.interop.openmm import OpenMMSystemCache
+        >>> with OpenMMSystemCache(max_size=4):  # doctest: +SKIP
+        ...     energies = get_openmm_energies(interchange, combine_nonbonded_forces=False)
+        ...     interchange.minimize()
+
+    """
+
+    def __init__(self, max_size: int = 8):
+        self.max_size = max_size
+
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._tokens: list[contextvars.Token] = list()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(max_size={self.max_size})"
+
+    def __enter__(self) -> "OpenMMSystemCache":
+        self._tokens.append(_ACTIVE_SYSTEM_CACHE.set(self))
+
+        return self
+
+    def __exit__(self, *args):
+        _ACTIVE_SYSTEM_CACHE.reset(self._tokens.pop())
+
+    @staticmethod
+    def make_key(fingerprint: str, **export_arguments: Any) -> str:
+        """Combine the fingerprint of an Interchange and the arguments used to export it into a single key."""
+        return hashlib.sha256(
+            "\n".join([fingerprint, json.dumps(export_arguments, sort_keys=True)]).encode(),
+        ).hexdigest()
+
+    def get(self, key: str) -> "openmm.System | None":
+        """Return a copy of the System stored with a key, or ``None`` if it is not present."""
+        import openmm
+
+        with self._lock:
+            serialized = self._entries.get(key)
+
+            if serialized is None:
+                return None
+
+            self._entries.move_to_end(key)
+
+        return openmm.XmlSerializer.deserialize(serialized)
+
+    def put(self, key: str, system: "openmm.System"):
+        """Store a copy of a System with a key, evicting the least recently used Systems if needed."""
+        import openmm
+
+        serialized = openmm.XmlSerializer.serialize(system)
+
+        with self._lock:
+            self._entries[key] = serialized
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all Systems from this cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_ACTIVE_SYSTEM_CACHE: contextvars.ContextVar[OpenMMSystemCache | None] = contextvars.ContextVar(
+    "_ACTIVE_SYSTEM_CACHE",
+    default=None,
+)
@@ -196,7 +196,7 @@ def _convert_nonbonded_force(
     for idx in range(n_parametrized_particles):
         charge, sigma, epsilon = force.getParticleParameters(idx)
 
-        top_key = TopologyKey(atom_indices=(idx,))
+        top_key = TopologyKey.model_construct(atom_indices=(idx,))
 
         pot = Potential(
             parameters={
@@ -205,13 +205,13 @@ def _convert_nonbonded_force(
             },
         )
 
-        pot_key = PotentialKey(id=f"{idx}", associated_handler="vdW")
+        pot_key = PotentialKey.model_construct(id=f"{idx}", associated_handler="vdW")
         vdw.key_map.update({top_key: pot_key})
         vdw.potentials.update({pot_key: pot})
 
         # This quacks like it's from a library charge, but tracks that it's
         # not actually coming from a source
-        pot_key = PotentialKey(id=f"{idx}", associated_handler="ExternalSource")
+        pot_key = PotentialKey.model_construct(id=f"{idx}", associated_handler="ExternalSource")
         electrostatics.key_map.update({top_key: pot_key})
         electrostatics.potentials.update(
             {pot_key: Potential(parameters={"charge": from_openmm_quantity(charge)})},
@@ -250,8 +250,8 @@ def _convert_harmonic_bond_force(
 
     for idx in range(n_parametrized_bonds):
         atom1, atom2, length, k = force.getBondParameters(idx)
-        top_key = BondKey(atom_indices=(atom1, atom2))
-        pot_key = PotentialKey(id=f"{atom1}-{atom2}", associated_handler="Bonds")
+        top_key = BondKey.model_construct(atom_indices=(atom1, atom2))
+        pot_key = PotentialKey.model_construct(id=f"{atom1}-{atom2}", associated_handler="Bonds")
         pot = Potential(
             parameters={
                 "length": from_openmm_quantity(length),
@@ -280,8 +280,8 @@ def _convert_harmonic_angle_force(
 
     for idx in range(n_parametrized_angles):
         atom1, atom2, atom3, angle, k = force.getAngleParameters(idx)
-        top_key = AngleKey(atom_indices=(atom1, atom2, atom3))
-        pot_key = PotentialKey(
+        top_key = AngleKey.model_construct(atom_indices=(atom1, atom2, atom3))
+        pot_key = PotentialKey.model_construct(
             id=f"{atom1}-{atom2}-{atom3}",
             associated_handler="Angles",
         )
@@ -318,11 +318,11 @@ def _convert_periodic_torsion_force(
         atom1, atom2, atom3, atom4, per, phase, k = force.getTorsionParameters(idx)
         # TODO: Process layered torsions
         # TODO: Check if this torsion is an improper
-        top_key = ProperTorsionKey(atom_indices=(atom1, atom2, atom3, atom4), mult=0)
+        top_key = ProperTorsionKey.model_construct(atom_indices=(atom1, atom2, atom3, atom4), mult=0)
         while top_key in proper_torsions.key_map:
             top_key.mult = top_key.mult + 1  # type: ignore[operator]
 
-        pot_key = PotentialKey(
+        pot_key = PotentialKey.model_construct(
             id=f"{atom1}-{atom2}-{atom3}-{atom4}",
             mult=top_key.mult,
             associated_handler="ProperTorsions",
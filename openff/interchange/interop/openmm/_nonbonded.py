@@ -5,23 +5,29 @@ Helper functions for producing `openmm.Force` objects for non-bonded terms.
 import itertools
 import warnings
 from collections import defaultdict
-from typing import NamedTuple
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, NamedTuple
 
+import numpy
 from openff.toolkit import Molecule, Quantity, unit
 from openff.units.openmm import to_openmm as to_openmm_quantity
 from openff.utilities.utilities import has_package
 
 from openff.interchange import Interchange
 from openff.interchange.common._nonbonded import ElectrostaticsCollection, vdWCollection
+from openff.interchange.components.potentials import Potential
+from openff.interchange.components.toolkit import _get_bonded_pairs
 from openff.interchange.constants import _PME
 from openff.interchange.exceptions import (
     CannotSetSwitchingFunctionError,
     InternalInconsistencyError,
+    MissingParametersError,
     UnsupportedCutoffMethodError,
     UnsupportedExportError,
 )
 from openff.interchange.interop.common import _build_particle_map
 from openff.interchange.models import (
+    PotentialKey,
     SingleAtomChargeTopologyKey,
     TopologyKey,
     VirtualSiteKey,
@@ -32,6 +38,9 @@ if has_package("openmm"):
     import openmm
     import openmm.unit
 
+if TYPE_CHECKING:
+    from openff.interchange.interop.openmm._update import _ExportedTerms
+
 # TODO: Currently, these are not used since the openmm.CustomNonbondedForce does not handle 1-4 interactions and
 #       instead they are handleded by an openmm.CustomBondForce in which the scaled parameters are manually computed.
 _MIXING_RULE_EXPRESSIONS: dict[str, str] = {
@@ -56,6 +65,7 @@ def _process_nonbonded_forces(
     system: openmm.System,
     combine_nonbonded_forces: bool = False,
     ewald_tolerance: float = 1e-4,
+    terms: "_ExportedTerms | None" = None,
 ) -> dict[int | VirtualSiteKey, int]:
     """
     Process the non-bonded collections in an Interchange into corresponding openmm objects.
@@ -79,9 +89,6 @@ def _process_nonbonded_forces(
     has_virtual_sites = "VirtualSites" in interchange.collections
 
     if has_virtual_sites:
-        from openff.interchange.interop._virtual_sites import (
-            _virtual_site_parent_molecule_mapping,
-        )
         from openff.interchange.interop.common import (
             _check_virtual_site_exclusion_policy,
         )
@@ -90,15 +97,9 @@ def _process_nonbonded_forces(
 
         _check_virtual_site_exclusion_policy(virtual_sites)
 
-        virtual_site_molecule_map: dict[
-            VirtualSiteKey,
-            int,
-        ] = _virtual_site_parent_molecule_mapping(interchange)
-
-        molecule_virtual_site_map: dict[int, list[VirtualSiteKey]] = defaultdict(list)
-
-        for virtual_site_key, molecule_index in virtual_site_molecule_map.items():
-            molecule_virtual_site_map[molecule_index].append(virtual_site_key)
+        molecule_virtual_site_map: dict[int, list[VirtualSiteKey]] = (
+            interchange._get_topology_indices().molecule_virtual_site_map
+        )
 
     else:
         molecule_virtual_site_map = defaultdict(list)
@@ -145,18 +146,24 @@ def _process_nonbonded_forces(
     _data = _prepare_input_data(interchange)
 
     if combine_nonbonded_forces:
-        _func = _create_single_nonbonded_force
+        _create_single_nonbonded_force(
+            _data,
+            interchange,
+            system,
+            ewald_tolerance,
+            molecule_virtual_site_map,
+            openff_openmm_particle_map,
+            terms=terms,
+        )
     else:
-        _func = _create_multiple_nonbonded_forces
-
-    _func(
-        _data,
-        interchange,
-        system,
-        ewald_tolerance,
-        molecule_virtual_site_map,
-        openff_openmm_particle_map,
-    )
+        _create_multiple_nonbonded_forces(
+            _data,
+            interchange,
+            system,
+            ewald_tolerance,
+            molecule_virtual_site_map,
+            openff_openmm_particle_map,
+        )
 
     return openff_openmm_particle_map
 
@@ -168,25 +175,21 @@ def _add_particles_to_system(
 ) -> dict[int | VirtualSiteKey, int]:
     particle_map = _build_particle_map(
         interchange,
-        molecule_virtual_site_map,
         collate=False,
     )
 
-    for molecule in interchange.topology.molecules:
-        for atom in molecule.atoms:
-            atom_index = interchange.topology.atom_index(atom)
-
-            # Skip unit check for speed, trust the toolkit reports mass in Dalton
-            system_index = system.addParticle(mass=atom.mass.m)
+    for atom_index, atom in enumerate(interchange.topology.atoms):
+        # Skip unit check for speed, trust the toolkit reports mass in Dalton
+        system_index = system.addParticle(mass=atom.mass.m)
 
-            assert system_index == particle_map[atom_index], (
-                system_index,
-                atom_index,
-                particle_map[atom_index],
-            )
+        assert system_index == particle_map[atom_index], (
+            system_index,
+            atom_index,
+            particle_map[atom_index],
+        )
 
-    for molecule in interchange.topology.molecules:
-        for virtual_site_key in molecule_virtual_site_map[interchange.topology.molecule_index(molecule)]:
+    for molecule_index in range(interchange.topology.n_molecules):
+        for virtual_site_key in molecule_virtual_site_map[molecule_index]:
             from openff.interchange.interop.openmm._virtual_sites import (
                 _create_openmm_virtual_site,
             )
@@ -283,6 +286,7 @@ def _create_single_nonbonded_force(
     ewald_tolerance: float,
     molecule_virtual_site_map: dict["Molecule", list[VirtualSiteKey]],
     openff_openmm_particle_map: dict[int | VirtualSiteKey, int],
+    terms: "_ExportedTerms | None" = None,
 ):
     """Create a single openmm.NonbondedForce from vdW/electrostatics/virtual site collections."""
     if data.mixing_rule not in ("lorentz-berthelot", ""):
@@ -301,7 +305,7 @@ def _create_single_nonbonded_force(
 
     non_bonded_force = openmm.NonbondedForce()
     non_bonded_force.setName("Nonbonded force")
-    system.addForce(non_bonded_force)
+    nonbonded_force_index = system.addForce(non_bonded_force)
 
     # This limitation is independent of periodicity and vdW method, so check it first
     if data.electrostatics_method == "cutoff":
@@ -376,55 +380,35 @@ def _create_single_nonbonded_force(
 
     vdw = data.vdw_collection
 
-    for molecule in interchange.topology.molecules:
-        for atom in molecule.atoms:
-            non_bonded_force.addParticle(0.0, 1.0, 0.0)
-
-            atom_index = interchange.topology.atom_index(atom)
-
-            top_key = TopologyKey(atom_indices=(atom_index,))
-
-            if data.electrostatics_collection is not None:
-                try:
-                    partial_charge = partial_charges[top_key].m_as(unit.e)
-                except KeyError:
-                    # TODO: Work around this by updating the handler or .charges
-                    #       to support looking up directly based on atom index,
-                    #       not creating a new TopologyKey each time
-                    other_top_key = SingleAtomChargeTopologyKey(
-                        this_atom_index=atom_index,
-                    )
-
-                    partial_charge = partial_charges[other_top_key].m_as(unit.e)
-
-            else:
-                partial_charge = 0.0
-
-            if vdw is not None:
-                pot_key = vdw.key_map[top_key]
+    n_atoms = interchange.topology.n_atoms
 
-                sigma = vdw.potentials[pot_key].parameters["sigma"]
-                epsilon = vdw.potentials[pot_key].parameters["epsilon"]
+    atom_keys = [TopologyKey.model_construct(atom_indices=(index,)) for index in range(n_atoms)]
 
-                sigma = sigma.m_as(unit.nanometer)
-                epsilon = epsilon.m_as(unit.kilojoule / unit.mol)
-            else:
-                sigma = openmm.unit.Quantity(0.0, openmm.unit.nanometer)
-                epsilon = openmm.unit.Quantity(0.0, openmm.unit.kilojoules_per_mole)
-
-            openmm_atom_index = openff_openmm_particle_map[atom_index]
+    if data.electrostatics_collection is not None:
+        atom_charges = _get_partial_charges(partial_charges, atom_keys)
+    else:
+        atom_charges = numpy.zeros(n_atoms)
 
-            non_bonded_force.setParticleParameters(
-                openmm_atom_index,
-                partial_charge,
-                sigma,
-                epsilon,
-            )
+    if vdw is not None:
+        atom_vdw_parameters = _get_atom_vdw_parameters(vdw, n_atoms)
+    else:
+        atom_vdw_parameters = numpy.zeros((n_atoms, 2))
+
+    for _ in range(n_atoms):
+        non_bonded_force.addParticle(0.0, 1.0, 0.0)
+
+    for atom_index, (partial_charge, (sigma, epsilon)) in enumerate(
+        zip(atom_charges.tolist(), atom_vdw_parameters.tolist()),
+    ):
+        non_bonded_force.setParticleParameters(
+            openff_openmm_particle_map[atom_index],
+            partial_charge,
+            sigma,
+            epsilon,
+        )
 
-    for molecule in interchange.topology.molecules:
-        if has_virtual_sites:
-            molecule_index = interchange.topology.molecule_index(molecule)
-        else:
+    for molecule_index in range(interchange.topology.n_molecules):
+        if not has_virtual_sites:
             continue
 
         for virtual_site_key in molecule_virtual_site_map[molecule_index]:
@@ -470,16 +454,66 @@ def _create_single_nonbonded_force(
 
             parent_virtual_particle_mapping[parent_atom_index].append(force_index)
 
-    _create_exceptions(
+    scaled_exceptions = _create_exceptions(
         data,
         non_bonded_force,
         interchange,
         openff_openmm_particle_map,
         parent_virtual_particle_mapping,
+        atom_charges=atom_charges,
+        atom_vdw_parameters=atom_vdw_parameters,
     )
 
     _apply_switching_function(data.vdw_collection, non_bonded_force)
 
+    if terms is not None and not has_virtual_sites:
+        _record_nonbonded_terms(
+            data,
+            nonbonded_force_index,
+            openff_openmm_particle_map,
+            atom_keys,
+            atom_charges,
+            atom_vdw_parameters,
+            scaled_exceptions,
+            terms,
+        )
+
+
+def _record_nonbonded_terms(
+    data: _NonbondedData,
+    force_index: int,
+    openff_openmm_particle_map: dict[int | VirtualSiteKey, int],
+    atom_keys: list[TopologyKey],
+    atom_charges: numpy.ndarray,
+    atom_vdw_parameters: numpy.ndarray,
+    scaled_exceptions: numpy.ndarray,
+    terms: "_ExportedTerms",
+):
+    """Record which particles and 1-4 exceptions of a NonbondedForce are affected by each atom's parameters."""
+    from openff.interchange.interop.openmm._update import _ExportedNonbondedTerms
+
+    if data.vdw_collection is None or data.electrostatics_collection is None:
+        return
+
+    nonbonded = _ExportedNonbondedTerms(
+        force_index=force_index,
+        atom_keys=atom_keys,
+        particle_indices=[openff_openmm_particle_map[atom_index] for atom_index in range(len(atom_keys))],
+        charges=atom_charges.copy(),
+        vdw_parameters=atom_vdw_parameters.copy(),
+        coul_14=getattr(data.electrostatics_collection, "scale_14", 1.0),
+        vdw_14=getattr(data.vdw_collection, "scale_14", 1.0),
+    )
+
+    for atom_index, atom_key in enumerate(atom_keys):
+        nonbonded.vdw_atoms[data.vdw_collection.key_map[atom_key]].append(atom_index)
+
+    for exception_index, atom1, atom2 in scaled_exceptions.tolist():
+        nonbonded.exceptions[atom1].append((exception_index, atom2))
+        nonbonded.exceptions[atom2].append((exception_index, atom1))
+
+    terms.nonbonded = nonbonded
+
 
 def _create_exceptions(
     data: _NonbondedData,
@@ -487,21 +521,55 @@ def _create_exceptions(
     interchange: "Interchange",
     openff_openmm_particle_map: dict,
     parent_virtual_particle_mapping: defaultdict[int, list[int]],
-):
+    atom_charges: numpy.ndarray | None = None,
+    atom_vdw_parameters: numpy.ndarray | None = None,
+) -> numpy.ndarray:
+    """
+    Create atom-atom exceptions (and those of any virtual sites) following the pattern of `createExceptionsFromBonds`.
+
+    1-2 and 1-3 interactions are excluded and 1-4 interactions are scaled, using the per-atom charges (e) and
+    vdW parameters (sigma in nm, epsilon in kJ/mol) if provided, otherwise they are added with zeroed parameters.
+    Returns the index of each scaled exception and the (OpenFF) indices of its atoms as an array of shape (n, 3).
+    """
+    n_atoms = interchange.topology.n_atoms
+
+    bonded_pairs = _get_bonded_pairs(interchange.topology)
+
     # The topology indices reported by toolkit methods must be converted to openmm indices
-    bonds = [
-        sorted(openff_openmm_particle_map[interchange.topology.atom_index(a)] for a in bond.atoms)
-        for bond in interchange.topology.bonds
-    ]
+    particle_indices = numpy.asarray([openff_openmm_particle_map[index] for index in range(n_atoms)], dtype=int)
 
     coul_14 = getattr(data.electrostatics_collection, "scale_14", 1.0)
     vdw_14 = getattr(data.vdw_collection, "scale_14", 1.0)
 
     # First, create all atom-atom exceptions according to the conventional pattern
-    non_bonded_force.createExceptionsFromBonds(
-        bonds=bonds,
-        coulomb14Scale=coul_14,
-        lj14Scale=vdw_14,
+    for pairs in (bonded_pairs.pairs_12, bonded_pairs.pairs_13):
+        for particle1, particle2 in particle_indices[pairs].tolist():
+            non_bonded_force.addException(particle1, particle2, 0.0, 1.0, 0.0)
+
+    pairs_14 = bonded_pairs.pairs_14
+
+    if atom_charges is None:
+        atom_charges = numpy.zeros(n_atoms)
+
+    if atom_vdw_parameters is None:
+        atom_vdw_parameters = numpy.zeros((n_atoms, 2))
+
+    charge_products = atom_charges[pairs_14[:, 0]] * atom_charges[pairs_14[:, 1]] * coul_14
+    sigmas = 0.5 * (atom_vdw_parameters[pairs_14[:, 0], 0] + atom_vdw_parameters[pairs_14[:, 1], 0])
+    epsilons = numpy.sqrt(atom_vdw_parameters[pairs_14[:, 0], 1] * atom_vdw_parameters[pairs_14[:, 1], 1]) * vdw_14
+
+    first_scaled_exception = non_bonded_force.getNumExceptions()
+
+    for (particle1, particle2), charge_product, sigma, epsilon in zip(
+        particle_indices[pairs_14].tolist(),
+        charge_products.tolist(),
+        sigmas.tolist(),
+        epsilons.tolist(),
+    ):
+        non_bonded_force.addException(particle1, particle2, charge_product, sigma, epsilon)
+
+    scaled_exceptions = numpy.column_stack(
+        [first_scaled_exception + numpy.arange(len(pairs_14)), pairs_14],
     )
 
     # Faster to loop through exceptions and look up parents than opposite
@@ -567,6 +635,8 @@ def _create_exceptions(
                 if v1 < v2:
                     _add_zeroed_exception(non_bonded_force, v1, v2)
 
+    return scaled_exceptions
+
 
 def _create_multiple_nonbonded_forces(
     data: _NonbondedData,
@@ -576,8 +646,6 @@ def _create_multiple_nonbonded_forces(
     molecule_virtual_site_map: dict,
     openff_openmm_particle_map: dict[int | VirtualSiteKey, int],
 ):
-    from openff.interchange.components.toolkit import _get_14_pairs
-
     if molecule_virtual_site_map in (None, dict()):
         has_virtual_sites = False
     elif all([len(v) == 0 for v in molecule_virtual_site_map.values()]):
@@ -663,20 +731,11 @@ def _create_multiple_nonbonded_forces(
 
     coul_14, vdw_14 = _get_14_scaling_factors(data)
 
-    openmm_pairs = list()
-
-    for atom1, atom2 in _get_14_pairs(interchange.topology):
-        openff_indices = (
-            interchange.topology.atom_index(atom1),
-            interchange.topology.atom_index(atom2),
-        )
-
-        openmm_indices = (
-            openff_openmm_particle_map[openff_indices[0]],
-            openff_openmm_particle_map[openff_indices[1]],
-        )
+    # The topology indices of each 1-4 pair must be converted to openmm indices
+    openmm_pairs: set[tuple[int, int]] = set()
 
-        openmm_pairs.append(openmm_indices)
+    for atom1, atom2 in _get_bonded_pairs(interchange.topology).pairs_14.tolist():
+        openmm_pairs.add((openff_openmm_particle_map[atom1], openff_openmm_particle_map[atom2]))
 
     if electrostatics_force is not None:
         for i in range(electrostatics_force.getNumExceptions()):
@@ -788,9 +847,8 @@ def _create_vdw_force(
         for _ in molecule.atoms:
             vdw_force.addParticle(vdw_collection.default_parameter_values())
 
-    for molecule in interchange.topology.molecules:
+    for molecule_index in range(interchange.topology.n_molecules):
         if has_virtual_sites:
-            molecule_index = interchange.topology.molecule_index(molecule)
             for _ in molecule_virtual_site_map[molecule_index]:
                 vdw_force.addParticle(vdw_collection.default_parameter_values())
 
@@ -857,9 +915,8 @@ def _create_electrostatics_force(
         for _ in molecule.atoms:
             electrostatics_force.addParticle(0.0, 1.0, 0.0)
 
-    for molecule in interchange.topology.molecules:
+    for molecule_index in range(interchange.topology.n_molecules):
         if has_virtual_sites:
-            molecule_index = interchange.topology.molecule_index(molecule)
             for virtual_site_key in molecule_virtual_site_map[molecule_index]:
                 force_index = electrostatics_force.addParticle(0.0, 1.0, 0.0)
 
@@ -930,133 +987,200 @@ def _create_electrostatics_force(
     return electrostatics_force
 
 
-def _set_particle_parameters(
-    data: _NonbondedData,
-    vdw_force: openmm.CustomNonbondedForce,
-    electrostatics_force: openmm.NonbondedForce,
-    interchange: "Interchange",
-    has_virtual_sites: bool,
-    molecule_virtual_site_map: dict[int, list[VirtualSiteKey]],
-    openff_openmm_particle_map: dict[int | VirtualSiteKey, int],
-):
-    # TODO: Some funky plugins might have no charges, so there eventually should be
-    #       handling for electrostatics_force = None
-    electrostatics: ElectrostaticsCollection = data.electrostatics_collection
+def _gather_rows(
+    objects: list,
+    to_row: Callable[[Any], list[float]],
+) -> numpy.ndarray:
+    """
+    Convert each distinct object to a row of floats once and gather one row per object.
 
-    partial_charges = electrostatics.charges
+    Objects are distinguished by identity, so that i.e. a charge shared by many atoms is unit-converted once,
+    not once per atom.
+    """
+    row_indices: dict[int, int] = dict()
+    rows: list[list[float]] = list()
+    indices = numpy.empty(len(objects), dtype=numpy.int64)
 
-    vdw: vdWCollection = data.vdw_collection
+    for position, obj in enumerate(objects):
+        row_index = row_indices.get(id(obj))
 
-    for molecule in interchange.topology.molecules:
-        for atom in molecule.atoms:
-            atom_index = interchange.topology.atom_index(atom)
-            particle_index = openff_openmm_particle_map[atom_index]
-            # TODO: Actually process virtual site vdW parameters here
+        if row_index is None:
+            row_index = row_indices[id(obj)] = len(rows)
+            rows.append(to_row(obj))
 
-            top_key = TopologyKey(atom_indices=(atom_index,))
+        indices[position] = row_index
 
-            partial_charge = partial_charges[top_key].m_as(unit.e)
+    if len(rows) == 0:
+        return numpy.empty((0, 0))
 
-            if vdw is not None:
-                pot_key = vdw.key_map[top_key]
+    return numpy.asarray(rows, dtype=float)[indices]
 
-                if vdw.is_plugin:
-                    parameters = vdw.potentials[pot_key].parameters
 
-                    if hasattr(vdw, "modify_parameters"):
-                        # This method stripsopenmm.units ..
-                        parameters = vdw.modify_parameters(parameters)
-                    else:
-                        # so manually strip them if the method is not present
-                        parameters = {key: val.m for key, val in parameters.items()}
+def _get_partial_charges(
+    partial_charges: dict,
+    keys: list,
+) -> numpy.ndarray:
+    """Get the partial charge, in elementary charges, of the atom or virtual site of each key."""
+    charges = list()
 
-                else:
-                    sigma = vdw.potentials[pot_key].parameters["sigma"]
-                    epsilon = vdw.potentials[pot_key].parameters["epsilon"]
+    for key in keys:
+        try:
+            charges.append(partial_charges[key])
+        except KeyError:
+            # TODO: Work around this by updating the handler or .charges
+            #       to support looking up directly based on atom index,
+            #       not creating a new TopologyKey each time
+            charges.append(partial_charges[SingleAtomChargeTopologyKey(this_atom_index=key.atom_indices[0])])
+
+    return _gather_rows(charges, lambda charge: [charge.m_as(unit.e)])[:, 0]
+
+
+def _get_vdw_row(
+    vdw: vdWCollection,
+    potential: Potential,
+    is_virtual_site: bool,
+) -> list[float]:
+    if not vdw.is_plugin:
+        return [
+            potential.parameters["sigma"].m_as(unit.nanometer),
+            potential.parameters["epsilon"].m_as(unit.kilojoule / unit.mol),
+        ]
+
+    # a non-LJ vdW interaction might be mixed with virtual site parameters that have
+    # zeroed-out sigma and epsilon; in this case fall back to the defaults
+    if is_virtual_site and {tuple(potential.parameters.keys())} != {vdw.potential_parameters()}:
+        return [value for _, value in zip(vdw.potential_parameters(), vdw.default_parameter_values())]
+
+    if hasattr(vdw, "modify_parameters"):
+        # This method strips units ...
+        return [*vdw.modify_parameters(potential.parameters).values()]
+
+    # so manually strip them if the method is not present
+    return [value.m for value in potential.parameters.values()]
+
+
+def _get_vdw_rows(
+    vdw: vdWCollection,
+    potential_keys: list[PotentialKey],
+    is_virtual_site: bool,
+) -> numpy.ndarray:
+    """Get the unit-stripped vdW parameters of some potentials, one row per potential."""
+    if len(potential_keys) == 0:
+        return numpy.empty((0, 0))
+
+    if not vdw.is_plugin:
+        try:
+            parameters = vdw._get_parameter_arrays(potential_keys)
+        except ValueError:
+            # i.e. potentials with different parameters, which are converted one at a time below
+            pass
+        else:
+            return numpy.column_stack(
+                [
+                    parameters["sigma"].m_as(unit.nanometer),
+                    parameters["epsilon"].m_as(unit.kilojoule / unit.mol),
+                ],
+            )
 
-                    sigma = sigma.m_as(unit.nanometer)
-                    epsilon = epsilon.m_as(unit.kilojoule / unit.mol)
-            else:
-                sigma = openmm.unit.Quantity(0.0, openmm.unit.nanometer)
-                epsilon = openmm.unit.Quantity(0.0, openmm.unit.kilojoules_per_mole)
+    return numpy.asarray(
+        [_get_vdw_row(vdw, vdw.potentials[potential_key], is_virtual_site) for potential_key in potential_keys],
+        dtype=float,
+    )
 
-            if vdw_force is not None:
-                if vdw.is_plugin:
-                    vdw_force.setParticleParameters(
-                        particle_index,
-                        [*parameters.values()],
-                    )
-                    del parameters
-                else:
-                    vdw_force.setParticleParameters(particle_index, [sigma, epsilon])
 
-            if electrostatics_force is not None:
-                electrostatics_force.setParticleParameters(
-                    particle_index,
-                    partial_charge,
-                    0.0,
-                    0.0,
-                )
+def _get_vdw_parameters(
+    vdw: vdWCollection,
+    keys: list,
+    is_virtual_site: bool = False,
+) -> numpy.ndarray:
+    """
+    Get the unit-stripped vdW parameters of each key, one row per key.
 
-        for virtual_site_key in molecule_virtual_site_map[interchange.topology.molecule_index(molecule)]:
-            particle_index = openff_openmm_particle_map[virtual_site_key]
+    Lennard-Jones parameters are (sigma, epsilon) in nanometers and kJ/mol. Plugin parameters are in the
+    order and units returned by `modify_parameters` if present, otherwise their magnitudes. The parameters
+    of each distinct potential are only converted once.
+    """
+    potential_key_indices: dict[PotentialKey, int] = dict()
 
-            if vdw is not None:
-                pot_key = vdw.key_map[virtual_site_key]
+    indices = numpy.fromiter(
+        (potential_key_indices.setdefault(vdw.key_map[key], len(potential_key_indices)) for key in keys),
+        dtype=numpy.int64,
+        count=len(keys),
+    )
 
-                if vdw.is_plugin:
-                    parameters = vdw.potentials[pot_key].parameters
+    return _get_vdw_rows(vdw, [*potential_key_indices], is_virtual_site)[indices]
 
-                    if hasattr(vdw, "modify_parameters"):
-                        # This method strips openmm.units ..
 
-                        parameters = vdw.modify_parameters(parameters)
+def _get_atom_vdw_parameters(
+    vdw: vdWCollection,
+    n_atoms: int,
+) -> numpy.ndarray:
+    """
+    Get the unit-stripped vdW parameters of each atom, one row per atom, as in `_get_vdw_parameters`.
 
-                    else:
-                        # so manually strip them if the method is not present
-                        parameters = {key: val.m for key, val in parameters.items()}
-
-                    # a non-LJ vdW interaction might be mixed with virtual site parameters that have
-                    # zeroed-out sigma and epsilon; in this case
-                    if {tuple(vdw.potentials[pot_key].parameters.keys())} != {
-                        vdw.potential_parameters(),
-                    }:
-                        parameters = {
-                            key: val
-                            for key, val in zip(
-                                vdw.potential_parameters(),
-                                vdw.default_parameter_values(),
-                            )
-                        }
+    The terms of the atoms are taken from the arrays of the collection, which are used directly if it is
+    compacted, rather than looking up each atom in its key map.
+    """
+    atom_indices, potential_indices, potential_keys = vdw._get_arrays(key_class=TopologyKey)
 
-                else:
-                    sigma = vdw.potentials[pot_key].parameters["sigma"]
-                    epsilon = vdw.potentials[pot_key].parameters["epsilon"]
+    atom_indices = atom_indices.reshape(-1)
 
-                    sigma = sigma.m_as(unit.nanometer)
-                    epsilon = epsilon.m_as(unit.kilojoule / unit.mol)
-            else:
-                sigma = openmm.unit.Quantity(0.0, openmm.unit.nanometer)
-                epsilon = openmm.unit.Quantity(0.0, openmm.unit.kilojoules_per_mole)
+    if len(atom_indices) != n_atoms or (numpy.bincount(atom_indices, minlength=n_atoms) != 1).any():
+        raise MissingParametersError(f"Expected exactly one vdW parameter for each of {n_atoms} atoms.")
 
-            if vdw_force is not None:
-                # TODO: Refactor getting the "vdW" parameters by particle index into
-                #       a common function
+    rows = _get_vdw_rows(vdw, potential_keys, is_virtual_site=False)
 
-                if vdw.is_plugin:
-                    vdw_force.setParticleParameters(
-                        particle_index,
-                        [*parameters.values()],
-                    )
-                else:
-                    vdw_force.setParticleParameters(particle_index, [sigma, epsilon])
+    parameters = numpy.empty((n_atoms, rows.shape[1]))
+    parameters[atom_indices] = rows[potential_indices]
 
-            partial_charge = partial_charges[virtual_site_key].m_as(unit.e)
+    return parameters
 
-            if electrostatics_force is not None:
+
+def _set_particle_parameters(
+    data: _NonbondedData,
+    vdw_force: openmm.CustomNonbondedForce,
+    electrostatics_force: openmm.NonbondedForce,
+    interchange: "Interchange",
+    has_virtual_sites: bool,
+    molecule_virtual_site_map: dict[int, list[VirtualSiteKey]],
+    openff_openmm_particle_map: dict[int | VirtualSiteKey, int],
+):
+    # TODO: Some funky plugins might have no charges, so there eventually should be
+    #       handling for electrostatics_force = None
+    electrostatics: ElectrostaticsCollection = data.electrostatics_collection
+
+    vdw: vdWCollection = data.vdw_collection
+
+    atom_keys = [TopologyKey.model_construct(atom_indices=(index,)) for index in range(interchange.topology.n_atoms)]
+    virtual_site_keys = [key for keys in molecule_virtual_site_map.values() for key in keys]
+
+    for keys, particle_indices, is_virtual_site in [
+        (atom_keys, [openff_openmm_particle_map[index] for index in range(len(atom_keys))], False),
+        (virtual_site_keys, [openff_openmm_particle_map[key] for key in virtual_site_keys], True),
+    ]:
+        if len(keys) == 0:
+            continue
+
+        if vdw_force is not None:
+            # TODO: Actually process virtual site vdW parameters here
+            for particle_index, parameters in zip(
+                particle_indices,
+                (
+                    _get_vdw_parameters(vdw, keys, is_virtual_site)
+                    if is_virtual_site
+                    else _get_atom_vdw_parameters(vdw, len(keys))
+                ).tolist(),
+            ):
+                vdw_force.setParticleParameters(particle_index, parameters)
+
+        if electrostatics_force is not None:
+            for particle_index, partial_charge in zip(
+                particle_indices,
+                _get_partial_charges(electrostatics.charges, keys).tolist(),
+            ):
                 electrostatics_force.setParticleParameters(
                     particle_index,
-                    partial_charges[virtual_site_key].m_as(unit.e),
+                    partial_charge,
                     0.0,
                     0.0,
                 )
@@ -34,27 +34,18 @@ def to_openmm_topology(
     # Heavily cribbed from the toolkit
     # https://github.com/openforcefield/openff-toolkit/blob/0.11.0rc2/openff/toolkit/topology/topology.py
 
-    from collections import defaultdict
-
     from openff.toolkit import Topology
     from openff.toolkit.topology._mm_molecule import _SimpleBond
     from openff.toolkit.topology.molecule import Bond
 
-    from openff.interchange.interop._virtual_sites import (
-        _virtual_site_parent_molecule_mapping,
-    )
-
     # Copy topology to avoid modifying input (eg, when generating atom names)
     topology = Topology(interchange.topology)
 
-    virtual_site_molecule_map = _virtual_site_parent_molecule_mapping(interchange)
+    topology_indices = interchange._get_topology_indices()
 
-    molecule_virtual_site_map = defaultdict(list)
+    molecule_virtual_site_map = topology_indices.molecule_virtual_site_map
 
-    for virtual_site, molecule_index in virtual_site_molecule_map.items():
-        molecule_virtual_site_map[molecule_index].append(virtual_site)
-
-    has_virtual_sites = len(virtual_site_molecule_map) > 0
+    has_virtual_sites = len(topology_indices.virtual_site_keys) > 0
 
     virtual_site_element = openmm.app.element.Element.getByMass(0)
 
@@ -77,9 +68,7 @@ def to_openmm_topology(
     omm_atoms = []
 
     # For each atom in each molecule, determine which chain/residue it should be a part of
-    for molecule in topology.molecules:
-        molecule_index = topology.molecule_index(molecule)
-
+    for molecule_index, molecule in enumerate(topology.molecules):
         # No chain or residue can span more than one OFF molecule, so reset these to None for the first
         # atom in each molecule.
         last_chain = None
@@ -0,0 +1,269 @@
+"""Pushing modified parameters from an Interchange into an existing OpenMM Context."""
+
+from collections import defaultdict
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+import numpy
+from openff.utilities.utilities import requires_package
+
+from openff.interchange._annotations import PositiveFloat
+from openff.interchange.models import PotentialKey, TopologyKey
+
+if TYPE_CHECKING:
+    import openmm
+
+    from openff.interchange import Interchange
+
+
+class _ExportedNonbondedTerms:
+    """The particles and 1-4 exceptions of a single `openmm.NonbondedForce`, recorded at export."""
+
+    def __init__(
+        self,
+        force_index: int,
+        atom_keys: list[TopologyKey],
+        particle_indices: list[int],
+        charges: numpy.ndarray,
+        vdw_parameters: numpy.ndarray,
+        coul_14: float,
+        vdw_14: float,
+    ):
+        self.force_index = force_index
+        self.atom_keys = atom_keys
+        self.particle_indices = particle_indices
+        self.charges = charges
+        self.vdw_parameters = vdw_parameters
+        self.coul_14 = coul_14
+        self.vdw_14 = vdw_14
+
+        # vdW potential key -> indices of the atoms it is applied to
+        self.vdw_atoms: dict[PotentialKey, list[int]] = defaultdict(list)
+
+        # atom index -> (exception index, other atom index) of each scaled 1-4 exception
+        self.exceptions: dict[int, list[tuple[int, int]]] = defaultdict(list)
+
+
+class _ExportedTerms:
+    """
+    The OpenMM force and term indices produced by each potential, recorded while exporting an Interchange.
+
+    Along with the indices, the unit-stripped parameters of each potential at the time of export are stored,
+    so that changed potentials can be found later by comparing against them.
+    """
+
+    def __init__(self):
+        # collection name -> (force index, function converting parameters, function setting a term's parameters)
+        self.forces: dict[str, tuple[int, Callable[[dict], Any], Callable[..., None]]] = dict()
+
+        # collection name -> potential key -> [(term index, particle indices)]
+        self.terms: defaultdict[str, defaultdict[PotentialKey, list[tuple[int, tuple[int, ...]]]]] = defaultdict(
+            lambda: defaultdict(list),
+        )
+
+        # collection name -> potential key -> unit-stripped parameters
+        self.parameters: defaultdict[str, dict[PotentialKey, Any]] = defaultdict(dict)
+
+        self.nonbonded: _ExportedNonbondedTerms | None = None
+
+    def add_force(
+        self,
+        collection_name: str,
+        force_index: int,
+        convert: Callable[[dict], Any],
+        set_parameters: Callable[..., None],
+    ):
+        """Record the force holding the terms of a collection and how to convert and set their parameters."""
+        self.forces[collection_name] = (force_index, convert, set_parameters)
+
+    def add_term(
+        self,
+        collection_name: str,
+        potential_key: PotentialKey,
+        term_index: int,
+        particle_indices: tuple[int, ...],
+        parameters: Any,
+    ):
+        """Record a term produced by a potential."""
+        self.terms[collection_name][potential_key].append((term_index, particle_indices))
+        self.parameters[collection_name][potential_key] = parameters
+
+
+class OpenMMContextUpdater:
+    """
+    Export an Interchange to an OpenMM System and push later changes of its potentials into a live Context.
+
+    While exporting, the force and term index produced by each potential are recorded. After potentials of the
+    Interchange are modified (directly, or via ``Collection.set_force_field_parameters``), ``update_context``
+    sets the new parameters of only the affected terms and calls ``updateParametersInContext`` on the modified
+    forces, which avoids re-building the System and Context.
+
+    Supported are harmonic bonds, angles (harmonic or cosine), periodic proper and improper torsions,
+    Ryckaert-Bellemans torsions, and, if ``combine_nonbonded_forces=True`` and there are no virtual sites,
+    charges and Lennard-Jones parameters including the 1-4 exceptions they affect. Changes to key maps,
+    constraints, or the topology are not pushed and require exporting a new System.
+
+    .. warning :: This API is experimental and subject to change.
+
+    Parameters
+    ----------
+    interchange : openff.interchange.Interchange
+        The Interchange to export and later push changes from.
+    combine_nonbonded_forces : bool, default=True
+        See ``Interchange.to_openmm_system``.
+    add_constrained_forces : bool, default=False
+        See ``Interchange.to_openmm_system``.
+    ewald_tolerance : float, default=1e-4
+        See ``Interchange.to_openmm_system``.
+    hydrogen_mass : PositiveFloat, default=1.007947
+        See ``Interchange.to_openmm_system``.
+
+    Examples
+    --------
+    Scan a bond force constant without re-creating the Context
+
+    .. code-block:: pycon
+
+        >>> import openmm
+        >>> from openff.interchange.interop.openmm import OpenMMContextUpdater
+        >>> updater = OpenMMContextUpdater(interchange)  # doctest: +SKIP
+        >>> context = openmm.Context(updater.system, openmm.VerletIntegrator(1.0))  # doctest: +SKIP
+        >>> potential = interchange["Bonds"].potentials[potential_key]  # doctest: +SKIP
+        >>> potential.parameters["k"] *= 1.1  # doctest: +SKIP
+        >>> updater.update_context(context)  # doctest: +SKIP
+
+    """
+
+    @requires_package("openmm")
+    def __init__(
+        self,
+        interchange: "Interchange",
+        combine_nonbonded_forces: bool = True,
+        add_constrained_forces: bool = False,
+        ewald_tolerance: float = 1e-4,
+        hydrogen_mass: PositiveFloat = 1.007947,
+    ):
+        from openff.interchange.interop.openmm import _create_openmm_system
+
+        self.interchange = interchange
+
+        self._terms = _ExportedTerms()
+
+        self.system: openmm.System = _create_openmm_system(
+            interchange,
+            combine_nonbonded_forces=combine_nonbonded_forces,
+            add_constrained_forces=add_constrained_forces,
+            ewald_tolerance=ewald_tolerance,
+            hydrogen_mass=hydrogen_mass,
+            terms=self._terms,
+        )
+
+    def update_context(self, context: "openmm.Context") -> int:
+        """
+        Push parameters of potentials changed since the last update (or export) into a Context.
+
+        The Context must have been created from ``self.system`` or an unmodified copy of it.
+
+        Returns
+        -------
+        n_updated : int
+            The number of terms (including particles and exceptions) whose parameters were set.
+
+        """
+        system = context.getSystem()
+
+        n_updated = 0
+        modified_forces: set[int] = set()
+
+        for collection_name, (force_index, convert, set_parameters) in self._terms.forces.items():
+            collection = self.interchange[collection_name]
+            force = system.getForce(force_index)
+
+            exported_parameters = self._terms.parameters[collection_name]
+
+            for potential_key, terms in self._terms.terms[collection_name].items():
+                parameters = convert(collection.potentials[potential_key].parameters)
+
+                if parameters == exported_parameters[potential_key]:
+                    continue
+
+                exported_parameters[potential_key] = parameters
+
+                for term_index, particle_indices in terms:
+                    set_parameters(force, term_index, particle_indices, parameters)
+
+                n_updated += len(terms)
+                modified_forces.add(force_index)
+
+        if self._terms.nonbonded is not None:
+            n_nonbonded_updated = self._update_nonbonded_force(system.getForce(self._terms.nonbonded.force_index))
+
+            if n_nonbonded_updated > 0:
+                n_updated += n_nonbonded_updated
+                modified_forces.add(self._terms.nonbonded.force_index)
+
+        for force_index in sorted(modified_forces):
+            system.getForce(force_index).updateParametersInContext(context)
+
+        return n_updated
+
+    def _update_nonbonded_force(self, force: "openmm.NonbondedForce") -> int:
+        from openff.interchange.interop.openmm._nonbonded import _get_partial_charges, _get_vdw_row
+
+        nonbonded = self._terms.nonbonded
+
+        assert nonbonded is not None
+
+        changed_atoms: set[int] = set()
+
+        if "vdW" in self.interchange.collections:
+            vdw = self.interchange["vdW"]
+
+            for potential_key, atom_indices in nonbonded.vdw_atoms.items():
+                row = _get_vdw_row(vdw, vdw.potentials[potential_key], is_virtual_site=False)
+
+                if row != nonbonded.vdw_parameters[atom_indices[0]].tolist():
+                    nonbonded.vdw_parameters[atom_indices] = row
+                    changed_atoms.update(atom_indices)
+
+        if "Electrostatics" in self.interchange.collections:
+            # charges may depend on many potentials (i.e. charge increments), so re-compute all of them
+            charges = _get_partial_charges(
+                self.interchange["Electrostatics"]._get_charges(include_virtual_sites=False),
+                nonbonded.atom_keys,
+            )
+
+            (changed_charges,) = numpy.nonzero(charges != nonbonded.charges)
+
+            nonbonded.charges = charges
+            changed_atoms.update(changed_charges.tolist())
+
+        changed_exceptions: dict[int, tuple[int, int]] = dict()
+
+        for atom_index in changed_atoms:
+            sigma, epsilon = nonbonded.vdw_parameters[atom_index].tolist()
+
+            force.setParticleParameters(
+                nonbonded.particle_indices[atom_index],
+                float(nonbonded.charges[atom_index]),
+                sigma,
+                epsilon,
+            )
+
+            for exception_index, other_atom_index in nonbonded.exceptions[atom_index]:
+                changed_exceptions[exception_index] = (atom_index, other_atom_index)
+
+        for exception_index, (atom1, atom2) in changed_exceptions.items():
+            sigma1, epsilon1 = nonbonded.vdw_parameters[atom1].tolist()
+            sigma2, epsilon2 = nonbonded.vdw_parameters[atom2].tolist()
+
+            force.setExceptionParameters(
+                exception_index,
+                nonbonded.particle_indices[atom1],
+                nonbonded.particle_indices[atom2],
+                float(nonbonded.charges[atom1] * nonbonded.charges[atom2]) * nonbonded.coul_14,
+                (sigma1 + sigma2) / 2,
+                (epsilon1 * epsilon2) ** 0.5 * nonbonded.vdw_14,
+            )
+
+        return len(changed_atoms) + len(changed_exceptions)
@@ -2,16 +2,191 @@
 Helper functions for producing `openmm.Force` objects for valence terms.
 """
 
+from collections.abc import Callable, Iterator
+from typing import TYPE_CHECKING, Any
+
+import numpy
 from openff.toolkit import unit as off_unit
 from openff.units.openmm import to_openmm as to_openmm_quantity
 from openff.utilities.utilities import has_package
 
 from openff.interchange.exceptions import UnsupportedExportError
-from openff.interchange.models import VirtualSiteKey
+from openff.interchange.models import PotentialKey, VirtualSiteKey
 
 if has_package("openmm"):
     import openmm
 
+if TYPE_CHECKING:
+    from openff.interchange.interop.openmm._update import _ExportedTerms
+
+
+def _convert_once(
+    collection,
+    convert: Callable[[dict], Any],
+) -> Callable[[PotentialKey], Any]:
+    """
+    Return a function looking up the unit-stripped parameters associated with a potential key.
+
+    The parameters of each potential key are converted only once, so that i.e. the parameters shared by every
+    copy of a molecule are not converted again for each copy.
+    """
+    converted: dict[PotentialKey, Any] = dict()
+
+    def _get(potential_key: PotentialKey):
+        try:
+            return converted[potential_key]
+        except KeyError:
+            parameters = converted[potential_key] = convert(collection.potentials[potential_key].parameters)
+
+            return parameters
+
+    return _get
+
+
+def _encode_terms(
+    local_indices: numpy.ndarray,
+    potential_indices: numpy.ndarray,
+    n_atoms: int,
+    symmetric: bool,
+) -> numpy.ndarray:
+    """
+    Encode the molecule-local atom indices and potential index of each term as one integer, sorted per molecule.
+
+    Two molecules have the same terms if and only if their encoded terms are equal. If `symmetric`, a term and its
+    reverse are encoded the same.
+    """
+    if symmetric:
+        local_indices = numpy.where(
+            (local_indices[..., 0] > local_indices[..., -1])[..., None],
+            local_indices[..., ::-1],
+            local_indices,
+        )
+
+    codes = potential_indices.astype(numpy.int64)
+
+    for column in range(local_indices.shape[-1]):
+        codes = codes * n_atoms + local_indices[..., column]
+
+    return numpy.sort(codes, axis=-1)
+
+
+def _iter_terms(
+    interchange,
+    collection,
+    particle_map: dict[int | VirtualSiteKey, int],
+    convert: Callable[[dict], Any],
+    symmetric: bool = True,
+) -> Iterator[tuple[tuple[int, ...], PotentialKey, Any]]:
+    """
+    Yield the particle indices, potential key, and unit-stripped parameters of each term of a valence collection.
+
+    Terms are built once for the reference molecule of each entry of `Topology.identical_molecule_groups`, and
+    stamped out onto each duplicate by its atom map and the particle index of its first atom. The terms of each
+    duplicate are first checked (for all duplicates of a group at once) to be the mapped terms of the reference
+    molecule with the same potential keys; if `symmetric`, a term and its reverse are considered the same, as for
+    bonds, angles, and proper torsions. Terms of duplicates which do not match are built from their own keys, as
+    are all terms if any span molecules or have different numbers of atoms.
+    """
+    get_parameters = _convert_once(collection, convert)
+
+    def _iter_key_map():
+        for top_key, pot_key in collection.key_map.items():
+            yield tuple(particle_map[index] for index in top_key.atom_indices), pot_key, get_parameters(pot_key)
+
+    try:
+        atom_indices, potential_indices, potential_keys = collection._get_arrays()
+    except ValueError:
+        # terms with different numbers of atoms
+        yield from _iter_key_map()
+        return
+
+    if len(potential_indices) == 0:
+        return
+
+    topology_indices = interchange._get_topology_indices()
+    molecule_atom_offsets = topology_indices.molecule_atom_offsets
+    n_molecule_atoms = numpy.diff(molecule_atom_offsets)
+
+    term_molecules = topology_indices.atom_molecule_indices[atom_indices[:, 0]]
+    local_indices = atom_indices - molecule_atom_offsets[term_molecules, None]
+
+    if (local_indices < 0).any() or (local_indices >= n_molecule_atoms[term_molecules, None]).any():
+        yield from _iter_key_map()
+        return
+
+    def _iter_rows(rows: numpy.ndarray):
+        for term_atoms, potential_index in zip(atom_indices[rows].tolist(), potential_indices[rows].tolist()):
+            potential_key = potential_keys[potential_index]
+
+            yield tuple(particle_map[index] for index in term_atoms), potential_key, get_parameters(potential_key)
+
+    # the terms of molecule i are rows order[term_offsets[i]] through order[term_offsets[i + 1] - 1]
+    order = numpy.argsort(term_molecules, kind="stable")
+    term_counts = numpy.bincount(term_molecules, minlength=len(n_molecule_atoms))
+    term_offsets = numpy.concatenate([[0], numpy.cumsum(term_counts)])
+
+    # the atoms of each molecule are consecutive particles, whether or not virtual sites are collated
+    particle_offsets = numpy.fromiter(
+        (particle_map[offset] for offset in molecule_atom_offsets[:-1].tolist()),
+        dtype=numpy.int64,
+        count=len(n_molecule_atoms),
+    )
+
+    n_atoms_per_term = atom_indices.shape[1]
+    visited = numpy.zeros(len(n_molecule_atoms), dtype=bool)
+
+    for reference, group in interchange.topology.identical_molecule_groups.items():
+        n_atoms = int(n_molecule_atoms[reference])
+
+        reference_rows = order[term_offsets[reference] : term_offsets[reference + 1]]
+        reference_local_indices = local_indices[reference_rows]
+        reference_potential_indices = potential_indices[reference_rows]
+
+        molecules = numpy.array([molecule_index for molecule_index, _ in group], dtype=numpy.int64)
+        atom_maps = numpy.array(
+            [[atom_map[index] for index in range(n_atoms)] for _, atom_map in group],
+            dtype=numpy.int64,
+        ).reshape(len(group), n_atoms)
+
+        # the molecule-local atom indices of the reference molecule's terms, mapped onto each molecule in the group
+        mapped = atom_maps[:, reference_local_indices]
+
+        matches = term_counts[molecules] == len(reference_rows)
+
+        if len(potential_keys) * n_atoms**n_atoms_per_term >= 2**63:
+            # encoded terms would overflow
+            matches[:] = False
+
+        if matches.any():
+            rows = order[term_offsets[molecules[matches], None] + numpy.arange(len(reference_rows))]
+
+            matches[matches] = (
+                _encode_terms(mapped[matches], reference_potential_indices, n_atoms, symmetric)
+                == _encode_terms(local_indices[rows], potential_indices[rows], n_atoms, symmetric)
+            ).all(axis=1)
+
+        reference_keys = [potential_keys[index] for index in reference_potential_indices.tolist()]
+        reference_parameters = [get_parameters(potential_key) for potential_key in reference_keys]
+
+        particles = (particle_offsets[molecules, None, None] + mapped).tolist()
+
+        for molecule_index, match, molecule_particles in zip(molecules.tolist(), matches.tolist(), particles):
+            if match:
+                for term_particles, potential_key, parameters in zip(
+                    molecule_particles,
+                    reference_keys,
+                    reference_parameters,
+                ):
+                    yield tuple(term_particles), potential_key, parameters
+
+            else:
+                yield from _iter_rows(order[term_offsets[molecule_index] : term_offsets[molecule_index + 1]])
+
+            visited[molecule_index] = True
+
+    # terms of any molecules not in a group
+    yield from _iter_rows(order[~visited[term_molecules[order]]])
+
 
 def _process_constraints(
     interchange,
@@ -28,14 +203,12 @@ def _process_constraints(
 
     constrained_pairs: set[tuple[int, ...]] = set()
 
-    for top_key, pot_key in constraint_handler.key_map.items():
-        openff_indices = top_key.atom_indices
-        openmm_indices = tuple(particle_map[index] for index in openff_indices)
-
-        params = constraint_handler.potentials[pot_key].parameters
-        distance = params["distance"]
-        distance_omm = distance.m_as(off_unit.nanometer)
-
+    for openmm_indices, _, distance_omm in _iter_terms(
+        interchange,
+        constraint_handler,
+        particle_map,
+        lambda params: params["distance"].m_as(off_unit.nanometer),
+    ):
         constrained_pairs.add(tuple(sorted(openmm_indices)))
         openmm_sys.addConstraint(
             openmm_indices[0],
@@ -52,6 +225,7 @@ def _process_bond_forces(
     add_constrained_forces: bool,
     constrained_pairs: set[tuple[int, ...]],
     particle_map: dict[int | VirtualSiteKey, int],
+    terms: "_ExportedTerms | None" = None,
 ):
     """
     Process the Bonds section of an Interchange object.
@@ -68,14 +242,29 @@ def _process_bond_forces(
             f"Found an unsupported functional form in the bond handler:\n\t{bond_handler.expression=}",
         )
 
-    openmm_sys.addForce(harmonic_bond_force)
+    force_index = openmm_sys.addForce(harmonic_bond_force)
 
     has_constraint_handler = "Constraints" in interchange.collections
 
-    for top_key, pot_key in bond_handler.key_map.items():
-        openff_indices = top_key.atom_indices
-        openmm_indices = tuple(particle_map[index] for index in openff_indices)
+    if terms is not None:
+        terms.add_force(
+            "Bonds",
+            force_index,
+            _get_bond_parameters,
+            lambda force, index, particles, parameters: force.setBondParameters(
+                index,
+                *particles,
+                parameters[1],
+                parameters[0],
+            ),
+        )
 
+    for openmm_indices, pot_key, (k, length) in _iter_terms(
+        interchange,
+        bond_handler,
+        particle_map,
+        _get_bond_parameters,
+    ):
         if has_constraint_handler and not add_constrained_forces:
             if _is_constrained(
                 constrained_pairs,
@@ -84,19 +273,23 @@ def _process_bond_forces(
                 # This bond's length is constrained, dpo so not add a bond force
                 continue
 
-        params = bond_handler.potentials[pot_key].parameters
-        k = params["k"].m_as(
-            off_unit.kilojoule / off_unit.nanometer**2 / off_unit.mol,
-        )
-        length = params["length"].m_as(off_unit.nanometer)
-
-        harmonic_bond_force.addBond(
+        term_index = harmonic_bond_force.addBond(
             particle1=openmm_indices[0],
             particle2=openmm_indices[1],
             length=length,
             k=k,
         )
 
+        if terms is not None:
+            terms.add_term("Bonds", pot_key, term_index, openmm_indices, (k, length))
+
+
+def _get_bond_parameters(params: dict) -> tuple[float, float]:
+    return (
+        params["k"].m_as(off_unit.kilojoule / off_unit.nanometer**2 / off_unit.mol),
+        params["length"].m_as(off_unit.nanometer),
+    )
+
 
 def _process_angle_forces(
     interchange,
@@ -104,6 +297,7 @@ def _process_angle_forces(
     add_constrained_forces: bool,
     constrained_pairs: set[tuple[int, ...]],
     particle_map,
+    terms: "_ExportedTerms | None" = None,
 ):
     """
     Process the Angles section of an Interchange object.
@@ -128,14 +322,30 @@ def _process_angle_forces(
             f"Found an unsupported functional form in the angle handler:\n\t{angle_handler.expression=}",
         )
 
-    openmm_sys.addForce(harmonic_angle_force)
+    force_index = openmm_sys.addForce(harmonic_angle_force)
 
     has_constraint_handler = "Constraints" in interchange.collections
 
-    for top_key, pot_key in angle_handler.key_map.items():
-        openff_indices = top_key.atom_indices
-        openmm_indices = tuple(particle_map[index] for index in openff_indices)
+    convert: Callable[[dict], Any]
+
+    if custom:
+
+        def convert(params: dict) -> list:
+            return [to_openmm_quantity(params[val]) for val in angle_handler.potential_parameters()]
+
+        def set_parameters(force, index, particles, parameters):
+            force.setAngleParameters(index, *particles, parameters)
 
+    else:
+        convert = _get_harmonic_angle_parameters
+
+        def set_parameters(force, index, particles, parameters):
+            force.setAngleParameters(index, *particles, parameters[1], parameters[0])
+
+    if terms is not None:
+        terms.add_force("Angles", force_index, convert, set_parameters)
+
+    for openmm_indices, pot_key, parameter_values in _iter_terms(interchange, angle_handler, particle_map, convert):
         if has_constraint_handler and not add_constrained_forces:
             if _is_constrained(
                 constrained_pairs,
@@ -154,10 +364,7 @@ def _process_angle_forces(
                         continue
 
         if custom:
-            params = angle_handler.potentials[pot_key].parameters
-            parameter_values = [to_openmm_quantity(params[val]) for val in angle_handler.potential_parameters()]
-
-            harmonic_angle_force.addAngle(
+            term_index = harmonic_angle_force.addAngle(
                 openmm_indices[0],
                 openmm_indices[1],
                 openmm_indices[2],
@@ -165,11 +372,9 @@ def _process_angle_forces(
             )
 
         else:
-            params = angle_handler.potentials[pot_key].parameters
-            k = params["k"].m_as(off_unit.kilojoule / off_unit.rad / off_unit.mol)
-            angle = params["angle"].m_as(off_unit.radian)
+            k, angle = parameter_values
 
-            harmonic_angle_force.addAngle(
+            term_index = harmonic_angle_force.addAngle(
                 particle1=openmm_indices[0],
                 particle2=openmm_indices[1],
                 particle3=openmm_indices[2],
@@ -177,51 +382,56 @@ def _process_angle_forces(
                 k=k,
             )
 
+        if terms is not None:
+            terms.add_term("Angles", pot_key, term_index, openmm_indices, parameter_values)
+
 
-def _process_torsion_forces(interchange, openmm_sys, particle_map):
+def _get_harmonic_angle_parameters(params: dict) -> tuple[float, float]:
+    return (
+        params["k"].m_as(off_unit.kilojoule / off_unit.rad / off_unit.mol),
+        params["angle"].m_as(off_unit.radian),
+    )
+
+
+def _process_torsion_forces(interchange, openmm_sys, particle_map, terms: "_ExportedTerms | None" = None):
     if "ProperTorsions" in interchange.collections:
-        _process_proper_torsion_forces(interchange, openmm_sys, particle_map)
+        _process_proper_torsion_forces(interchange, openmm_sys, particle_map, terms=terms)
     if "RBTorsions" in interchange.collections:
-        _process_rb_torsion_forces(interchange, openmm_sys, particle_map)
+        _process_rb_torsion_forces(interchange, openmm_sys, particle_map, terms=terms)
+
 
+def _set_periodic_torsion_parameters(force, index, particles, parameters):
+    periodicity, phase, k, idivf = parameters
 
-def _process_proper_torsion_forces(interchange, openmm_sys, particle_map):
+    force.setTorsionParameters(index, *particles, periodicity, phase, k / idivf)
+
+
+def _process_proper_torsion_forces(interchange, openmm_sys, particle_map, terms: "_ExportedTerms | None" = None):
     """
     Process the Propers section of an Interchange object.
     """
     torsion_force = openmm.PeriodicTorsionForce()
-    openmm_sys.addForce(torsion_force)
+    force_index = openmm_sys.addForce(torsion_force)
 
     proper_torsion_handler = interchange["ProperTorsions"]
 
-    for top_key, pot_key in proper_torsion_handler.key_map.items():
-        openff_indices = top_key.atom_indices
-        openmm_indices = tuple(particle_map[index] for index in openff_indices)
-
-        params = proper_torsion_handler.potentials[pot_key].parameters
-
-        k = params["k"].m_as(off_unit.kilojoule / off_unit.mol)
-        periodicity = int(params["periodicity"])
-        phase = params["phase"].m_as(off_unit.radian)
-        # Work around a pint gotcha:
-        # >>> import pint
-        # >>> u = pint.UnitRegistry()
-        # >>> val
-        # <Quantity(1.0, 'dimensionless')>
-        # >>> val.m
-        # 0.9999999999
-        # >>> int(val)
-        # 0
-        # >>> int(round(val, 0))
-        # 1
-        # >>> round(val.m_as(u.dimensionless), 0)
-        # 1.0
-        # >>> round(val, 0).m
-        # 1.0
-        idivf = params["idivf"].m_as(off_unit.dimensionless)
+    if terms is not None:
+        terms.add_force(
+            "ProperTorsions",
+            force_index,
+            _get_periodic_torsion_parameters,
+            _set_periodic_torsion_parameters,
+        )
+
+    for openmm_indices, pot_key, (periodicity, phase, k, idivf) in _iter_terms(
+        interchange,
+        proper_torsion_handler,
+        particle_map,
+        _get_periodic_torsion_parameters,
+    ):
         if idivf == 0:
             raise RuntimeError("Found an idivf of 0.")
-        torsion_force.addTorsion(
+        term_index = torsion_force.addTorsion(
             openmm_indices[0],
             openmm_indices[1],
             openmm_indices[2],
@@ -231,30 +441,62 @@ def _process_proper_torsion_forces(interchange, openmm_sys, particle_map):
             k / idivf,
         )
 
+        if terms is not None:
+            terms.add_term("ProperTorsions", pot_key, term_index, openmm_indices, (periodicity, phase, k, idivf))
+
+
+def _get_periodic_torsion_parameters(params: dict) -> tuple[int, float, float, float]:
+    k = params["k"].m_as(off_unit.kilojoule / off_unit.mol)
+    periodicity = int(params["periodicity"])
+    phase = params["phase"].m_as(off_unit.radian)
+    # Work around a pint gotcha:
+    # >>> import pint
+    # >>> u = pint.UnitRegistry()
+    # >>> val
+    # <Quantity(1.0, 'dimensionless')>
+    # >>> val.m
+    # 0.9999999999
+    # >>> int(val)
+    # 0
+    # >>> int(round(val, 0))
+    # 1
+    # >>> round(val.m_as(u.dimensionless), 0)
+    # 1.0
+    # >>> round(val, 0).m
+    # 1.0
+    idivf = params["idivf"].m_as(off_unit.dimensionless)
+
+    return periodicity, phase, k, idivf
+
+
+def _get_rb_torsion_parameters(params: dict) -> list[float]:
+    return [params[f"c{index}"].m_as(off_unit.kilojoule / off_unit.mol) for index in range(6)]
 
-def _process_rb_torsion_forces(interchange, openmm_sys, particle_map):
+
+def _process_rb_torsion_forces(interchange, openmm_sys, particle_map, terms: "_ExportedTerms | None" = None):
     """
     Process Ryckaert-Bellemans torsions.
     """
     rb_force = openmm.RBTorsionForce()
-    openmm_sys.addForce(rb_force)
+    force_index = openmm_sys.addForce(rb_force)
 
     rb_torsion_handler = interchange["RBTorsions"]
 
-    for top_key, pot_key in rb_torsion_handler.key_map.items():
-        openff_indices = top_key.atom_indices
-        openmm_indices = tuple(particle_map[index] for index in openff_indices)
-
-        params = rb_torsion_handler.potentials[pot_key].parameters
-
-        c0 = params["c0"].m_as(off_unit.kilojoule / off_unit.mol)
-        c1 = params["c1"].m_as(off_unit.kilojoule / off_unit.mol)
-        c2 = params["c2"].m_as(off_unit.kilojoule / off_unit.mol)
-        c3 = params["c3"].m_as(off_unit.kilojoule / off_unit.mol)
-        c4 = params["c4"].m_as(off_unit.kilojoule / off_unit.mol)
-        c5 = params["c5"].m_as(off_unit.kilojoule / off_unit.mol)
+    if terms is not None:
+        terms.add_force(
+            "RBTorsions",
+            force_index,
+            _get_rb_torsion_parameters,
+            lambda force, index, particles, parameters: force.setTorsionParameters(index, *particles, *parameters),
+        )
 
-        rb_force.addTorsion(
+    for openmm_indices, pot_key, (c0, c1, c2, c3, c4, c5) in _iter_terms(
+        interchange,
+        rb_torsion_handler,
+        particle_map,
+        _get_rb_torsion_parameters,
+    ):
+        term_index = rb_force.addTorsion(
             openmm_indices[0],
             openmm_indices[1],
             openmm_indices[2],
@@ -267,35 +509,54 @@ def _process_rb_torsion_forces(interchange, openmm_sys, particle_map):
             c5,
         )
 
+        if terms is not None:
+            terms.add_term("RBTorsions", pot_key, term_index, openmm_indices, [c0, c1, c2, c3, c4, c5])
+
+
+def _get_improper_torsion_parameters(params: dict) -> tuple[int, float, float, int]:
+    return (
+        int(params["periodicity"]),
+        params["phase"].m_as(off_unit.radian),
+        params["k"].m_as(off_unit.kilojoule / off_unit.mol),
+        int(params["idivf"]),
+    )
 
-def _process_improper_torsion_forces(interchange, openmm_sys, particle_map):
+
+def _process_improper_torsion_forces(interchange, openmm_sys, particle_map, terms: "_ExportedTerms | None" = None):
     """
     Process the Impropers section of an Interchange object.
     """
     if "ImproperTorsions" not in interchange.collections.keys():
         return
 
-    for force in openmm_sys.getForces():
+    for force_index, force in enumerate(openmm_sys.getForces()):
         if type(force) is openmm.PeriodicTorsionForce:
             torsion_force = force
             break
     else:
         torsion_force = openmm.PeriodicTorsionForce()
+        # this force is not added to the system, so there are no terms to record
+        terms = None
 
     improper_torsion_handler = interchange["ImproperTorsions"]
 
-    for top_key, pot_key in improper_torsion_handler.key_map.items():
-        openff_indices = top_key.atom_indices
-        openmm_indices = tuple(particle_map[index] for index in openff_indices)
-
-        params = improper_torsion_handler.potentials[pot_key].parameters
-
-        k = params["k"].m_as(off_unit.kilojoule / off_unit.mol)
-        periodicity = int(params["periodicity"])
-        phase = params["phase"].m_as(off_unit.radian)
-        idivf = int(params["idivf"])
+    if terms is not None:
+        terms.add_force(
+            "ImproperTorsions",
+            force_index,
+            _get_improper_torsion_parameters,
+            _set_periodic_torsion_parameters,
+        )
 
-        torsion_force.addTorsion(
+    # the order of atoms in an improper torsion is significant, so it is not symmetric
+    for openmm_indices, pot_key, (periodicity, phase, k, idivf) in _iter_terms(
+        interchange,
+        improper_torsion_handler,
+        particle_map,
+        _get_improper_torsion_parameters,
+        symmetric=False,
+    ):
+        term_index = torsion_force.addTorsion(
             openmm_indices[0],
             openmm_indices[1],
             openmm_indices[2],
@@ -305,6 +566,9 @@ def _process_improper_torsion_forces(interchange, openmm_sys, particle_map):
             k / idivf,
         )
 
+        if terms is not None:
+            terms.add_term("ImproperTorsions", pot_key, term_index, openmm_indices, (periodicity, phase, k, idivf))
+
 
 def _is_constrained(
     constrained_pairs: set[tuple[int, ...]],
@@ -109,14 +109,16 @@ def _combine(
             continue
 
         for top_key, pot_key in collection.key_map.items():
-            _tmp_pot_key = copy.deepcopy(pot_key)
+            # Keys are copied without re-validation since the source keys were already validated
+            _tmp_pot_key = pot_key.model_copy(
+                update={"cosmetic_attributes": copy.deepcopy(pot_key.cosmetic_attributes)},
+            )
             new_atom_indices = tuple(idx + atom_offset for idx in top_key.atom_indices)
-            new_top_key = top_key.__class__(**top_key.model_dump())
-            try:
-                new_top_key.atom_indices = new_atom_indices  # type: ignore[misc]
-            except (ValueError, AttributeError):
+            if "this_atom_index" in type(top_key).model_fields:
                 assert len(new_atom_indices) == 1
-                new_top_key.this_atom_index = new_atom_indices[0]  # type: ignore
+                new_top_key = top_key.model_copy(update={"this_atom_index": new_atom_indices[0]})
+            else:
+                new_top_key = top_key.model_copy(update={"atom_indices": new_atom_indices})
             # If interchange was not created with SMIRNOFF, we need avoid merging potentials with same key
             if pot_key.associated_handler == "ExternalSource":
                 _mult = 0
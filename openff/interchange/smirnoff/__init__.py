@@ -1,6 +1,7 @@
 """The interface between Interchange and SMIRNOFF objects."""
 
 from openff.interchange.smirnoff._base import SMIRNOFFCollection
+from openff.interchange.smirnoff._cache import SMIRNOFFParameterCache
 from openff.interchange.smirnoff._gbsa import SMIRNOFFGBSACollection
 from openff.interchange.smirnoff._nonbonded import (
     SMIRNOFFElectrostaticsCollection,
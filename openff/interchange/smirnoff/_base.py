@@ -1,7 +1,8 @@
 import abc
+import itertools
 from typing import TypeVar
 
-from openff.toolkit import Topology
+from openff.toolkit import Molecule, Topology
 from openff.toolkit.typing.engines.smirnoff.parameters import (
     AngleHandler,
     BondHandler,
@@ -24,6 +25,7 @@ from openff.interchange.models import (
     PotentialKey,
     TopologyKey,
 )
+from openff.interchange.smirnoff._cache import _ACTIVE_CACHE, _cached
 
 TP = TypeVar("TP", bound="ParameterHandler")
 
@@ -104,6 +106,91 @@ def _check_all_valence_terms_assigned(
         raise exception
 
 
+def _find_unique_molecule_matches(
+    parameter_handler: ParameterHandler,
+    unique_molecule: "Molecule",
+):
+    """
+    Find parameter matches on a single molecule, using the active parameter cache, if any.
+
+    Cached matches are stored compactly as (atom indices, parameter index) pairs and re-built
+    into the same container type that `ParameterHandler.find_matches` returns.
+    """
+    if _ACTIVE_CACHE.get() is None:
+        return parameter_handler.find_matches(unique_molecule.to_topology())
+
+    def _compute() -> tuple[type, list[tuple[tuple[int, ...], int]]]:
+        parameter_indices = {id(parameter): index for index, parameter in enumerate(parameter_handler.parameters)}
+
+        matches = parameter_handler.find_matches(unique_molecule.to_topology())
+
+        return (
+            type(matches),
+            [(tuple(key), parameter_indices[id(val.parameter_type)]) for key, val in matches.items()],
+        )
+
+    matches_class, compact_matches = _cached(parameter_handler.TAGNAME, unique_molecule, _compute)
+
+    matches = matches_class()
+
+    for key, parameter_index in compact_matches:
+        matches[key] = ParameterHandler._Match(
+            parameter_handler.parameters[parameter_index],
+            Topology._ChemicalEnvironmentMatch(
+                reference_atom_indices=key,
+                reference_molecule=unique_molecule,
+                topology_atom_indices=key,
+            ),
+        )
+
+    return matches
+
+
+def _find_matches_from_templates(
+    parameter_handler: ParameterHandler,
+    topology: Topology,
+):
+    """
+    Find parameter matches by matching each unique molecule once and replicating the result.
+
+    Each entry of `Topology.identical_molecule_groups` is matched on its reference molecule only
+    and the matches are mapped onto every duplicate via the atom maps, so the cost of SMIRKS
+    matching scales with the number of unique molecules rather than the number of atoms. The
+    returned object is of the same type as (and has the same contents as) the one returned by
+    `ParameterHandler.find_matches(topology)`.
+    """
+    atom_offsets = list(
+        itertools.accumulate(
+            (molecule.n_atoms for molecule in topology.molecules),
+            initial=0,
+        ),
+    )
+
+    matches = None
+
+    for unique_molecule_index, group in topology.identical_molecule_groups.items():
+        unique_matches = _find_unique_molecule_matches(
+            parameter_handler,
+            topology.molecule(unique_molecule_index),
+        )
+
+        if matches is None:
+            # ValenceDict or ImproperDict, which canonicalize keys on assignment
+            matches = unique_matches.__class__()
+
+        for duplicate_molecule_index, atom_map in group:
+            offset = atom_offsets[duplicate_molecule_index]
+
+            for key, val in unique_matches.items():
+                matches[tuple(offset + atom_map[index] for index in key)] = val
+
+    if matches is None:
+        # empty topology, defer to the toolkit for the appropriate (empty) container
+        return parameter_handler.find_matches(topology)
+
+    return matches
+
+
 class SMIRNOFFCollection(Collection, abc.ABC):
     """Base class for handlers storing potentials produced by SMIRNOFF force fields."""
 
@@ -162,7 +249,10 @@ class SMIRNOFFCollection(Collection, abc.ABC):
                 PotentialKey,
             ] = dict()
 
-        matches = parameter_handler.find_matches(topology)
+        matches = _find_matches_from_templates(parameter_handler, topology)
+
+        # filled locally and added at once, since setting keys of a key map one at a time counts each as a change
+        key_map: dict[TopologyKey, PotentialKey] = dict()
 
         for key, val in matches.items():
             parameter: ParameterHandler.ParameterType = val.parameter_type
@@ -175,15 +265,18 @@ class SMIRNOFFCollection(Collection, abc.ABC):
                 for cosmetic_attribute in parameter._cosmetic_attribs
             }
 
-            topology_key = TopologyKey(atom_indices=key)
+            # Matches from the toolkit are trusted, so skip re-validating them in this (hot) loop
+            topology_key = TopologyKey.model_construct(atom_indices=key)
 
-            potential_key = PotentialKey(
+            potential_key = PotentialKey.model_construct(
                 id=parameter.smirks,
                 associated_handler=parameter_handler.TAGNAME,
                 cosmetic_attributes=cosmetic_attributes,
             )
 
-            self.key_map[topology_key] = potential_key
+            key_map[topology_key] = potential_key
+
+        self.key_map.update(key_map)
 
         if self.__class__.__name__ in [
             "SMIRNOFFBondCollection",
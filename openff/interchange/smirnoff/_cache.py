@@ -0,0 +1,256 @@
+"""Persistent, on-disk caching of SMIRNOFF parameter assignments."""
+
+import contextlib
+import contextvars
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from openff.toolkit import ForceField, Molecule
+
+T = TypeVar("T")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL
+)
+"""
+
+
+class SMIRNOFFParameterCache:
+    """
+    A file-backed cache of per-molecule SMIRNOFF parameter assignments.
+
+    Entries are keyed by a hash of the force field contents, the mapped SMILES of a unique
+    molecule, and the name of a parameter handler. Results are stored in a SQLite database
+    which can safely be shared by many threads and processes. When the total size of stored
+    entries exceeds ``max_size``, the least recently used entries are evicted.
+
+    .. warning :: This API is not stable and subject to change.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        The path of the database file, which is created if it does not exist.
+    max_size : int, default=1_073_741_824
+        The maximum total size, in bytes, of stored entries.
+
+    Examples
+    --------
+    Re-use parameter assignments across calls (and sessions)
+
+    .. code-block:: pycon
+
+        >>> from openff.interchange import Interchange
+        >>> from openff.interchange.smirnoff import SMIRNOFFParameterCache
+        >>> from openff.toolkit import ForceField, Molecule
+        >>> cache = SMIRNOFFParameterCache("parameters.sqlite")  # doctest: +SKIP
+        >>> interchange = Interchange.from_smirnoff(  # doctest: +SKIP
+        ...     ForceField("openff-2.2.0.offxml"),
+        ...     [Molecule.from_smiles("CCO")],
+        ...     cache=cache,
+        ... )
+
+    """
+
+    def __init__(self, path: str | Path, max_size: int = 2**30):
+        self.path = Path(path)
+        self.max_size = max_size
+
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        self._pid: int | None = None
+
+    def __getstate__(self) -> dict:
+        # connections and locks cannot be pickled, each process opens its own connection
+        return {"path": self.path, "max_size": self.max_size}
+
+    def __setstate__(self, state: dict):
+        self.__init__(**state)  # type: ignore[misc]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(path='{self.path}', max_size={self.max_size})"
+
+    def _connect(self) -> sqlite3.Connection:
+        # a connection opened by a parent process must not be re-used in a child process
+        if self._connection is None or self._pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+            connection = sqlite3.connect(
+                self.path,
+                timeout=60.0,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(_SCHEMA)
+            connection.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+
+            self._connection = connection
+            self._pid = os.getpid()
+
+        return self._connection
+
+    @staticmethod
+    def make_key(force_field_hash: str, mapped_smiles: str, handler_name: str) -> str:
+        """Combine the components that identify a parameter assignment into a single key."""
+        from openff.interchange import __version__
+
+        return hashlib.sha256(
+            "\n".join([__version__, force_field_hash, mapped_smiles, handler_name]).encode(),
+        ).hexdigest()
+
+    def get(self, key: str) -> Any | None:
+        """Return the value stored with a key, or ``None`` if it is not present."""
+        with self._lock:
+            connection = self._connect()
+
+            row = connection.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+
+            if row is None:
+                return None
+
+            connection.execute("UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key))
+
+        return pickle.loads(row[0])
+
+    def put(self, key: str, value: Any):
+        """Store a value with a key, evicting the least recently used entries if needed."""
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+        with self._lock:
+            connection = self._connect()
+
+            connection.execute("BEGIN IMMEDIATE")
+
+            try:
+                connection.execute(
+                    "INSERT OR REPLACE INTO entries (key, value, size, accessed) VALUES (?, ?, ?, ?)",
+                    (key, blob, len(blob), time.time()),
+                )
+
+                (total_size,) = connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+
+                if total_size > self.max_size:
+                    evicted = list()
+
+                    for evicted_key, size in connection.execute(
+                        "SELECT key, size FROM entries ORDER BY accessed ASC",
+                    ):
+                        if total_size <= self.max_size:
+                            break
+
+                        evicted.append((evicted_key,))
+                        total_size -= size
+
+                    connection.executemany("DELETE FROM entries WHERE key = ?", evicted)
+
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
+            connection.execute("COMMIT")
+
+    def clear(self):
+        """Remove all entries from this cache."""
+        with self._lock:
+            self._connect().execute("DELETE FROM entries")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+
+_ACTIVE_CACHE: contextvars.ContextVar[tuple[SMIRNOFFParameterCache, str] | None] = contextvars.ContextVar(
+    "_ACTIVE_CACHE",
+    default=None,
+)
+
+
+def _hash_force_field(force_field: "ForceField") -> str:
+    """Hash the contents of a force field."""
+    return hashlib.sha256(force_field.to_string().encode()).hexdigest()
+
+
+@contextlib.contextmanager
+def _use_parameter_cache(
+    cache: SMIRNOFFParameterCache | None,
+    force_field: "ForceField",
+    force_field_hash: str | None = None,
+) -> Iterator[None]:
+    """
+    Make a cache available to parameter assignment within this context.
+
+    If the hash of the force field is not given, it is computed.
+    """
+    if cache is not None and force_field_hash is None:
+        force_field_hash = _hash_force_field(force_field)
+
+    token = _ACTIVE_CACHE.set(
+        None if cache is None else (cache, force_field_hash),  # type: ignore[arg-type]
+    )
+
+    try:
+        yield
+    finally:
+        _ACTIVE_CACHE.reset(token)
+
+
+def _is_cached(handler_name: str, molecule: "Molecule") -> bool:
+    """Return whether the active cache, if any, already stores a per-molecule assignment."""
+    active = _ACTIVE_CACHE.get()
+
+    if active is None:
+        return False
+
+    cache, force_field_hash = active
+
+    key = cache.make_key(
+        force_field_hash,
+        molecule.to_smiles(isomeric=True, explicit_hydrogens=True, mapped=True),
+        handler_name,
+    )
+
+    return cache.get(key) is not None
+
+
+def _cached(
+    handler_name: str,
+    molecule: "Molecule",
+    compute: Callable[[], T],
+) -> T:
+    """
+    Look up the result of a per-molecule assignment in the active cache, computing and storing it if missing.
+
+    If no cache is active, the result is computed without touching the disk.
+    """
+    active = _ACTIVE_CACHE.get()
+
+    if active is None:
+        return compute()
+
+    cache, force_field_hash = active
+
+    key = cache.make_key(
+        force_field_hash,
+        molecule.to_smiles(isomeric=True, explicit_hydrogens=True, mapped=True),
+        handler_name,
+    )
+
+    value = cache.get(key)
+
+    if value is None:
+        value = compute()
+        cache.put(key, value)
+
+    return value
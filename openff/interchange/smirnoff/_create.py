@@ -1,4 +1,12 @@
+import contextlib
+import contextvars
+import functools
+import hashlib
+import itertools
 import warnings
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Any, NamedTuple
 
 from openff.toolkit import ForceField, Molecule, Quantity, Topology
 from openff.toolkit.typing.engines.smirnoff import ParameterHandler
@@ -7,18 +15,25 @@ from packaging.version import Version
 
 from openff.interchange import Interchange
 from openff.interchange.common._positions import _infer_positions
-from openff.interchange.components.toolkit import _check_electrostatics_handlers
+from openff.interchange.components.toolkit import (
+    _cache_angle_parameter_lookup,
+    _cache_torsion_parameter_lookup,
+    _check_electrostatics_handlers,
+)
 from openff.interchange.exceptions import (
     MissingParameterHandlerError,
     PresetChargesError,
     SMIRNOFFHandlersNotImplementedError,
 )
+from openff.interchange.models import VirtualSiteKey
 from openff.interchange.plugins import load_smirnoff_plugins
 from openff.interchange.smirnoff._base import SMIRNOFFCollection
+from openff.interchange.smirnoff._cache import SMIRNOFFParameterCache, _hash_force_field, _use_parameter_cache
 from openff.interchange.smirnoff._gbsa import SMIRNOFFGBSACollection
 from openff.interchange.smirnoff._nonbonded import (
     SMIRNOFFElectrostaticsCollection,
     SMIRNOFFvdWCollection,
+    _upconvert_vdw_handler,
 )
 from openff.interchange.smirnoff._valence import (
     SMIRNOFFAngleCollection,
@@ -65,6 +80,34 @@ for collection_plugin in load_smirnoff_plugins():
             )
 
 
+# The order in which stages populate collections when run sequentially
+_STAGE_ORDER: tuple[str, ...] = (
+    "Bonds",
+    "Constraints",
+    "Angles",
+    "ProperTorsions",
+    "ImproperTorsions",
+    "vdW",
+    "Electrostatics",
+    "plugins",
+    "VirtualSites",
+    "GBSA",
+)
+
+# The parameter handlers that each stage, other than "plugins", reads from
+_STAGE_HANDLERS: dict[str, tuple[str, ...]] = {
+    "Bonds": ("Bonds",),
+    "Constraints": ("Bonds", "Constraints"),
+    "Angles": ("Angles",),
+    "ProperTorsions": ("ProperTorsions",),
+    "ImproperTorsions": ("ImproperTorsions",),
+    "vdW": ("vdW",),
+    "Electrostatics": ("Electrostatics", "ChargeIncrementModel", "ToolkitAM1BCC", "LibraryCharges"),
+    "VirtualSites": ("VirtualSites",),
+    "GBSA": ("GBSA",),
+}
+
+
 def _check_supported_handlers(force_field: ForceField):
     unsupported = list()
 
@@ -134,6 +177,40 @@ def _preprocess_preset_charges(
     return molecules_with_preset_charges
 
 
+class _PreparedForceField(NamedTuple):
+    """A force field that is validated and converted in-place, with data derived from it once."""
+
+    force_field: ForceField
+    hash: str | None
+    handler_states: dict[str, tuple[str, str, str]]
+
+
+def _prepare_force_field(force_field: ForceField, hash_force_field: bool = False) -> _PreparedForceField:
+    """
+    Validate a force field and convert its handlers in-place, which only needs to be done once per force field.
+
+    Note that this modifies user-supplied handlers in-place.
+    """
+    _check_supported_handlers(force_field)
+
+    if "Bonds" in force_field.registered_parameter_handlers:
+        if force_field["Bonds"].version == Version("0.3"):
+            from openff.interchange.smirnoff._valence import _upconvert_bondhandler
+
+            _upconvert_bondhandler(force_field["Bonds"])
+
+    if "vdW" in force_field.registered_parameter_handlers:
+        _upconvert_vdw_handler(force_field["vdW"])
+
+    return _PreparedForceField(
+        force_field=force_field,
+        hash=_hash_force_field(force_field) if hash_force_field else None,
+        handler_states={
+            name: _get_handler_state(force_field[name]) for name in force_field.registered_parameter_handlers
+        },
+    )
+
+
 def _create_interchange(
     force_field: ForceField,
     topology: Topology | list[Molecule],
@@ -142,10 +219,15 @@ def _create_interchange(
     molecules_with_preset_charges: list[Molecule] | None = None,
     partial_bond_orders_from_molecules: list[Molecule] | None = None,
     allow_nonintegral_charges: bool = False,
+    cache: SMIRNOFFParameterCache | None = None,
+    executor: Executor | None = None,
+    n_workers: int | None = None,
+    prepared: "_PreparedForceField | None" = None,
 ) -> Interchange:
     molecules_with_preset_charges = _preprocess_preset_charges(molecules_with_preset_charges)
 
-    _check_supported_handlers(force_field)
+    if prepared is None:
+        prepared = _prepare_force_field(force_field, hash_force_field=cache is not None)
 
     if molecules_with_preset_charges is not None and "VirtualSites" in force_field.registered_parameter_handlers:
         warnings.warn(
@@ -164,44 +246,378 @@ def _create_interchange(
 
     interchange.box = interchange.topology.box_vectors if box is None else box
 
-    _bonds(
-        interchange,
-        force_field,
-        interchange.topology,
-        partial_bond_orders_from_molecules,
+    with (
+        _use_parameter_cache(cache, force_field, prepared.hash),
+        _charge_executor(executor, n_workers) as charge_executor,
+    ):
+        stages = _get_stages(
+            interchange,
+            force_field,
+            molecules_with_preset_charges,
+            partial_bond_orders_from_molecules,
+            allow_nonintegral_charges,
+            charge_executor,
+        )
+
+        _run_stages(stages, n_workers)
+
+    _sort_collections(interchange)
+
+    interchange.topology = interchange.topology
+
+    interchange._handler_states = prepared.handler_states
+    interchange._smirnoff_options = {
+        "molecules_with_preset_charges": molecules_with_preset_charges,
+        "partial_bond_orders_from_molecules": partial_bond_orders_from_molecules,
+        "allow_nonintegral_charges": allow_nonintegral_charges,
+    }
+
+    return interchange
+
+
+# Per-process state of workers creating Interchanges in a batch, see `_create_interchanges`
+_BATCH_WORKER_STATE: dict[str, Any] = dict()
+
+
+def _initialize_batch_worker(
+    force_field_string: str,
+    force_field_hash: str | None,
+    options: dict[str, Any],
+):
+    """Load and prepare a force field once per worker process."""
+    force_field = ForceField(force_field_string, load_plugins=True, allow_cosmetic_attributes=True)
+
+    _BATCH_WORKER_STATE.update(
+        prepared=_prepare_force_field(force_field)._replace(hash=force_field_hash),
+        options=options,
     )
-    _constraints(
-        interchange,
-        force_field,
-        interchange.topology,
-        bonds=interchange.collections.get("Bonds", None),  # type: ignore[arg-type]
+
+
+def _create_interchange_in_worker(topology: Topology | list[Molecule]) -> Interchange:
+    prepared: _PreparedForceField = _BATCH_WORKER_STATE["prepared"]
+
+    return _create_interchange(
+        prepared.force_field,
+        topology,
+        prepared=prepared,
+        **_BATCH_WORKER_STATE["options"],
     )
-    _angles(interchange, force_field, interchange.topology)
-    _propers(
-        interchange,
-        force_field,
-        interchange.topology,
-        partial_bond_orders_from_molecules,
+
+
+def _create_interchanges(
+    force_field: ForceField,
+    topologies: Iterable[Topology | list[Molecule]],
+    molecules_with_preset_charges: list[Molecule] | None = None,
+    partial_bond_orders_from_molecules: list[Molecule] | None = None,
+    allow_nonintegral_charges: bool = False,
+    cache: SMIRNOFFParameterCache | None = None,
+    n_workers: int | None = None,
+    max_pending: int | None = None,
+) -> Iterator[tuple[int, Interchange | Exception]]:
+    """
+    Create an Interchange from each of many topologies, preparing the force field only once.
+
+    Yields the index of each topology with either the Interchange created from it or the exception raised while
+    creating it. Topologies are processed in order if `n_workers` is not greater than one, otherwise in a process
+    pool, from which results are yielded as they finish and at most `max_pending` topologies are held at once.
+    """
+    options: dict[str, Any] = {
+        "molecules_with_preset_charges": molecules_with_preset_charges,
+        "partial_bond_orders_from_molecules": partial_bond_orders_from_molecules,
+        "allow_nonintegral_charges": allow_nonintegral_charges,
+        "cache": cache,
+    }
+
+    prepared = _prepare_force_field(force_field, hash_force_field=cache is not None)
+
+    if n_workers is None or n_workers <= 1:
+        for index, topology in enumerate(topologies):
+            try:
+                interchange = _create_interchange(force_field, topology, prepared=prepared, **options)
+            except Exception as error:
+                yield index, error
+            else:
+                yield index, interchange
+
+        return
+
+    max_pending = 2 * n_workers if max_pending is None else max(max_pending, 1)
+
+    items = enumerate(topologies)
+    pending: dict[Future, int] = dict()
+
+    with ProcessPoolExecutor(
+        max_workers=n_workers,
+        initializer=_initialize_batch_worker,
+        initargs=(force_field.to_string(), prepared.hash, options),
+    ) as pool:
+        try:
+            while True:
+                # Consume topologies lazily, keeping at most `max_pending` in flight
+                for index, topology in itertools.islice(items, max_pending - len(pending)):
+                    pending[pool.submit(_create_interchange_in_worker, topology)] = index
+
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    error = future.exception()
+
+                    yield pending.pop(future), future.result() if error is None else error
+
+        finally:
+            # if the consumer stops early, do not wait on work that has not started
+            for future in pending:
+                future.cancel()
+
+
+def _get_stages(
+    interchange: Interchange,
+    force_field: ForceField,
+    molecules_with_preset_charges: list[Molecule] | None = None,
+    partial_bond_orders_from_molecules: list[Molecule] | None = None,
+    allow_nonintegral_charges: bool = False,
+    charge_executor: Executor | None = None,
+) -> dict[str, tuple[Callable[[], None], tuple[str, ...]]]:
+    """
+    Return the stages that populate collections, each with the stages it depends on.
+
+    Stages are listed in an order in which they can be run sequentially, see `_STAGE_ORDER`.
+    """
+    topology = interchange.topology
+
+    return {
+        "Bonds": (
+            functools.partial(_bonds, interchange, force_field, topology, partial_bond_orders_from_molecules),
+            (),
+        ),
+        "Constraints": (
+            lambda: _constraints(
+                interchange,
+                force_field,
+                topology,
+                bonds=interchange.collections.get("Bonds", None),  # type: ignore[arg-type]
+            ),
+            ("Bonds",),
+        ),
+        "Angles": (functools.partial(_angles, interchange, force_field, topology), ()),
+        "ProperTorsions": (
+            functools.partial(_propers, interchange, force_field, topology, partial_bond_orders_from_molecules),
+            # fractional bond orders are stored on the (shared) topology, so do not assign them concurrently
+            ("Bonds",) if _propers_use_bond_orders(force_field) else (),
+        ),
+        "ImproperTorsions": (functools.partial(_impropers, interchange, force_field, topology), ()),
+        "vdW": (functools.partial(_vdw, interchange, force_field, topology), ()),
+        "Electrostatics": (
+            functools.partial(
+                _electrostatics,
+                interchange,
+                force_field,
+                topology,
+                molecules_with_preset_charges,
+                allow_nonintegral_charges,
+                charge_executor,
+            ),
+            (),
+        ),
+        "plugins": (
+            functools.partial(_plugins, interchange, force_field, topology),
+            ("vdW", "Electrostatics"),
+        ),
+        "VirtualSites": (
+            functools.partial(_virtual_sites, interchange, force_field, topology),
+            ("vdW", "Electrostatics", "plugins"),
+        ),
+        "GBSA": (functools.partial(_gbsa, interchange, force_field, topology), ()),
+    }
+
+
+def _sort_collections(interchange: Interchange):
+    """Sort collections in the order in which they are created sequentially, in-place."""
+    # plugin collections, which are keyed by their own names, take the place of the "plugins" stage
+    collections = sorted(
+        interchange.collections.items(),
+        key=lambda item: _STAGE_ORDER.index(item[0]) if item[0] in _STAGE_ORDER else _STAGE_ORDER.index("plugins"),
     )
-    _impropers(interchange, force_field, interchange.topology)
-
-    _vdw(interchange, force_field, interchange.topology)
-    _electrostatics(
-        interchange,
-        force_field,
-        interchange.topology,
-        molecules_with_preset_charges,
-        allow_nonintegral_charges,
+
+    interchange.collections.clear()
+    interchange.collections.update(collections)
+
+
+def _run_stages(
+    stages: dict[str, tuple[Callable[[], None], tuple[str, ...]]],
+    n_workers: int | None,
+):
+    """
+    Run parametrization stages, each once all of the stages it depends on are finished.
+
+    If `n_workers` is greater than one, independent stages run concurrently in a thread pool,
+    otherwise stages run sequentially in the order given.
+    """
+    if n_workers is None or n_workers <= 1:
+        for function, _ in stages.values():
+            function()
+
+        return
+
+    pending = dict(stages)
+    running: dict[Future, str] = dict()
+    finished: set[str] = set()
+
+    with ThreadPoolExecutor(max_workers=n_workers) as pool:
+        while pending or running:
+            for name, (function, dependencies) in list(pending.items()):
+                if finished.issuperset(dependencies):
+                    # Run each stage in a copy of this context so that it sees the active parameter cache, if any
+                    running[pool.submit(contextvars.copy_context().run, function)] = name
+                    del pending[name]
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                # re-raise any exception from this stage
+                future.result()
+
+                finished.add(running.pop(future))
+
+
+def _propers_use_bond_orders(force_field: ForceField) -> bool:
+    """Return whether the proper torsion handler, if any, interpolates parameters by fractional bond order."""
+    if "ProperTorsions" not in force_field.registered_parameter_handlers:
+        return False
+
+    return any(getattr(p, "k_bondorder", None) is not None for p in force_field["ProperTorsions"].parameters)
+
+
+@contextlib.contextmanager
+def _charge_executor(
+    executor: Executor | None,
+    n_workers: int | None,
+) -> Iterator[Executor | None]:
+    """Yield an executor for computing partial charges, creating (and shutting down) a process pool if needed."""
+    if executor is not None:
+        yield executor
+
+    elif n_workers is not None and n_workers > 1:
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            yield pool
+
+    else:
+        yield None
+
+
+def _get_handler_state(handler: ParameterHandler) -> tuple[str, str, str]:
+    """
+    Hash the contents of a parameter handler, split into what determines how its parameters are matched and what not.
+
+    Returns hashes of the header attributes of the handler, of the SMIRKS and attribute names of each parameter (in
+    order), and of the full contents of each parameter. Parameters need to be re-matched if either of the first two
+    change. Only hashes are kept, so that recording the state of every handler when creating an Interchange is cheap.
+    """
+    attributes = handler.to_dict()
+
+    if handler._INFOTYPE is None:
+        parameters = list()
+    else:
+        parameters = attributes.pop(handler._INFOTYPE._ELEMENT_NAME, list())
+
+    return (
+        _hash_state(attributes),
+        _hash_state([(parameter["smirks"], *sorted(parameter)) for parameter in parameters]),
+        _hash_state(parameters),
     )
-    _plugins(interchange, force_field, interchange.topology)
 
-    _virtual_sites(interchange, force_field, interchange.topology)
 
-    _gbsa(interchange, force_field, interchange.topology)
+def _hash_state(value: Any) -> str:
+    return hashlib.sha256(repr(value).encode()).hexdigest()
 
-    interchange.topology = interchange.topology
 
-    return interchange
+def _update_interchange(interchange: Interchange, force_field: ForceField):
+    """
+    Update an Interchange in-place with the parameters of a (modified) force field.
+
+    Collections whose parameter handlers are unchanged are kept. If only the values of parameters changed,
+    potentials are re-assigned using the existing key maps. Otherwise, i.e. if SMIRKS or handler attributes
+    changed, collections are created anew.
+    """
+    # Apply the same in-place conversions as when creating, so that handler states can be compared
+    new_states = _prepare_force_field(force_field).handler_states
+    old_states = interchange._handler_states
+
+    def _change(handler_names: Iterable[str]) -> int:
+        """Return 0 if handlers are unchanged, 1 if only parameter values changed, or 2 if matches may change."""
+        change = 0
+
+        for name in handler_names:
+            old_state, new_state = old_states.get(name), new_states.get(name)
+
+            if old_state is None and new_state is None:
+                continue
+
+            if old_state is None or new_state is None or old_state[:2] != new_state[:2]:
+                return 2
+
+            if old_state[2] != new_state[2]:
+                change = 1
+
+        return change
+
+    builtin_handlers = {name for names in _STAGE_HANDLERS.values() for name in names}
+
+    changes = {name: _change(handler_names) for name, handler_names in _STAGE_HANDLERS.items()}
+    changes["plugins"] = _change({*old_states, *new_states} - builtin_handlers)
+
+    # Charges are assigned while matching, constraints are derived from bonds, and plugins and virtual sites
+    # read other collections, so these are created anew if anything they depend on changed
+    if changes["Electrostatics"]:
+        changes["Electrostatics"] = 2
+
+    if changes["Constraints"]:
+        changes["Constraints"] = 2
+
+    if changes["vdW"] or changes["Electrostatics"] or changes["plugins"]:
+        changes["plugins"] = 2
+
+    if changes["vdW"] or changes["Electrostatics"] or changes["plugins"] or changes["VirtualSites"]:
+        changes["VirtualSites"] = 2
+
+        # Virtual sites store their non-bonded parameters in other collections, drop them before re-creating
+        for collection in interchange.collections.values():
+            virtual_site_keys = [key for key in collection.key_map if type(key) is VirtualSiteKey]
+
+            for key in virtual_site_keys:
+                collection.potentials.pop(collection.key_map.pop(key), None)
+
+    # These look-ups are cached by handler, which may have been modified in-place
+    _cache_angle_parameter_lookup.cache_clear()
+    _cache_torsion_parameter_lookup.cache_clear()
+
+    stages = _get_stages(interchange, force_field, **interchange._smirnoff_options)
+
+    for name, (function, _) in stages.items():
+        if changes[name] == 2:
+            if name == "plugins":
+                for key in [key for key, collection in interchange.collections.items() if collection.is_plugin]:
+                    interchange.collections.pop(key)
+            else:
+                interchange.collections.pop(name, None)
+
+            function()
+
+        elif changes[name] == 1:
+            interchange[name].store_potentials(parameter_handler=force_field[name])
+
+    _sort_collections(interchange)
+
+    electrostatics = interchange.collections.get("Electrostatics", None)
+
+    if isinstance(electrostatics, SMIRNOFFElectrostaticsCollection):
+        # charges, including those from virtual sites, are cached on first access
+        electrostatics._charges_cached = False
+
+    interchange._handler_states = new_states
 
 
 def _bonds(
@@ -213,11 +629,6 @@ def _bonds(
     if "Bonds" not in force_field.registered_parameter_handlers:
         return
 
-    if force_field["Bonds"].version == Version("0.3"):
-        from openff.interchange.smirnoff._valence import _upconvert_bondhandler
-
-        _upconvert_bondhandler(force_field["Bonds"])
-
     interchange.collections.update(
         {
             "Bonds": SMIRNOFFBondCollection.create(
@@ -302,16 +713,9 @@ def _impropers(interchange, force_field, _topology):
 
 
 def _vdw(interchange: Interchange, force_field: ForceField, topology: Topology):
-    from openff.interchange.smirnoff._nonbonded import _upconvert_vdw_handler
-
     if "vdW" not in force_field.registered_parameter_handlers:
         return
 
-    # TODO: This modifies a user-supplied argument in-place, might consider
-    # deepcopying it somewhere around `Interchange.from_x`
-
-    _upconvert_vdw_handler(force_field["vdW"])
-
     interchange.collections.update(
         {
             "vdW": SMIRNOFFvdWCollection.create(
@@ -328,6 +732,7 @@ def _electrostatics(
     topology: Topology,
     molecules_with_preset_charges: list[Molecule] | None = None,
     allow_nonintegral_charges: bool = False,
+    executor: Executor | None = None,
 ):
     if "Electrostatics" not in force_field.registered_parameter_handlers:
         if _check_electrostatics_handlers(force_field):
@@ -358,6 +763,7 @@ def _electrostatics(
                 topology=topology,
                 molecules_with_preset_charges=molecules_with_preset_charges,
                 allow_nonintegral_charges=allow_nonintegral_charges,
+                executor=executor,
             ),
         },
     )
@@ -1,6 +1,5 @@
 import itertools
 import re
-from collections import defaultdict
 from typing import TypeAlias
 
 from openff.toolkit import Molecule, Quantity, unit
@@ -11,11 +10,8 @@ from openff.units.elements import MASSES, SYMBOLS
 from openff.interchange._annotations import PositiveFloat
 from openff.interchange.components.interchange import Interchange
 from openff.interchange.components.potentials import Collection
-from openff.interchange.components.toolkit import _get_14_pairs
+from openff.interchange.components.toolkit import _get_bonded_pairs
 from openff.interchange.exceptions import UnsupportedExportError
-from openff.interchange.interop._virtual_sites import (
-    _virtual_site_parent_molecule_mapping,
-)
 from openff.interchange.interop.common import _build_particle_map
 from openff.interchange.interop.gromacs.export._virtual_sites import (
     _create_gromacs_virtual_site,
@@ -88,19 +84,12 @@ def _convert(
         list,
     ] = interchange.topology.identical_molecule_groups
 
-    virtual_site_molecule_map: dict[
-        VirtualSiteKey,
-        int,
-    ] = _virtual_site_parent_molecule_mapping(interchange)
-
-    molecule_virtual_site_map: dict[int, list[VirtualSiteKey]] = defaultdict(list)
-
-    for virtual_site_key, molecule_index in virtual_site_molecule_map.items():
-        molecule_virtual_site_map[molecule_index].append(virtual_site_key)
+    molecule_virtual_site_map: dict[int, list[VirtualSiteKey]] = (
+        interchange._get_topology_indices().molecule_virtual_site_map
+    )
 
     particle_map = _build_particle_map(
         interchange,
-        molecule_virtual_site_map,
         collate=True,
     )
 
@@ -238,17 +227,12 @@ def _convert(
             atom_type_name: system.atom_types[atom_type_name] for atom_type_name in this_molecule_atom_type_names
         }
 
-        # Use a set to de-duplicate
-        pairs: set[tuple] = {*_get_14_pairs(unique_molecule)}
-
-        for pair in pairs:
-            molecule_indices = sorted(unique_molecule.atom_index(atom) for atom in pair)
-
+        for atom1, atom2 in _get_bonded_pairs(unique_molecule).pairs_14.tolist():
             if system.gen_pairs:
                 molecule.pairs.append(
                     GROMACSPair(
-                        atom1=molecule_indices[0] + 1,
-                        atom2=molecule_indices[1] + 1,
+                        atom1=atom1 + 1,
+                        atom2=atom2 + 1,
                     ),
                 )
 
@@ -545,6 +529,11 @@ def _convert_virtual_sites(
     if "VirtualSites" not in interchange.collections:
         return
 
+    particle_map = _build_particle_map(
+        interchange,
+        collate=True,
+    )
+
     for virtual_site_key in molecule_virtual_site_map[interchange.topology.molecule_index(unique_molecule)]:
         from openff.interchange.smirnoff._virtual_sites import (
             _create_virtual_site_object,
@@ -559,13 +548,6 @@ def _convert_virtual_sites(
             virtual_site_potential,
         )
 
-        # TODO: Store this somewhere so it doesn't need to be computed twice
-        particle_map = _build_particle_map(
-            interchange,
-            molecule_virtual_site_map,
-            collate=True,
-        )
-
         gromacs_virtual_site: GROMACSVirtualSite = _create_gromacs_virtual_site(
             interchange,
             virtual_site_object,
@@ -1,8 +1,11 @@
 import copy
 import functools
+import itertools
 import logging
 import warnings
+from collections import defaultdict
 from collections.abc import Iterable
+from concurrent.futures import Executor
 from typing import Literal, Union
 
 import numpy
@@ -42,6 +45,7 @@ from openff.interchange.models import (
     VirtualSiteKey,
 )
 from openff.interchange.smirnoff._base import SMIRNOFFCollection
+from openff.interchange.smirnoff._cache import _ACTIVE_CACHE, _cached, _is_cached
 from openff.interchange.warnings import ForceFieldModificationWarning
 
 logger = logging.getLogger(__name__)
@@ -65,6 +69,91 @@ def _add_charges(
     return Quantity(charge1 + charge2, "elementary_charge")
 
 
+def _toolkit_am1bcc_method() -> str:
+    """Return the partial charge method that ToolkitAM1BCC uses with the currently registered toolkits."""
+    from openff.toolkit.utils.toolkits import GLOBAL_TOOLKIT_REGISTRY
+
+    # The implementation of _toolkit_registry_manager should result in this `GLOBAL_TOOLKIT_REGISTRY`
+    # including only what it is passed, even if it's not what one would expect at import time
+    if "OpenEye" in GLOBAL_TOOLKIT_REGISTRY.__repr__():
+        return "am1bccelf10"
+    else:
+        return "am1bcc"
+
+
+def _electrostatics_cache_name() -> str:
+    """Return the name under which electrostatics assignments are stored in a parameter cache."""
+    from openff.toolkit.utils.toolkits import GLOBAL_TOOLKIT_REGISTRY
+
+    # charges from charge models may depend on which toolkits are available
+    return f"Electrostatics {GLOBAL_TOOLKIT_REGISTRY!r}"
+
+
+def _compute_partial_charges_in_worker(
+    molecule: Molecule,
+    method: str,
+    toolkit_registry,
+) -> numpy.ndarray:
+    """Assign partial charges to a molecule in a worker process, returning them in units of elementary charge."""
+    molecule.assign_partial_charges(method, toolkit_registry=toolkit_registry)
+
+    return molecule.partial_charges.m_as(unit.elementary_charge)
+
+
+_CHARGE_TOPOLOGY_KEY_TYPES = (
+    LibraryChargeTopologyKey,
+    SingleAtomChargeTopologyKey,
+    ChargeModelTopologyKey,
+    ChargeIncrementTopologyKey,
+)
+
+_CHARGE_TOPOLOGY_KEY_CLASSES: dict[str, type] = {
+    key_class.__name__: key_class for key_class in _CHARGE_TOPOLOGY_KEY_TYPES
+}
+
+
+def _log_charge_assignment(
+    key: LibraryChargeTopologyKey | ChargeModelTopologyKey | ChargeIncrementTopologyKey,
+) -> None:
+    """Log which charge section assigned the charge of a topology atom."""
+    topology_atom_index = key.this_atom_index
+
+    if type(key) is LibraryChargeTopologyKey:
+        logger.info(
+            f"Charge section LibraryCharges applied to topology atom index {topology_atom_index}",
+        )
+
+    elif type(key) is SingleAtomChargeTopologyKey:
+        if key.extras["handler"] == "ToolkitAM1BCCHandler":
+            logger.info(
+                "Charge section ToolkitAM1BCC, using charge method "
+                f"{key.extras['partial_charge_method']}, "
+                f"applied to topology atom index {topology_atom_index}",
+            )
+
+        elif key.extras["handler"] == "preset":
+            logger.info(
+                f"Preset charges applied to atom index {topology_atom_index}",
+            )
+
+        else:
+            raise ValueError(f"Unhandled handler {key.extras['handler']}")
+
+    elif type(key) is ChargeModelTopologyKey:
+        logger.info(
+            "Charge section ChargeIncrementModel, using charge method "
+            f"{key.partial_charge_method}, "
+            f"applied to topology atom index {topology_atom_index}",
+        )
+
+    elif type(key) is ChargeIncrementTopologyKey:
+        # here is where the actual increments could be logged
+        pass
+
+    else:
+        raise ValueError(f"Unhandled key type {type(key)}")
+
+
 def _upconvert_vdw_handler(vdw_handler: vdWHandler):
     """Given a vdW with version 0.3 or 0.4, up-convert to 0.4 or short-circuit if already 0.4."""
     from packaging.version import Version
@@ -439,10 +528,13 @@ class SMIRNOFFElectrostaticsCollection(ElectrostaticsCollection, SMIRNOFFCollect
         topology: Topology,
         molecules_with_preset_charges=None,
         allow_nonintegral_charges: bool = False,
+        executor: Executor | None = None,
     ) -> Self:
         """
         Create a SMIRNOFFElectrostaticsCollection from toolkit data.
 
+        If an executor is given, partial charges from charge models are computed concurrently for all
+        unique molecules.
         """
         from packaging.version import Version
 
@@ -478,6 +570,7 @@ class SMIRNOFFElectrostaticsCollection(ElectrostaticsCollection, SMIRNOFFCollect
             topology,
             molecules_with_preset_charges=molecules_with_preset_charges,
             allow_nonintegral_charges=allow_nonintegral_charges,
+            executor=executor,
         )
         handler._charges = dict()
 
@@ -644,12 +737,18 @@ class SMIRNOFFElectrostaticsCollection(ElectrostaticsCollection, SMIRNOFFCollect
         cls,
         parameter_handler: ToolkitAM1BCCHandler | ChargeIncrementModelHandler,
         unique_molecule: Molecule,
+        precomputed_charges: dict[tuple[str, str], Quantity] | None = None,
     ) -> tuple[
         str,
         dict[SingleAtomChargeTopologyKey, PotentialKey],
         dict[PotentialKey, Potential],
     ]:
-        """Construct a slot and potential map for a charge model based parameter handler."""
+        """
+        Construct a slot and potential map for a charge model based parameter handler.
+
+        Partial charges found in `precomputed_charges`, keyed by mapped SMILES and partial charge method,
+        are used instead of computing them.
+        """
         unique_molecule = copy.deepcopy(unique_molecule)
         reference_smiles = unique_molecule.to_smiles(
             isomeric=True,
@@ -662,29 +761,21 @@ class SMIRNOFFElectrostaticsCollection(ElectrostaticsCollection, SMIRNOFFCollect
         if handler_name == "ChargeIncrementModelHandler":
             partial_charge_method = parameter_handler.partial_charge_method
         elif handler_name == "ToolkitAM1BCCHandler":
-            from openff.toolkit.utils.toolkits import GLOBAL_TOOLKIT_REGISTRY
-
-            # The implementation of _toolkit_registry_manager should result in this `GLOBAL_TOOLKIT_REGISTRY`
-            # including only what it is passed, even if it's not what one would expect at import time
-            if "OpenEye" in GLOBAL_TOOLKIT_REGISTRY.__repr__():
-                partial_charge_method = "am1bccelf10"
-            else:
-                partial_charge_method = "am1bcc"
+            partial_charge_method = _toolkit_am1bcc_method()
         else:
             raise InvalidParameterHandlerError(
                 f"Encountered unknown handler of type {type(parameter_handler)} where only "
                 "ToolkitAM1BCCHandler or ChargeIncrementModelHandler are expected.",
             )
 
-        partial_charges = cls._compute_partial_charges(
-            unique_molecule,
-            unique_molecule.to_smiles(
-                isomeric=True,
-                explicit_hydrogens=True,
-                mapped=True,
-            ),
-            method=partial_charge_method,
-        )
+        if precomputed_charges is not None and (reference_smiles, partial_charge_method) in precomputed_charges:
+            partial_charges = precomputed_charges[(reference_smiles, partial_charge_method)]
+        else:
+            partial_charges = cls._compute_partial_charges(
+                unique_molecule,
+                reference_smiles,
+                method=partial_charge_method,
+            )
 
         matches = {}
         potentials = {}
@@ -716,6 +807,7 @@ class SMIRNOFFElectrostaticsCollection(ElectrostaticsCollection, SMIRNOFFCollect
         cls,
         parameter_handlers: dict[str, ElectrostaticsHandlerType],
         unique_molecule: Molecule,
+        precomputed_charges: dict[tuple[str, str], Quantity] | None = None,
     ) -> tuple[dict[TopologyKey, PotentialKey], dict[PotentialKey, Potential]]:
         """
         Construct a slot and potential map for a particular reference molecule and set of parameter handlers.
@@ -749,6 +841,7 @@ class SMIRNOFFElectrostaticsCollection(ElectrostaticsCollection, SMIRNOFFCollect
                 ) = cls._find_charge_model_matches(
                     parameter_handler,
                     unique_molecule,
+                    precomputed_charges,
                 )
 
             if slot_matches is None and am1_matches is None:
@@ -801,6 +894,107 @@ class SMIRNOFFElectrostaticsCollection(ElectrostaticsCollection, SMIRNOFFCollect
 
         return matches, potentials
 
+    @classmethod
+    def _find_cached_reference_matches(
+        cls,
+        parameter_handlers: dict[str, ElectrostaticsHandlerType],
+        unique_molecule: Molecule,
+        precomputed_charges: dict[tuple[str, str], Quantity] | None = None,
+    ) -> tuple[dict[TopologyKey, PotentialKey], dict[PotentialKey, Potential]]:
+        """
+        Call `_find_reference_matches`, re-using results from the active parameter cache, if any.
+        """
+        if _ACTIVE_CACHE.get() is None:
+            return cls._find_reference_matches(parameter_handlers, unique_molecule, precomputed_charges)
+
+        def _compute() -> tuple[list[tuple[str, str, str]], list[tuple[str, str]]]:
+            matches, potentials = cls._find_reference_matches(parameter_handlers, unique_molecule, precomputed_charges)
+
+            return (
+                [
+                    (type(topology_key).__name__, topology_key.model_dump_json(), potential_key.model_dump_json())
+                    for topology_key, potential_key in matches.items()
+                ],
+                [
+                    (potential_key.model_dump_json(), potential.model_dump_json())
+                    for potential_key, potential in potentials.items()
+                ],
+            )
+
+        serialized_matches, serialized_potentials = _cached(
+            _electrostatics_cache_name(),
+            unique_molecule,
+            _compute,
+        )
+
+        return (
+            {
+                _CHARGE_TOPOLOGY_KEY_CLASSES[key_class].model_validate_json(
+                    topology_key
+                ): PotentialKey.model_validate_json(
+                    potential_key,
+                )
+                for key_class, topology_key, potential_key in serialized_matches
+            },
+            {
+                PotentialKey.model_validate_json(potential_key): Potential.model_validate_json(potential)
+                for potential_key, potential in serialized_potentials
+            },
+        )
+
+    @classmethod
+    def _precompute_partial_charges(
+        cls,
+        parameter_handlers: dict[str, ElectrostaticsHandlerType],
+        unique_molecules: list[Molecule],
+        executor: Executor,
+    ) -> dict[tuple[str, str], Quantity]:
+        """
+        Concurrently compute partial charges from a charge model for molecules that will need them.
+
+        Molecules fully covered by library charges, or whose assignments are already cached, are skipped.
+        Charges are keyed by mapped SMILES and partial charge method, so the result does not depend on
+        the order in which workers finish.
+        """
+        from openff.toolkit.utils.toolkits import GLOBAL_TOOLKIT_REGISTRY
+
+        # A charge increment model, if present, always fully covers a molecule that library charges do not
+        if "ChargeIncrementModel" in parameter_handlers:
+            partial_charge_method = parameter_handlers["ChargeIncrementModel"].partial_charge_method
+        elif "ToolkitAM1BCC" in parameter_handlers:
+            partial_charge_method = _toolkit_am1bcc_method()
+        else:
+            return dict()
+
+        futures = dict()
+
+        for unique_molecule in unique_molecules:
+            if "LibraryCharges" in parameter_handlers:
+                slot_matches, _ = cls._find_slot_matches(parameter_handlers["LibraryCharges"], unique_molecule)
+
+                if {index for key in slot_matches for index in key.atom_indices} == set(
+                    range(unique_molecule.n_atoms),
+                ):
+                    continue
+
+            if _is_cached(_electrostatics_cache_name(), unique_molecule):
+                continue
+
+            key = (
+                unique_molecule.to_smiles(isomeric=True, explicit_hydrogens=True, mapped=True),
+                partial_charge_method,
+            )
+
+            if key not in futures:
+                futures[key] = executor.submit(
+                    _compute_partial_charges_in_worker,
+                    copy.deepcopy(unique_molecule),
+                    partial_charge_method,
+                    GLOBAL_TOOLKIT_REGISTRY,
+                )
+
+        return {key: Quantity(future.result(), unit.elementary_charge) for key, future in futures.items()}
+
     @classmethod
     def _assign_charges_from_molecules(
         cls,
@@ -854,6 +1048,7 @@ class SMIRNOFFElectrostaticsCollection(ElectrostaticsCollection, SMIRNOFFCollect
         topology: Topology,
         molecules_with_preset_charges=None,
         allow_nonintegral_charges: bool = False,
+        executor: Executor | None = None,
     ) -> None:
         """
         Populate self.key_map with key-val pairs of slots and unique potential identifiers.
@@ -869,116 +1064,120 @@ class SMIRNOFFElectrostaticsCollection(ElectrostaticsCollection, SMIRNOFFCollect
 
         groups = topology.identical_molecule_groups
 
-        for unique_molecule_index, group in groups.items():
-            unique_molecule = topology.molecule(unique_molecule_index)
+        atom_offsets = list(
+            itertools.accumulate(
+                (molecule.n_atoms for molecule in topology.molecules),
+                initial=0,
+            ),
+        )
 
-            flag, matches, potentials = self._assign_charges_from_molecules(
-                unique_molecule,
+        log_assignments = logger.isEnabledFor(logging.INFO)
+
+        preset_assignments = {
+            unique_molecule_index: self._assign_charges_from_molecules(
+                topology.molecule(unique_molecule_index),
                 molecules_with_preset_charges,
             )
+            for unique_molecule_index in groups
+        }
+
+        if executor is None:
+            precomputed_charges = None
+        else:
+            precomputed_charges = self._precompute_partial_charges(
+                parameter_handlers,
+                [
+                    topology.molecule(unique_molecule_index)
+                    for unique_molecule_index, (flag, _, _) in preset_assignments.items()
+                    if not flag
+                ],
+                executor,
+            )
+
+        for unique_molecule_index, group in groups.items():
+            unique_molecule = topology.molecule(unique_molecule_index)
+
+            flag, matches, potentials = preset_assignments[unique_molecule_index]
             # TODO: Here is where the toolkit calls self.check_charges_assigned(). Do we skip this
             #       entirely given that we are not accepting `molecules_with_preset_charges`?
 
             if not flag:
                 # TODO: Rename this method to something like `_find_matches`
-                matches, potentials = self._find_reference_matches(
+                matches, potentials = self._find_cached_reference_matches(
                     parameter_handlers,
                     unique_molecule,
+                    precomputed_charges,
                 )
 
             self.potentials.update(potentials)
 
-            for unique_molecule_atom in unique_molecule.atoms:
-                unique_molecule_atom_index = unique_molecule.atom_index(
-                    unique_molecule_atom,
-                )
+            # Index the keys of the reference molecule by atom once, rather than scanning all
+            # matches for every atom of every duplicate molecule
+            keys_by_atom: dict[int, list] = defaultdict(list)
 
-                for duplicate_molecule_index, atom_map in group:
-                    duplicate_molecule = topology.molecule(duplicate_molecule_index)
-                    duplicate_molecule_atom_index = atom_map[unique_molecule_atom_index]
-                    duplicate_molecule_atom = duplicate_molecule.atom(
-                        duplicate_molecule_atom_index,
-                    )
-                    topology_atom_index = topology.atom_index(duplicate_molecule_atom)
-
-                    # Copy the keys associated with the reference molecule to the duplicate molecule
-                    for key in matches:
-                        if key.this_atom_index == unique_molecule_atom_index:
-                            new_key = key.__class__(**key.model_dump())
-                            new_key.this_atom_index = topology_atom_index
-
-                            # Have this new key (on a duplicate molecule) point to the same potential
-                            # as the old key (on a unique/reference molecule)
-                            if type(new_key) is LibraryChargeTopologyKey:
-                                logger.info(
-                                    "Charge section LibraryCharges applied to topology atom index "
-                                    f"{topology_atom_index}",
-                                )
-
-                            elif type(new_key) is SingleAtomChargeTopologyKey:
-                                if new_key.extras["handler"] == "ToolkitAM1BCCHandler":
-                                    logger.info(
-                                        "Charge section ToolkitAM1BCC, using charge method "
-                                        f"{new_key.extras['partial_charge_method']}, "
-                                        f"applied to topology atom index {topology_atom_index}",
-                                    )
-
-                                elif new_key.extras["handler"] == "preset":
-                                    logger.info(
-                                        f"Preset charges applied to atom index {topology_atom_index}",
-                                    )
-
-                                else:
-                                    raise ValueError(f"Unhandled handler {new_key.extras['handler']}")
-
-                            elif type(new_key) is ChargeModelTopologyKey:
-                                logger.info(
-                                    "Charge section ChargeIncrementModel, using charge method "
-                                    f"{new_key.partial_charge_method}, "
-                                    f"applied to topology atom index {new_key.this_atom_index}",
-                                )
-
-                            elif type(new_key) is ChargeIncrementTopologyKey:
-                                # here is where the actual increments could be logged
-                                pass
-
-                            else:
-                                raise ValueError(f"Unhandled key type {type(new_key)}")
-
-                            self.key_map[new_key] = matches[key]
-
-        topology_charges = [0.0] * topology.n_atoms
+            for key in matches:
+                if type(key) not in _CHARGE_TOPOLOGY_KEY_TYPES:
+                    raise ValueError(f"Unhandled key type {type(key)}")
+
+                keys_by_atom[key.this_atom_index].append(key)
+
+            key_map: dict[TopologyKey | LibraryChargeTopologyKey, PotentialKey] = dict()
+
+            for duplicate_molecule_index, atom_map in group:
+                offset = atom_offsets[duplicate_molecule_index]
+
+                for unique_molecule_atom_index, keys in keys_by_atom.items():
+                    topology_atom_index = offset + atom_map[unique_molecule_atom_index]
+
+                    # Copy the keys associated with the reference molecule to the duplicate molecule;
+                    # these are trusted, internally-generated keys, so skip re-validating them
+                    for key in keys:
+                        new_key = key.model_copy(update={"this_atom_index": topology_atom_index})
+
+                        if log_assignments:
+                            _log_charge_assignment(new_key)
+
+                        # Have this new key (on a duplicate molecule) point to the same potential
+                        # as the old key (on a unique/reference molecule)
+                        key_map[new_key] = matches[key]
+
+            self.key_map.update(key_map)
+
+        topology_charges = numpy.zeros(topology.n_atoms)
 
         for key, val in self.charges.items():
             topology_charges[key.atom_indices[0]] = val.m
 
-        # TODO: Better data structures in Topology.identical_molecule_groups will make this
-        #       cleaner and possibly more performant
-        for molecule in topology.molecules:
-            molecule_charges = [0.0] * molecule.n_atoms
+        if topology.n_atoms == 0:
+            return
 
-            for atom in molecule.atoms:
-                molecule_index = molecule.atom_index(atom)
-                topology_index = topology.atom_index(atom)
+        charge_sums = numpy.add.reduceat(topology_charges, atom_offsets[:-1])
 
-                molecule_charges[molecule_index] = topology_charges[topology_index]
+        # Molecules in the same group share a total formal charge, so only compute it once per group
+        formal_sums = numpy.empty(topology.n_molecules)
 
-            charge_sum = sum(molecule_charges)
-            formal_sum = molecule.total_charge.m
+        for unique_molecule_index, group in groups.items():
+            formal_sum = topology.molecule(unique_molecule_index).total_charge.m
 
-            if abs(charge_sum - formal_sum) > 0.01:
-                if allow_nonintegral_charges:
-                    # TODO: Is it worth communicating this as a warning, or would it simply be bloat?
-                    pass
-                else:
-                    raise NonIntegralMoleculeChargeError(
-                        f"Molecule {molecule.to_smiles(explicit_hydrogens=False)} has "
-                        f"a net charge of {charge_sum} compared to a total formal charge of "
-                        f"{formal_sum}.",
-                    )
+            for duplicate_molecule_index, _ in group:
+                formal_sums[duplicate_molecule_index] = formal_sum
+
+        if not allow_nonintegral_charges:
+            # TODO: Is it worth communicating this as a warning, or would it simply be bloat?
+            nonintegral = numpy.flatnonzero(numpy.abs(charge_sums - formal_sums) > 0.01)
+
+            if len(nonintegral) > 0:
+                molecule_index = int(nonintegral[0])
+
+                raise NonIntegralMoleculeChargeError(
+                    f"Molecule {topology.molecule(molecule_index).to_smiles(explicit_hydrogens=False)} has "
+                    f"a net charge of {float(charge_sums[molecule_index])} compared to a total formal charge of "
+                    f"{float(formal_sums[molecule_index])}.",
+                )
 
+        for molecule_index, molecule in enumerate(topology.molecules):
             molecule.partial_charges = Quantity(
-                molecule_charges,
+                topology_charges[atom_offsets[molecule_index] : atom_offsets[molecule_index + 1]],
                 unit.elementary_charge,
             )
 
@@ -35,6 +35,7 @@ from openff.interchange.models import (
 from openff.interchange.smirnoff._base import (
     SMIRNOFFCollection,
     _check_all_valence_terms_assigned,
+    _find_matches_from_templates,
 )
 from openff.interchange.warnings import ForceFieldModificationWarning
 
@@ -138,7 +139,8 @@ class SMIRNOFFBondCollection(SMIRNOFFCollection, BondCollection):
             # TODO: Should the key_map always be reset, or should we be able to partially
             # update it? Also Note the duplicated code in the child classes
             self.key_map: dict[BondKey, PotentialKey] = dict()
-        matches = parameter_handler.find_matches(topology)
+        matches = _find_matches_from_templates(parameter_handler, topology)
+        key_map: dict[BondKey, PotentialKey] = dict()
         for key, val in matches.items():
             parameter: BondHandler.BondType = val.parameter_type
 
@@ -160,19 +162,21 @@ class SMIRNOFFBondCollection(SMIRNOFFCollection, BondCollection):
                     )
             else:
                 fractional_bond_order = None
-            topology_key = BondKey(
+            topology_key = BondKey.model_construct(
                 atom_indices=key,
                 bond_order=fractional_bond_order,
             )
 
-            potential_key = PotentialKey(
+            potential_key = PotentialKey.model_construct(
                 id=parameter.smirks,
                 associated_handler=parameter_handler.TAGNAME,
                 bond_order=fractional_bond_order,
                 cosmetic_attributes=cosmetic_attributes,
             )
 
-            self.key_map[topology_key] = potential_key
+            key_map[topology_key] = potential_key
+
+        self.key_map.update(key_map)
 
         valence_terms = self.valence_terms(topology)
 
@@ -365,6 +369,9 @@ class SMIRNOFFConstraintCollection(SMIRNOFFCollection):
             bond_handler = None
             bonds = None
 
+        key_map: dict[BondKey, PotentialKey] = dict()
+        potentials: dict[PotentialKey, Potential] = dict()
+
         for key, match in constraint_matches.items():
             topology_key = BondKey(atom_indices=key)
 
@@ -388,7 +395,7 @@ class SMIRNOFFConstraintCollection(SMIRNOFFCollection):
                     cosmetic_attributes=cosmetic_attributes,
                 )
 
-                self.key_map[topology_key] = potential_key
+                key_map[topology_key] = potential_key
 
                 distance = parameter.distance
 
@@ -404,7 +411,7 @@ class SMIRNOFFConstraintCollection(SMIRNOFFCollection):
                 # ... so use the same PotentialKey instance as the BondHandler to look up the distance
                 potential_key = bonds.key_map[topology_key]  # type: ignore[union-attr]
 
-                self.key_map[topology_key] = potential_key
+                key_map[topology_key] = potential_key
 
                 distance = bonds.potentials[potential_key].parameters["length"]  # type: ignore[union-attr]
 
@@ -414,7 +421,10 @@ class SMIRNOFFConstraintCollection(SMIRNOFFCollection):
                 },
             )
 
-            self.potentials[potential_key] = potential
+            potentials[potential_key] = potential
+
+        self.key_map.update(key_map)
+        self.potentials.update(potentials)
 
 
 class SMIRNOFFAngleCollection(SMIRNOFFCollection, AngleCollection):
@@ -495,7 +505,8 @@ class SMIRNOFFProperTorsionCollection(SMIRNOFFCollection, ProperTorsionCollectio
         """
         if self.key_map:
             self.key_map: dict[ProperTorsionKey, PotentialKey] = dict()
-        matches = parameter_handler.find_matches(topology)
+        matches = _find_matches_from_templates(parameter_handler, topology)
+        key_map: dict[ProperTorsionKey, PotentialKey] = dict()
         for key, val in matches.items():
             parameter: ProperTorsionHandler.ProperTorsionType = val.parameter_type
 
@@ -523,13 +534,13 @@ class SMIRNOFFProperTorsionCollection(SMIRNOFFCollection, ProperTorsionCollectio
                 else:
                     fractional_bond_order = None
 
-                topology_key = ProperTorsionKey(
+                topology_key = ProperTorsionKey.model_construct(
                     atom_indices=key,
                     mult=n,
                     bond_order=fractional_bond_order,
                 )
 
-                potential_key = PotentialKey(
+                potential_key = PotentialKey.model_construct(
                     id=smirks,
                     mult=n,
                     associated_handler="ProperTorsions",
@@ -537,7 +548,9 @@ class SMIRNOFFProperTorsionCollection(SMIRNOFFCollection, ProperTorsionCollectio
                     cosmetic_attributes=cosmetic_attributes,
                 )
 
-                self.key_map[topology_key] = potential_key
+                key_map[topology_key] = potential_key
+
+        self.key_map.update(key_map)
 
         _check_all_valence_terms_assigned(
             handler=parameter_handler,
@@ -656,7 +669,8 @@ class SMIRNOFFImproperTorsionCollection(SMIRNOFFCollection, ImproperTorsionColle
         """
         if self.key_map:
             self.key_map = dict()
-        matches = parameter_handler.find_matches(topology)
+        matches = _find_matches_from_templates(parameter_handler, topology)
+        key_map: dict[ImproperTorsionKey, PotentialKey] = dict()
         for key, val in matches.items():
             parameter_handler._assert_correct_connectivity(
                 val,
@@ -692,18 +706,20 @@ class SMIRNOFFImproperTorsionCollection(SMIRNOFFCollection, ImproperTorsionColle
                     )
                     for (i, j, k) in [(0, 1, 2), (1, 2, 0), (2, 0, 1)]
                 ]:
-                    topology_key = ImproperTorsionKey(
+                    topology_key = ImproperTorsionKey.model_construct(
                         atom_indices=(key[1], *permuted_key),
                         mult=n,
                     )
-                    potential_key = PotentialKey(
+                    potential_key = PotentialKey.model_construct(
                         id=smirks,
                         mult=n,
                         associated_handler="ImproperTorsions",
                         cosmetic_attributes=cosmetic_attributes,
                     )
 
-                    self.key_map[topology_key] = potential_key
+                    key_map[topology_key] = potential_key
+
+        self.key_map.update(key_map)
 
     def store_potentials(self, parameter_handler: ImproperTorsionHandler) -> None:
         """
@@ -1,6 +1,6 @@
 import logging
 import math
-from typing import Literal
+from typing import Literal, NamedTuple
 
 import numpy
 from openff.toolkit import Quantity, Topology, unit
@@ -8,11 +8,11 @@ from openff.toolkit.typing.engines.smirnoff.parameters import (
     ParameterHandler,
     VirtualSiteHandler,
 )
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from openff.interchange._annotations import _DegreeQuantity, _Quantity
 from openff.interchange.components._particles import _VirtualSite
-from openff.interchange.components.potentials import Potential
+from openff.interchange.components.potentials import Potential, _Cache
 from openff.interchange.components.toolkit import (
     _lookup_virtual_site_parameter,
     _validated_list_to_array,
@@ -29,6 +29,22 @@ logger = logging.getLogger(__name__)
 _DEGREES_TO_RADIANS = numpy.pi / 180.0
 
 
+class _LocalFrameGroup(NamedTuple):
+    """Arrays describing how to place all virtual sites of one type, in the order of the collection's key map."""
+
+    # index of each virtual site among all virtual sites in the collection, shape (n_sites,)
+    site_indices: numpy.ndarray
+
+    # topology indices of the orientation atoms of each virtual site, shape (n_sites, n_orientation_atoms)
+    orientation_indices: numpy.ndarray
+
+    # weights of the orientation atoms defining the origin and x- and y-directions, shape (3, n_orientation_atoms)
+    weights: numpy.ndarray
+
+    # displacement (nm) of each virtual site along the x-, y-, and z-axes of its local frame, shape (n_sites, 3)
+    displacements: numpy.ndarray
+
+
 # The use of `type` as a field name conflicts with the built-in `type()` when used with PEP 585
 _ListOfHandlerTypes = list[type[ParameterHandler]]
 
@@ -60,6 +76,9 @@ class SMIRNOFFVirtualSiteCollection(SMIRNOFFCollection):
         "all",
     ] = "parents"
 
+    # The local frame groups of this collection and the revision they were built from
+    _local_frame_groups: _Cache = PrivateAttr(default_factory=_Cache)
+
     @classmethod
     def allowed_parameter_handlers(cls) -> _ListOfHandlerTypes:
         """Return a list of allowed types of ParameterHandler classes."""
@@ -88,6 +107,21 @@ class SMIRNOFFVirtualSiteCollection(SMIRNOFFCollection):
         """Return a list of parameter attributes handling vdW interactions."""
         return ["sigma", "epsilon"]
 
+    def _get_local_frame_groups(self) -> list[_LocalFrameGroup]:
+        """
+        Get the arrays needed to place all virtual sites, grouped by type.
+
+        These are cached and only re-built if the revision of this collection changed since, i.e. if any of its
+        fields were assigned or its key map or any virtual site parameters were changed in-place.
+        """
+        cache = self._local_frame_groups
+
+        if cache.value is None or cache.state != self._revision.value:
+            cache.value = _build_local_frame_groups(self)
+            cache.state = self._revision.value
+
+        return cache.value
+
     def store_matches(
         self,
         parameter_handler: ParameterHandler,
@@ -377,85 +411,117 @@ def _create_virtual_site_object(
         raise NotImplementedError(virtual_site_key.type)
 
 
-def _build_local_coordinate_frames(
-    interchange,
+def _build_local_frame_groups(
     virtual_site_collection: SMIRNOFFVirtualSiteCollection,
-) -> numpy.ndarray:
-    """
-    Build local coordinate frames.
+) -> list[_LocalFrameGroup]:
+    """Build, for each type of virtual site, the arrays needed to place all virtual sites of that type."""
+    # virtual site type -> (site indices, orientation atom indices, potential keys)
+    grouped: dict[str, tuple[list[int], list[tuple[int, ...]], list[PotentialKey]]] = dict()
 
-    Adapted from an implementation in OpenFF Recharge (see `LICENSE-3RD-PARTY`).
+    # potential key -> (local frame weights, displacements along each local axis)
+    per_potential: dict[PotentialKey, tuple[tuple[list[float], ...], numpy.ndarray]] = dict()
 
-    See Also
-    --------
-    https://github.com/openforcefield/openff-recharge/blob/0.5.0/openff/recharge/charges/vsite.py#L584
+    for site_index, (virtual_site_key, potential_key) in enumerate(virtual_site_collection.key_map.items()):
+        site_indices, orientation_indices, potential_keys = grouped.setdefault(virtual_site_key.type, ([], [], []))
 
-    """
-    stacked_frames: list[list] = [[], [], [], []]
+        site_indices.append(site_index)
+        orientation_indices.append(virtual_site_key.orientation_atom_indices)
+        potential_keys.append(potential_key)
 
-    for virtual_site_key, potential_key in virtual_site_collection.key_map.items():
-        virtual_site = _create_virtual_site_object(
-            virtual_site_key=virtual_site_key,
-            virtual_site_potential=virtual_site_collection.potentials[potential_key],
+        if potential_key not in per_potential:
+            virtual_site = _create_virtual_site_object(
+                virtual_site_key,
+                virtual_site_collection.potentials[potential_key],
+            )
+
+            per_potential[potential_key] = (
+                virtual_site.local_frame_weights,
+                _convert_local_coordinates(virtual_site.local_frame_coordinates.m.reshape(1, 3))[0],
+            )
+
+    return [
+        _LocalFrameGroup(
+            site_indices=numpy.asarray(site_indices, dtype=numpy.int64),
+            orientation_indices=numpy.asarray(orientation_indices, dtype=numpy.int64),
+            weights=numpy.asarray(per_potential[potential_keys[0]][0]),
+            displacements=numpy.stack([per_potential[potential_key][1] for potential_key in potential_keys]),
         )
+        for site_indices, orientation_indices, potential_keys in grouped.values()
+    ]
 
-        # positions of all "orientation" atoms, not just the single "parent"
-        orientation_coordinates = interchange.positions[
-            virtual_site_key.orientation_atom_indices,
-            :,
-        ].m_as(unit.nanometer)
 
-        local_frame_weights = virtual_site.local_frame_weights
+def _build_local_coordinate_frames(
+    positions: numpy.ndarray,
+    group: _LocalFrameGroup,
+) -> numpy.ndarray:
+    """
+    Build the local coordinate frames of a group of virtual sites, from positions (nm) of shape (..., n_atoms, 3).
 
-        weighted_coordinates = local_frame_weights @ orientation_coordinates
+    The returned array is of shape (4, ..., n_sites, 3) and contains the origin and x-, y-, and z-axes of each frame.
+
+    Adapted from an implementation in OpenFF Recharge (see `LICENSE-3RD-PARTY`).
 
-        origin = weighted_coordinates[0, :]
+    See Also
+    --------
+    https://github.com/openforcefield/openff-recharge/blob/0.5.0/openff/recharge/charges/vsite.py#L584
 
-        xy_plane = weighted_coordinates[1:, :]
+    """
+    # positions of all "orientation" atoms, not just the single "parent"
+    orientation_coordinates = positions[..., group.orientation_indices, :]
 
-        xy_plane_norm = xy_plane / numpy.sqrt(
-            (xy_plane * xy_plane).sum(-1),
-        ).reshape(-1, 1)
+    weighted_coordinates = numpy.einsum("wk,...nkd->w...nd", group.weights, orientation_coordinates)
 
-        x_hat = xy_plane_norm[0, :]
-        z_hat = numpy.cross(x_hat, xy_plane[1, :])
-        y_hat = numpy.cross(z_hat, x_hat)
+    origin = weighted_coordinates[0]
 
-        stacked_frames[0].append(origin.reshape(1, -1))
-        stacked_frames[1].append(x_hat.reshape(1, -1))
-        stacked_frames[2].append(y_hat.reshape(1, -1))
-        stacked_frames[3].append(z_hat.reshape(1, -1))
+    x_direction, y_direction = weighted_coordinates[1], weighted_coordinates[2]
 
-    local_frames = numpy.stack([numpy.vstack(frames) for frames in stacked_frames])
+    x_hat = x_direction / numpy.linalg.norm(x_direction, axis=-1, keepdims=True)
+    z_hat = numpy.cross(x_hat, y_direction)
+    y_hat = numpy.cross(z_hat, x_hat)
 
-    return Quantity(local_frames, unit.nanometer)
+    return numpy.stack([origin, x_hat, y_hat, z_hat])
 
 
 def _convert_local_coordinates(
     local_frame_coordinates: numpy.ndarray,
-    local_coordinate_frames: numpy.ndarray,
 ) -> numpy.ndarray:
+    """Convert local coordinates (d, theta, phi), shape (n_sites, 3), to displacements along each local axis."""
     d = local_frame_coordinates[:, 0].reshape(-1, 1)
 
     theta = (local_frame_coordinates[:, 1] * _DEGREES_TO_RADIANS).reshape(-1, 1)
     phi = (local_frame_coordinates[:, 2] * _DEGREES_TO_RADIANS).reshape(-1, 1)
 
-    cos_theta = numpy.cos(theta)
-    sin_theta = numpy.sin(theta)
-
-    cos_phi = numpy.cos(phi)
-    sin_phi = numpy.sin(phi)
-
     # Here we use cos(phi) in place of sin(phi) and sin(phi) in place of cos(phi)
     # this is because we want phi=0 to represent a 0 degree angle from the x-y plane
     # rather than 0 degrees from the z-axis.
-    vsite_positions = local_coordinate_frames[0] + d * (
-        cos_theta * cos_phi * local_coordinate_frames[1]
-        + sin_theta * cos_phi * local_coordinate_frames[2]
-        + sin_phi * local_coordinate_frames[3]
+    return d * numpy.hstack(
+        [
+            numpy.cos(theta) * numpy.cos(phi),
+            numpy.sin(theta) * numpy.cos(phi),
+            numpy.sin(phi),
+        ],
     )
 
-    return vsite_positions
+
+def _place_virtual_sites(
+    positions: numpy.ndarray,
+    groups: list[_LocalFrameGroup],
+    n_virtual_sites: int,
+) -> numpy.ndarray:
+    """Place virtual sites given atomic positions (nm) of shape (..., n_atoms, 3), returning (..., n_sites, 3)."""
+    virtual_site_positions = numpy.empty((*positions.shape[:-2], n_virtual_sites, 3))
+
+    for group in groups:
+        origin, x_hat, y_hat, z_hat = _build_local_coordinate_frames(positions, group)
+
+        virtual_site_positions[..., group.site_indices, :] = (
+            origin
+            + group.displacements[:, 0:1] * x_hat
+            + group.displacements[:, 1:2] * y_hat
+            + group.displacements[:, 2:3] * z_hat
+        )
+
+    return virtual_site_positions
 
 
 def _generate_positions(
@@ -463,29 +529,13 @@ def _generate_positions(
     virtual_site_collection: SMIRNOFFVirtualSiteCollection,
     conformer: _Quantity | None = None,
 ) -> Quantity:
-    # TODO: Capture these objects instead of generating them on-the-fly so many times
-
-    local_frame_coordinates = numpy.vstack(
-        [
-            _create_virtual_site_object(
-                virtual_site_key,
-                virtual_site_collection.potentials[potential_key],
-            ).local_frame_coordinates
-            for virtual_site_key, potential_key in virtual_site_collection.key_map.items()
-        ],
-    )
-
-    local_coordinate_frames = _build_local_coordinate_frames(
-        interchange,
-        virtual_site_collection,
-    )
-
-    virtual_site_positions = _convert_local_coordinates(
-        local_frame_coordinates,
-        local_coordinate_frames,
-    )
+    positions = interchange.positions if conformer is None else conformer
 
     return Quantity(
-        virtual_site_positions,
+        _place_virtual_sites(
+            positions.m_as(unit.nanometer),
+            virtual_site_collection._get_local_frame_groups(),
+            len(virtual_site_collection.key_map),
+        ),
         unit.nanometer,
     )